@@ -0,0 +1,6 @@
+"""Performance benchmarks for pyinsteon.
+
+Each module can be run directly, for example:
+
+    python -m benchmarks.bench_inbound_decoder
+"""
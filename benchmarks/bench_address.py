@@ -0,0 +1,87 @@
+"""Micro-benchmarks of Address construction, hashing and dict lookup.
+
+Compares the interned Address with the previous implementation that
+normalized the address on every construction and hashed the display string.
+"""
+import asyncio
+import binascii
+from random import Random
+
+from pyinsteon.address import Address
+
+from benchmarks.utils import print_result, timeit
+
+DEVICES = 200
+LOOKUPS = 100000
+
+
+class PreviousAddress:
+    """Address class that normalizes and formats on every use."""
+
+    def __init__(self, addr):
+        """Create an Address object."""
+        if isinstance(addr, PreviousAddress):
+            self._addr = bytes(addr)
+        elif isinstance(addr, (bytes, bytearray)):
+            self._addr = bytes(addr)
+        else:
+            self._addr = binascii.unhexlify(addr.replace(".", "").lower())
+
+    def __repr__(self):
+        """Representation of the Address object."""
+        return self._addr.hex()
+
+    def __str__(self):
+        """Emit the address in human-readible format (AA.BB.CC)."""
+        return f"{self.__repr__()[0:2]}.{self.__repr__()[2:4]}.{self.__repr__()[4:6]}".upper()
+
+    def __bytes__(self):
+        """Return the bytes representation of the address."""
+        return self._addr
+
+    def __eq__(self, other):
+        """Test for equality."""
+        if isinstance(other, PreviousAddress):
+            return bytes(self) == bytes(other)
+        return False
+
+    def __hash__(self):
+        """Create a hash code for the Address object."""
+        return hash(str(self))
+
+
+def run(name: str, address_class):
+    """Run the benchmarks for an Address class and return the times."""
+    rand = Random(1)
+    ids = [bytes(rand.randint(0, 255) for _ in range(3)).hex() for _ in range(DEVICES)]
+    addresses = [address_class(addr_id) for addr_id in ids]
+    devices = {address: index for index, address in enumerate(addresses)}
+    keys = [ids[rand.randrange(DEVICES)] for _ in range(LOOKUPS)]
+    address_keys = [address_class(key) for key in keys]
+
+    results = {
+        "construct from str": timeit(lambda: [address_class(key) for key in keys]),
+        "construct from Address": timeit(
+            lambda: [address_class(key) for key in address_keys]
+        ),
+        "hash": timeit(lambda: [hash(key) for key in address_keys]),
+        "dict lookup": timeit(lambda: [devices[key] for key in address_keys]),
+        "dict lookup from str": timeit(
+            lambda: [devices[address_class(key)] for key in keys]
+        ),
+    }
+    return {f"{name}: {test}": seconds / LOOKUPS for test, seconds in results.items()}
+
+
+async def async_main():
+    """Run the benchmark."""
+    print(f"{DEVICES} addresses, {LOOKUPS} operations, time per 1,000 operations")
+    old = run("previous", PreviousAddress)
+    new = run("interned", Address)
+    for (old_name, old_time), (new_name, new_time) in zip(old.items(), new.items()):
+        print_result(old_name, old_time * 1000)
+        print_result(new_name, new_time * 1000, old_time * 1000)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,84 @@
+"""Benchmark ALDB.find on a modem ALDB with 1,000 records.
+
+Compares a scan of all records with the target, group and in use indexes.
+"""
+import asyncio
+from random import Random
+
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.aldb.modem_aldb import ModemALDB
+from pyinsteon.constants import ALDBStatus
+
+from benchmarks.utils import print_result, random_address, timeit
+
+RECORDS = 1000
+DEVICES = 250
+FIRST_MEM_ADDR = 0x3FFF
+
+
+def build_aldb(seed: int = 1):
+    """Return a modem ALDB and the addresses of the linked devices."""
+    rand = Random(seed)
+    addresses = [random_address(rand) for _ in range(DEVICES)]
+    aldb = ModemALDB(random_address(rand))
+    records = {}
+    for index in range(RECORDS):
+        mem_addr = FIRST_MEM_ADDR - index * 8
+        records[mem_addr] = ALDBRecord(
+            memory=mem_addr,
+            controller=rand.random() < 0.5,
+            group=rand.randint(0, 40),
+            target=rand.choice(addresses),
+            data1=255,
+            data2=28,
+            data3=1,
+        )
+    aldb.load_saved_records(ALDBStatus.LOADED, records)
+    return aldb, addresses
+
+
+def scan_find(aldb, **kwargs):
+    """Return the records found with a scan of all records."""
+    in_use = kwargs.get("in_use")
+    test_rec = ALDBRecord(
+        memory=None,
+        controller=kwargs.get("is_controller"),
+        group=kwargs.get("group"),
+        target=kwargs.get("target"),
+        data1=None,
+        data2=None,
+        data3=None,
+    )
+    return [
+        rec
+        for _, rec in aldb.items()
+        if rec == test_rec and (in_use is None or rec.is_in_use == in_use)
+    ]
+
+
+async def async_main():
+    """Run the benchmark."""
+    aldb, addresses = build_aldb()
+    searches = {
+        "target": [{"target": address} for address in addresses],
+        "group and mode": [
+            {"group": group, "is_controller": True} for group in range(41)
+        ],
+        "target, group and mode": [
+            {"target": address, "group": 1, "is_controller": False, "in_use": True}
+            for address in addresses
+        ],
+    }
+    print(f"Modem ALDB with {RECORDS} records")
+    for name, criteria in searches.items():
+        old = timeit(lambda: [scan_find(aldb, **kwargs) for kwargs in criteria])
+        new = timeit(lambda: [list(aldb.find(**kwargs)) for kwargs in criteria])
+        old, new = old / len(criteria), new / len(criteria)
+        print_result(f"find by {name}: scan", old)
+        print_result(f"find by {name}: index", new, old)
+        for kwargs in criteria:
+            assert scan_find(aldb, **kwargs) == list(aldb.find(**kwargs))
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
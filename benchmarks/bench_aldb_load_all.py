@@ -0,0 +1,123 @@
+"""Benchmark loading the ALDB of many devices one at a time and concurrently.
+
+A simulated modem ACKs each message after ACK_DELAY. Each device sends the
+direct ACK of a read request after RESPONSE_DELAY and then one record every
+RECORD_DELAY. Device messages share the powerline so only one is received
+every MESSAGE_TIME.
+"""
+import asyncio
+from time import monotonic
+
+from pyinsteon import devices
+from pyinsteon.address import Address
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_id_manager import DeviceId
+from pyinsteon.managers.utils import create_device
+from pyinsteon.protocol.protocol import Protocol
+
+DEVICES = 8
+RECORDS = 6
+FIRST_MEM_ADDR = 0x0FFF
+WRITE_WAIT = 0.8
+ACK_DELAY = 0.02
+RESPONSE_DELAY = 0.3
+RECORD_DELAY = 0.3
+MESSAGE_TIME = 0.05
+MODEM = bytes.fromhex("111111")
+
+
+def _record_message(address: bytes, mem_addr: int, hwm: bool):
+    """Return an ALDB record message from a device."""
+    flags = 0x00 if hwm else 0xA2
+    user_data = bytes(
+        [0x00, 0x01, mem_addr >> 8, mem_addr & 0xFF, 0x00, flags, 0x01]
+        + list(MODEM)
+        + [0xFF, 0x1C, 0x01, 0x00]
+    )
+    return b"\x02\x51" + address + MODEM + b"\x11\x2f\x00" + user_data
+
+
+class SimulatedTransport(asyncio.Transport):
+    """Transport that ACKs messages and sends device ALDB records."""
+
+    write_wait = WRITE_WAIT
+
+    def __init__(self, protocol):
+        """Init the SimulatedTransport class."""
+        super().__init__()
+        self._protocol = protocol
+        self._powerline_free = 0
+
+    def is_closing(self):
+        """Return False always."""
+        return False
+
+    async def async_write(self, data):
+        """Write a message and schedule the ACK and the device responses."""
+        data = bytes(data)
+        loop = asyncio.get_running_loop()
+        loop.call_later(ACK_DELAY, self._protocol.data_received, data + b"\x06")
+        if data[1] != 0x62 or data[6] != 0x2F or len(data) < 22 or data[9] != 0:
+            return
+        address = data[2:5]
+        mem_addr = data[10] << 8 | data[11]
+        num_recs = data[12]
+        self._receive(RESPONSE_DELAY, b"\x02\x50" + address + MODEM + b"\x2b\x2f\x00")
+        if num_recs == 1:
+            mem_addrs = [FIRST_MEM_ADDR if mem_addr == 0 else mem_addr]
+        else:
+            mem_addrs = [FIRST_MEM_ADDR - 8 * index for index in range(RECORDS + 1)]
+        for index, record_addr in enumerate(mem_addrs):
+            hwm = record_addr == FIRST_MEM_ADDR - 8 * RECORDS
+            self._receive(
+                RESPONSE_DELAY + (index + 1) * RECORD_DELAY,
+                _record_message(address, record_addr, hwm),
+            )
+
+    def _receive(self, delay, data):
+        """Receive a device message when the powerline is free."""
+        loop = asyncio.get_running_loop()
+        at_time = max(loop.time() + delay, self._powerline_free)
+        self._powerline_free = at_time + MESSAGE_TIME
+        loop.call_at(at_time, self._protocol.data_received, data)
+
+
+async def run_load_all(max_concurrent: int):
+    """Load the ALDB of each device and return the seconds taken."""
+    protocol = Protocol(connect_method=None)
+    transport = SimulatedTransport(protocol)
+    protocol.connection_made(transport)
+    protocol.resume_writing()
+
+    addresses = []
+    # pylint: disable=protected-access
+    async with devices._loading_saved_lock:
+        for index in range(DEVICES):
+            address = Address(f"2c{max_concurrent:02x}{index + 1:02x}")
+            device_id = DeviceId(address, 0x01, 0x20, 0x45)
+            devices[device_id.address] = create_device(device_id)
+            addresses.append(device_id.address)
+
+    start = monotonic()
+    async for address, status in devices.async_load_all(
+        addresses=addresses, max_concurrent=max_concurrent
+    ):
+        print(f"    {monotonic() - start:6.1f} s  {address}  {str(status)}")
+    elapsed = monotonic() - start
+    protocol.pause_writing()
+    await asyncio.sleep(0.2)
+    return elapsed, devices.aldb_load_progress
+
+
+async def async_main():
+    """Run the benchmark."""
+    devices.modem = Hub("111111", 0x03, 51, 165, "Benchmark modem")
+    print(f"Load the ALDB of {DEVICES} devices with {RECORDS} records each")
+    for max_concurrent in (1, 4):
+        print(f"max_concurrent={max_concurrent}")
+        elapsed, progress = await run_load_all(max_concurrent)
+        print(f"{'':4s}{elapsed:6.1f} s total  {progress}")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,98 @@
+"""Benchmark dispatching messages to a coroutine listener.
+
+Compares the queued dispatch of the async listeners with the previous
+version that created a task for every message published.
+"""
+import asyncio
+from functools import wraps
+import time
+
+from pyinsteon import pub
+from pyinsteon.utils import async_listener_stats, publish_topic, subscribe_topic
+
+from benchmarks.utils import print_result
+
+DEVICE_COUNTS = (1, 10, 100)
+MESSAGES = 10000
+REPEAT = 5
+
+
+def previous_async_listener(listener):
+    """Return a listener that creates a task for each message."""
+
+    @wraps(listener)
+    def _wrapper(*args, **kwargs):
+        return asyncio.create_task(listener(*args, **kwargs))
+
+    return _wrapper
+
+
+class Listener:
+    """Async topic listener."""
+
+    def __init__(self):
+        """Init the Listener class."""
+        self.calls = 0
+        self.done = asyncio.Event()
+
+    async def async_on_status(self, address, status):
+        """Count the messages received."""
+        await asyncio.sleep(0)
+        self.calls += 1
+        if self.calls == MESSAGES:
+            self.done.set()
+
+
+async def async_time_dispatch(subscribe, topic, addresses):
+    """Return the best time in seconds to publish and handle all messages."""
+    best = None
+    for repeat in range(REPEAT):
+        listener = Listener()
+        subscribe(listener, f"{topic}_{repeat}")
+        start = time.perf_counter()
+        for index in range(MESSAGES):
+            publish_topic(
+                f"{topic}_{repeat}",
+                address=addresses[index % len(addresses)],
+                status=index,
+            )
+        await listener.done.wait()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def subscribe_previous(listener, topic):
+    """Subscribe a listener that creates a task for each message."""
+    listener.wrapper = previous_async_listener(listener.async_on_status)
+    pub.subscribe(listener.wrapper, topic)
+
+
+def subscribe_queued(listener, topic):
+    """Subscribe a listener with the queued dispatch."""
+    subscribe_topic(listener.async_on_status, topic)
+
+
+async def async_main():
+    """Run the benchmark."""
+    print(f"Publish and handle {MESSAGES} messages, time per 1,000 messages")
+    for count in DEVICE_COUNTS:
+        topic = f"bench_async_dispatch.devices_{count}"
+        addresses = [f"{index:06x}" for index in range(1, count + 1)]
+        old = await async_time_dispatch(subscribe_previous, topic, addresses)
+        new = await async_time_dispatch(subscribe_queued, topic, addresses)
+        print_result(f"{count} devices: task per message", old / MESSAGES * 1000)
+        print_result(
+            f"{count} devices: queued", new / MESSAGES * 1000, old / MESSAGES * 1000
+        )
+
+    stats = async_listener_stats()["Listener.async_on_status"]
+    print(f"Max queue depth: {stats['max_queued']}")
+    print(
+        "Average latency: "
+        f"{stats['total_latency'] / stats['processed'] * 1000:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,46 @@
+"""Benchmark creating 200 devices from the product database.
+
+Compares finding the handler methods of each handler class once with the
+previous version that searched the attributes of every handler instance.
+"""
+import asyncio
+from unittest.mock import patch
+
+from pyinsteon.handlers.inbound_base import InboundHandlerBase
+
+from benchmarks.utils import create_devices, print_result, timeit
+
+DEVICES = 200
+
+
+def previous_subscribe_handlers(self, topic, address, group, message_type):
+    """Subscribe the handler methods found in the instance attributes."""
+    for attr_str in dir(self):
+        attr = getattr(self, attr_str)
+        if hasattr(attr, "register_handler"):
+            attr.register_handler(
+                func=attr,
+                topic=topic,
+                address=address,
+                group=group,
+                message_type=message_type,
+            )
+        if hasattr(attr, "register_status"):
+            # pylint: disable=protected-access
+            attr.register_status(attr, self._address.id)
+
+
+async def async_main():
+    """Run the benchmark."""
+    print(f"Create {DEVICES} devices")
+    with patch.object(
+        InboundHandlerBase, "_subscribe_handlers", previous_subscribe_handlers
+    ):
+        old = timeit(lambda: create_devices(DEVICES), repeat=3)
+    new = timeit(lambda: create_devices(DEVICES), repeat=3)
+    print_result("search every handler instance", old)
+    print_result("handler methods found per class", new, old)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
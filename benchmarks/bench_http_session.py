@@ -0,0 +1,94 @@
+"""Benchmark Hub buffer polling with per-request and persistent sessions.
+
+A local aiohttp server stands in for the Hub and serves buffstatus.xml. The
+per-request case opens a new client session for every poll, as the reader
+did before the session was shared, with and without the pause it used to
+take before each request.
+"""
+import asyncio
+import time
+
+from aiohttp import BasicAuth, ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from pyinsteon.protocol.http_reader_writer import SESSION_TIMEOUT, HttpReaderWriter
+
+from benchmarks.utils import print_result
+
+POLLS = 200
+PRIOR_CONN_CLOSE_PAUSE = 0.1
+BUFFER = "0250010203040506072b00" + "0" * 178 + "16"
+
+
+def create_app(connections):
+    """Create a web application that serves the Hub buffer."""
+
+    async def buffstatus(request):
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.Response(text=f"<response><BS>{BUFFER}</BS></response>")
+
+    app = web.Application()
+    app.router.add_get("/buffstatus.xml", buffstatus)
+    return app
+
+
+async def poll_per_request(url, auth, pause, polls):
+    """Poll the buffer with a new session for each request."""
+    for _ in range(polls):
+        await asyncio.sleep(pause)
+        async with ClientSession(auth=auth, timeout=SESSION_TIMEOUT) as session:
+            async with session.get(url) as response:
+                await response.text()
+
+
+async def poll_persistent(url, auth, polls):
+    """Poll the buffer with the persistent reader session."""
+    reader = HttpReaderWriter(auth)
+    try:
+        for _ in range(polls):
+            await reader.async_read(url)
+    finally:
+        await reader.async_close()
+    return reader.stats
+
+
+async def run():
+    """Run the benchmark."""
+    connections = set()
+    server = TestServer(create_app(connections))
+    await server.start_server()
+    url = str(server.make_url("/buffstatus.xml"))
+    auth = BasicAuth("username", "password")
+    try:
+        results = []
+        for name, coro, polls in (
+            (
+                "per-request session + pause",
+                lambda n: poll_per_request(url, auth, PRIOR_CONN_CLOSE_PAUSE, n),
+                POLLS // 10,
+            ),
+            ("per-request session", lambda n: poll_per_request(url, auth, 0, n), POLLS),
+            ("persistent session", lambda n: poll_persistent(url, auth, n), POLLS),
+        ):
+            connections.clear()
+            start = time.perf_counter()
+            stats = await coro(polls)
+            elapsed = (time.perf_counter() - start) / polls
+            results.append((name, elapsed, len(connections) / polls, stats))
+
+        baseline = results[1][1]
+        print(f"Hub buffer poll, {POLLS} polls (time per poll)")
+        for name, elapsed, conns, stats in results:
+            print_result(name, elapsed, baseline)
+            print(f"    connections per poll: {conns:.3f}")
+            if stats:
+                print(
+                    f"    requests={stats['requests']} reconnects={stats['reconnects']}"
+                    f" average latency={stats['average_latency'] * 1000:.3f} ms"
+                )
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
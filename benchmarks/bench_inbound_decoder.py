@@ -0,0 +1,94 @@
+"""Benchmark the inbound message parsers.
+
+Replays a multi-kilobyte capture of modem traffic through `create` as used by
+the original `Protocol.data_received` loop and through `InboundDecoder`.
+"""
+from random import Random
+
+from pyinsteon.protocol.messages.inbound import InboundDecoder, create
+
+from benchmarks.utils import print_result, random_address, timeit
+
+READ_SIZE = 4096
+
+
+def build_capture(size: int = 16384, seed: int = 1) -> bytes:
+    """Build a representative capture of the data from a Hub poll backlog."""
+    rand = Random(seed)
+    addresses = [bytes(random_address(rand)) for _ in range(20)]
+    modem = bytes.fromhex("1a2b3c")
+    data = bytearray()
+    while len(data) < size:
+        address = rand.choice(addresses)
+        kind = rand.randint(0, 9)
+        if kind < 4:
+            # Status response or ACK from a device
+            data += b"\x02\x50" + address + modem + bytes([0x2B, 0x00, 0xFF])
+        elif kind < 6:
+            # All-Link broadcast and cleanup
+            data += b"\x02\x50" + address + bytes([0, 0, 1, 0xCB, 0x11, 0])
+            data += b"\x02\x50" + address + modem + bytes([0x41, 0x11, 1])
+        elif kind < 7:
+            # Extended message received
+            data += b"\x02\x51" + address + modem + bytes([0x1B, 0x2F, 0])
+            data += bytes(rand.randint(0, 255) for _ in range(14))
+        elif kind < 8:
+            # Echo of a direct command sent to a device
+            data += b"\x02\x62" + address + bytes([0x0F, 0x19, 0x00, 0x06])
+        elif kind < 9:
+            # Modem ALDB record
+            data += b"\x02\x57" + bytes([0xE2, 1]) + address + bytes([1, 0x20, 0x41])
+        else:
+            # Line noise
+            data += bytes([rand.randint(0x80, 0xFF)])
+    return bytes(data)
+
+
+def parse_with_create(capture: bytes, read_size: int = READ_SIZE) -> int:
+    """Parse the capture the way Protocol.data_received did before."""
+    count = 0
+    buffer = bytearray()
+    for index in range(0, len(capture), read_size):
+        buffer.extend(capture[index : index + read_size])
+        while True:
+            last_buffer = buffer
+            try:
+                msg, buffer = create(buffer)
+                if isinstance(buffer, bytes):
+                    buffer = bytearray(buffer)
+            except (ValueError, IndexError):
+                buffer = buffer[1:]
+                msg = None
+            if msg:
+                count += 1
+            if not buffer or last_buffer == buffer:
+                break
+    return count
+
+
+def parse_with_decoder(capture: bytes, read_size: int = READ_SIZE) -> int:
+    """Parse the capture with the streaming decoder."""
+    count = 0
+    decoder = InboundDecoder()
+    for index in range(0, len(capture), read_size):
+        for _ in decoder.decode(capture[index : index + read_size]):
+            count += 1
+    return count
+
+
+def main():
+    """Run the benchmark."""
+    for size in (2048, 8192, 32768):
+        capture = build_capture(size)
+        old_count = parse_with_create(capture)
+        new_count = parse_with_decoder(capture)
+        print(f"Capture: {len(capture)} bytes, messages: {old_count} / {new_count}")
+        for read_size in (64, READ_SIZE, len(capture)):
+            old = timeit(lambda c=capture, r=read_size: parse_with_create(c, r), 3)
+            new = timeit(lambda c=capture, r=read_size: parse_with_decoder(c, r), 3)
+            print_result(f"create loop ({read_size} byte reads)", old)
+            print_result(f"InboundDecoder ({read_size} byte reads)", new, old)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark decoding the fields of inbound messages.
+
+Compares slicing each field and creating every field object eagerly with the
+precompiled struct decoder of the message definition, with and without
+accessing the lazily created fields.
+"""
+from random import Random
+
+from pyinsteon.constants import MessageId
+from pyinsteon.protocol.messages import MessageBase
+from pyinsteon.protocol.messages.inbound import Inbound
+from pyinsteon.protocol.messages.message_definitions import INBOUND_MSG_DEF
+
+from benchmarks.utils import print_result, random_address, timeit
+
+MESSAGES = 5000
+
+
+def build_frames(msg_id: MessageId, count: int = MESSAGES, seed: int = 1):
+    """Build received message frames."""
+    rand = Random(seed)
+    frames = []
+    for _ in range(count):
+        frame = bytes([0x02, msg_id]) + bytes(random_address(rand))
+        frame += bytes.fromhex("1a2b3c") + bytes([0x2B, 0x11, 0xFF])
+        if msg_id == MessageId.EXTENDED_RECEIVED:
+            frame += bytes(rand.randint(0, 255) for _ in range(14))
+        frames.append(frame)
+    return frames
+
+
+class SlicedInbound(MessageBase):
+    """Inbound message that slices the fields and creates every field object."""
+
+    def __init__(self, msg_def, raw_data):
+        """Init the SlicedInbound class."""
+        curr_slice = 2
+        field_vals = {}
+        for field in msg_def.fields:
+            field_vals[field.name] = field.type(raw_data[msg_def.slices[curr_slice]])
+            curr_slice += 1
+        super().__init__(msg_def, **field_vals)
+
+
+def decode_sliced(msg_def, frames):
+    """Decode each message with eager field slicing."""
+    for frame in frames:
+        SlicedInbound(msg_def, frame)
+
+
+def decode_struct(msg_def, frames):
+    """Decode each message without accessing the lazy fields."""
+    for frame in frames:
+        Inbound(msg_def, frame)
+
+
+def decode_struct_access(msg_def, frames):
+    """Decode each message and access the address and flags."""
+    for frame in frames:
+        msg = Inbound(msg_def, frame)
+        _ = msg.address
+        _ = msg.flags
+
+
+def main():
+    """Run the benchmark."""
+    for msg_id in (MessageId.STANDARD_RECEIVED, MessageId.EXTENDED_RECEIVED):
+        msg_def = INBOUND_MSG_DEF[msg_id]
+        frames = build_frames(msg_id)
+        print(f"{len(frames)} x {msg_id.name}")
+        old = timeit(lambda d=msg_def, f=frames: decode_sliced(d, f))
+        print_result("eager slices", old)
+        new = timeit(lambda d=msg_def, f=frames: decode_struct(d, f))
+        print_result("struct decode", new, old)
+        new = timeit(lambda d=msg_def, f=frames: decode_struct_access(d, f))
+        print_result("struct decode + address/flags", new, old)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark saving 200 devices with 10,000 ALDB records.
+
+Compares writing every device to the device file, as the previous version did
+for every save, with appending only the changed devices to the journal file.
+"""
+import asyncio
+import json
+from os import path
+import tempfile
+import time
+
+import aiofiles
+
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.saved_devices_manager import (
+    DEVICE_INFO_FILE,
+    SavedDeviceManager,
+    _device_to_dict,
+)
+
+from benchmarks.utils import create_devices, print_result
+
+DEVICE_COUNT = 200
+RECORDS_PER_DEVICE = 50
+
+
+async def previous_save(workdir, device_list):
+    """Save all devices by rewriting the device file in place."""
+    device_file = path.join(workdir, DEVICE_INFO_FILE)
+    async with aiofiles.open(device_file, "w") as afp:
+        await afp.write(json.dumps(_device_to_dict(device_list), indent=2))
+        await afp.flush()
+
+
+async def async_best(func, repeat=5):
+    """Return the best time in seconds of `repeat` awaited calls to `func`."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def async_main():
+    """Run the benchmark."""
+    modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+    device_list = {}
+    for device in create_devices(DEVICE_COUNT):
+        records = {}
+        for index in range(RECORDS_PER_DEVICE):
+            mem_addr = 0x0FFF - index * 8
+            records[mem_addr] = ALDBRecord(
+                mem_addr, index % 2 == 0, index, modem.address, 0xFF, 0x1C, 0x01
+            )
+        device.aldb.load_saved_records(ALDBStatus.LOADED, records)
+        device_list[device.address] = device
+    changed = list(device_list)[:1]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        saved_devices_manager = SavedDeviceManager(workdir, modem)
+        previous = await async_best(lambda: previous_save(workdir, device_list))
+        full = await async_best(lambda: saved_devices_manager.async_save(device_list))
+        incremental = await async_best(
+            lambda: saved_devices_manager.async_save(device_list, changed=changed)
+        )
+        file_size = path.getsize(path.join(workdir, DEVICE_INFO_FILE))
+
+    print(
+        f"Save {DEVICE_COUNT} devices with {DEVICE_COUNT * RECORDS_PER_DEVICE} "
+        f"ALDB records ({file_size // 1024} KiB)"
+    )
+    print_result("rewrite the device file", previous)
+    print_result("replace the device file", full, previous)
+    print_result("append one changed device", incremental, previous)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
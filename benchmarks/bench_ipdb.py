@@ -0,0 +1,55 @@
+"""Benchmark the product lookup over the full IPDB product table.
+
+Compares the dictionary lookup with the previous version that scanned the
+product list for the cat and subcat and again for the generic product.
+"""
+import asyncio
+
+from pyinsteon.device_types.ipdb import IPDB, Product
+
+from benchmarks.utils import print_result, timeit
+
+
+def previous_lookup(ipdb, cat, subcat):
+    """Find a product by scanning the product list."""
+    device_product = None
+    for product in ipdb:
+        if cat == product.cat and subcat == product.subcat:
+            device_product = product
+    if not device_product:
+        for product in ipdb:
+            if cat == product.cat and product.subcat is None:
+                return product
+    if not device_product:
+        device_product = Product(
+            cat, subcat, None, "", "", "unknown_device.UnknownDevice"
+        )
+    return device_product
+
+
+async def async_main():
+    """Run the benchmark."""
+    ipdb = IPDB()
+    known = [(product.cat, product.subcat) for product in ipdb]
+    # Unlisted subcats that fall back to the generic product of the cat
+    generic = [(cat, 0xFE) for cat in {product.cat for product in ipdb}]
+
+    print(f"Look up {len(known)} products and {len(generic)} generic products")
+    for name, keys in (("listed products", known), ("generic products", generic)):
+
+        def _scan(keys=keys):
+            for cat, subcat in keys:
+                previous_lookup(ipdb, cat, subcat)
+
+        def _lookup(keys=keys):
+            for cat, subcat in keys:
+                ipdb[[cat, subcat]]  # pylint: disable=pointless-statement
+
+        old = timeit(_scan, repeat=5, number=10)
+        new = timeit(_lookup, repeat=5, number=10)
+        print_result(f"{name}: scan", old)
+        print_result(f"{name}: dict", new, old)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,54 @@
+"""Benchmark loading 200 devices from the saved device file.
+
+Compares creating every saved device when the file is loaded with creating
+the devices when they are first used.
+"""
+import asyncio
+import tempfile
+import time
+
+from pyinsteon import devices
+from pyinsteon.constants import EngineVersion
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.saved_devices_manager import SavedDeviceManager
+
+from benchmarks.utils import create_devices, print_result
+
+DEVICE_COUNT = 200
+
+
+async def async_time_load(workdir, lazy):
+    """Return the time in seconds to load the saved devices."""
+    start = time.perf_counter()
+    await devices.async_load(workdir, 0, 0, lazy=lazy)
+    elapsed = time.perf_counter() - start
+    assert len(devices) == DEVICE_COUNT + 1
+    return elapsed
+
+
+async def async_main():
+    """Run the benchmark."""
+    devices.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+    device_list = {}
+    for device in create_devices(DEVICE_COUNT):
+        # Devices with an unknown engine version are always created to read it
+        device.engine_version = EngineVersion.I2CS
+        device_list[device.address] = device
+
+    with tempfile.TemporaryDirectory() as workdir:
+        await SavedDeviceManager(workdir, devices.modem).async_save(device_list)
+        eager = await async_time_load(workdir, lazy=False)
+        lazy = await async_time_load(workdir, lazy=True)
+    start = time.perf_counter()
+    devices.create_saved_devices()
+    created = time.perf_counter() - start
+    await asyncio.sleep(0.5)
+
+    print(f"Load {DEVICE_COUNT} saved devices")
+    print_result("create all devices", eager)
+    print_result("create devices when used", lazy, eager)
+    print_result("create the deferred devices later", created)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
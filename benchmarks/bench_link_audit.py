@@ -0,0 +1,111 @@
+"""Benchmark finding broken links with an ALDB scan and with the link audit index.
+
+Creates 300 devices with 10,000 ALDB records between them. Most links have a
+controller and a responder record and some records have no corresponding
+record in the target device.
+"""
+import asyncio
+from random import Random
+
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus, LinkStatus
+from pyinsteon.managers.link_manager.link_audit import LinkAudit
+
+from benchmarks.utils import create_devices, print_result, timeit
+
+DEVICES = 300
+RECORDS = 10000
+BROKEN = 0.05
+FIRST_MEM_ADDR = 0x0FFF
+
+
+def build_topology(devices, records: int = RECORDS, seed: int = 1):
+    """Add controller and responder records for random links to the devices."""
+    rand = Random(seed)
+    device_records = {device.address: [] for device in devices}
+    count = 0
+    while count < records:
+        controller, responder = rand.sample(devices, 2)
+        group = rand.randint(1, 8)
+        if rand.random() >= BROKEN:
+            device_records[controller.address].append((True, group, responder.address))
+            count += 1
+        if rand.random() >= BROKEN:
+            device_records[responder.address].append((False, group, controller.address))
+            count += 1
+
+    for device in devices:
+        aldb_records = {}
+        mem_addr = FIRST_MEM_ADDR
+        for controller, group, target in device_records[device.address]:
+            aldb_records[mem_addr] = ALDBRecord(
+                memory=mem_addr,
+                controller=controller,
+                group=group,
+                target=target,
+                data1=255,
+                data2=28,
+                data3=1,
+            )
+            mem_addr -= 8
+        aldb_records[mem_addr] = ALDBRecord(
+            memory=mem_addr,
+            controller=False,
+            group=0,
+            target="000000",
+            data1=0,
+            data2=0,
+            data3=0,
+            in_use=False,
+            high_water_mark=True,
+        )
+        device.aldb.load_saved_records(ALDBStatus.LOADED, aldb_records)
+
+
+def scan_broken_links(devices):
+    """Return the broken links by scanning the target ALDB of each record."""
+    broken_link_list = []
+    for addr, device in devices.items():
+        for rec in device.aldb.find(in_use=True):
+            target = devices.get(rec.target)
+            status = (
+                LinkStatus.MISSING_RESPONDER
+                if rec.is_controller
+                else LinkStatus.MISSING_CONTROLLER
+            )
+            for mem_addr in target.aldb:
+                t_rec = target.aldb[mem_addr]
+                if (
+                    t_rec.target == addr
+                    and t_rec.group == rec.group
+                    and t_rec.is_controller != rec.is_controller
+                ):
+                    status = LinkStatus.FOUND
+                    break
+            if status != LinkStatus.FOUND:
+                broken_link_list.append((addr, rec, status))
+    return broken_link_list
+
+
+async def async_main():
+    """Run the benchmark."""
+    device_list = create_devices(DEVICES)
+    build_topology(device_list)
+    devices = {device.address: device for device in device_list}
+
+    old = timeit(lambda: scan_broken_links(devices), repeat=1)
+    print(f"{len(devices)} devices, {RECORDS} records")
+    print_result("broken links: scan", old)
+    new = timeit(lambda: LinkAudit(devices).get_broken_links(), repeat=3)
+    print_result("broken links: index and audit", new, old)
+    link_audit = LinkAudit(devices)
+    new = timeit(link_audit.get_broken_links, repeat=3)
+    print_result("broken links: audit of current index", new, old)
+
+    broken = link_audit.get_broken_links()
+    assert len(broken) == len(scan_broken_links(devices))
+    print(f"Broken links: {len(broken)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
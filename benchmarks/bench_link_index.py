@@ -0,0 +1,127 @@
+"""Benchmark responder lookups with an ALDB scan and with the link index.
+
+Creates 200 devices with 5,000 controller/responder links between them and
+looks up the responders of randomly chosen controller groups, as is done for
+every All-Link broadcast received.
+"""
+import asyncio
+from random import Random
+
+from pyinsteon import devices, link_manager
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_link_manager import EMPTY_ADDRESS, LinkInfo
+
+from benchmarks.utils import create_devices, print_result, timeit
+
+DEVICES = 200
+LINKS = 5000
+LOOKUPS = 1000
+FIRST_MEM_ADDR = 0x0FFF
+
+
+def build_topology(devices, links: int = LINKS, seed: int = 1):
+    """Add controller and responder records for random links to the devices."""
+    rand = Random(seed)
+    records = {device.address: [] for device in devices}
+    for _ in range(links):
+        controller, responder = rand.sample(devices, 2)
+        group = rand.randint(1, 8)
+        records[controller.address].append(
+            (True, group, responder.address, 255, 28, group)
+        )
+        records[responder.address].append(
+            (False, group, controller.address, 255, 28, 1)
+        )
+
+    groups = set()
+    for device in devices:
+        aldb_records = {}
+        mem_addr = FIRST_MEM_ADDR
+        for controller, group, target, data1, data2, data3 in records[device.address]:
+            aldb_records[mem_addr] = ALDBRecord(
+                memory=mem_addr,
+                controller=controller,
+                group=group,
+                target=target,
+                data1=data1,
+                data2=data2,
+                data3=data3,
+            )
+            if controller:
+                groups.add((device.address, group))
+            mem_addr -= 8
+        device.aldb.load_saved_records(ALDBStatus.LOADED, aldb_records)
+    return sorted(groups)
+
+
+def scan_responders(controller, group):
+    """Return the responders of a controller group by scanning every ALDB."""
+    modem_address = devices.modem.address
+    responders = {}
+    for addr in devices:
+        if addr == modem_address:
+            continue
+        device = devices[addr]
+        for _, rec in device.aldb.items():
+            if (
+                rec.target in (modem_address, EMPTY_ADDRESS)
+                or not rec.is_in_use
+                or rec.group != group
+            ):
+                continue
+            if rec.is_controller:
+                if device.address == controller:
+                    responders.setdefault(rec.target, [])
+                continue
+            if rec.target != controller:
+                continue
+            has_controller = False
+            for _ in devices[controller].aldb.find(
+                target=device.address, is_controller=True, group=group
+            ):
+                has_controller = True
+            responders.setdefault(device.address, []).append(
+                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
+            )
+    return responders
+
+
+async def async_main():
+    """Run the benchmark."""
+    devices.modem = Hub("111111", 0x03, 51, 165, "Benchmark modem")
+    device_list = create_devices(DEVICES)
+    # Add the devices as the saved device file is loaded so they are not inspected
+    # pylint: disable=protected-access
+    async with devices._loading_saved_lock:
+        for device in device_list:
+            devices[device.address] = device
+        groups = build_topology(device_list)
+    await asyncio.sleep(0.5)
+    rand = Random(2)
+    lookups = [rand.choice(groups) for _ in range(LOOKUPS)]
+    print(f"{len(device_list)} devices, {LINKS} links, {len(lookups)} lookups")
+
+    rebuild = timeit(link_manager.rebuild, repeat=3)
+    print_result("index: rebuild", rebuild)
+
+    for controller, group in lookups[:50]:
+        scanned = scan_responders(controller, group)
+        indexed = link_manager.get_responders(controller, group)
+        assert set(scanned) == set(indexed)
+
+    old = timeit(
+        lambda: [scan_responders(*lookup) for lookup in lookups[:20]],
+        repeat=3,
+    ) * (len(lookups) / 20)
+    print_result("lookup: scan", old)
+    new = timeit(
+        lambda: [link_manager.get_responders(*lookup) for lookup in lookups],
+        repeat=3,
+    )
+    print_result("lookup: index", new, old)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,78 @@
+"""Benchmark status requests to many devices with and without pipelining.
+
+A simulated modem ACKs each message after ACK_DELAY and the device sends its
+direct ACK after RESPONSE_DELAY. Times are scaled down by SCALE from the
+serial modem write wait of 0.8 s.
+"""
+import asyncio
+from binascii import unhexlify
+
+from pyinsteon.protocol.protocol import Protocol
+
+DEVICES = 150
+SCALE = 0.05
+WRITE_WAIT = 0.8 * SCALE
+ACK_DELAY = 0.02 * SCALE
+RESPONSE_DELAY = 0.3 * SCALE
+
+
+class SimulatedTransport(asyncio.Transport):
+    """Transport that ACKs messages and sends device responses."""
+
+    write_wait = WRITE_WAIT
+
+    def __init__(self, protocol):
+        """Init the SimulatedTransport class."""
+        super().__init__()
+        self._protocol = protocol
+        self.responses = 0
+
+    def is_closing(self):
+        """Return False always."""
+        return False
+
+    async def async_write(self, data):
+        """Write a message and schedule the ACK and the device response."""
+        data = bytes(data)
+        loop = asyncio.get_running_loop()
+        loop.call_later(ACK_DELAY, self._protocol.data_received, data + b"\x06")
+        loop.call_later(RESPONSE_DELAY, self._respond, data)
+
+    def _respond(self, data):
+        """Send the device direct ACK."""
+        self.responses += 1
+        self._protocol.data_received(
+            b"\x02\x50" + data[2:5] + b"\x11\x11\x11\x2b" + data[6:8]
+        )
+
+
+async def run_writer(pipeline: bool):
+    """Send a status request to each device and return the writer stats."""
+    protocol = Protocol(connect_method=None)
+    transport = SimulatedTransport(protocol)
+    protocol.connection_made(transport)
+    protocol.pipeline = pipeline
+    protocol.resume_writing()
+    for index in range(DEVICES):
+        protocol.write(unhexlify(f"0262{index + 1:06x}0f1900"))
+    while transport.responses < DEVICES:
+        await asyncio.sleep(0.01)
+    protocol.pause_writing()
+    await asyncio.sleep(0.2)
+    return protocol.stats
+
+
+def main():
+    """Run the benchmark."""
+    print(f"Status request to {DEVICES} devices (times scaled by {SCALE})")
+    for name, pipeline in (("fixed write wait", False), ("pipelined", True)):
+        stats = asyncio.run(run_writer(pipeline))
+        print(
+            f"{name:20s} {stats['messages_per_second'] * SCALE:8.1f} msg/s"
+            f"  average wait {stats['average_wait'] / SCALE:7.2f} s"
+            f"  ack timeouts {stats['ack_timeouts']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark publishing a topic against the number of listeners.
+
+Compares publish_topic with the previous version that looked up the topic
+and checked every listener for a dead reference before each message.
+"""
+import asyncio
+
+from pyinsteon import pub
+from pyinsteon.utils import publish_topic
+
+from benchmarks.utils import print_result, timeit
+
+LISTENER_COUNTS = (1, 10, 100, 1000)
+MESSAGES = 2000
+
+
+def previous_publish_topic(topic, **kwargs):
+    """Publish a topic after removing dead listeners."""
+    pub_topic = pub.getDefaultTopicMgr().getTopic(topic, okIfNone=True)
+    if pub_topic:
+        for listener in pub_topic.listeners:
+            if listener.isDead():
+                pub_topic.unsubscribe(listener)
+    pub.sendMessage(topic, **kwargs)
+
+
+class Listener:
+    """Topic listener."""
+
+    def __init__(self):
+        """Init the Listener class."""
+        self.calls = 0
+
+    def on_status(self, status):
+        """Count the messages received."""
+        self.calls += 1
+
+
+async def async_main():
+    """Run the benchmark."""
+    print(f"Publish {MESSAGES} messages, time per 1,000 messages")
+    for count in LISTENER_COUNTS:
+        topic = f"bench_publish_topic.listeners_{count}"
+        listeners = [Listener() for _ in range(count)]
+        for listener in listeners:
+            pub.subscribe(listener.on_status, topic)
+
+        def _publish(publish, topic=topic):
+            for status in range(MESSAGES):
+                publish(topic, status=status)
+
+        old = timeit(lambda: _publish(previous_publish_topic)) / MESSAGES * 1000
+        new = timeit(lambda: _publish(publish_topic)) / MESSAGES * 1000
+        print_result(f"{count} listeners: previous", old)
+        print_result(f"{count} listeners: cached topic", new, old)
+        assert all(listener.calls == 10 * MESSAGES for listener in listeners)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,136 @@
+"""Benchmark listing the modem scenes with an ALDB scan and with the scene index.
+
+Creates 400 devices and a modem ALDB with 2,000 controller records in 250
+scenes. Each device has a responder record for each scene it belongs to.
+"""
+import asyncio
+from random import Random
+
+from benchmarks.utils import create_devices, print_result, timeit
+from pyinsteon import devices
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_link_manager import LinkInfo
+from pyinsteon.managers.scene_manager import SceneIndex
+
+DEVICES = 400
+SCENES = 250
+LINKS = 2000
+FIRST_MEM_ADDR = 0x3FFF
+
+
+def _hwm(mem_addr):
+    """Return a high water mark record."""
+    return ALDBRecord(
+        memory=mem_addr,
+        controller=False,
+        group=0,
+        target="000000",
+        data1=0,
+        data2=0,
+        data3=0,
+        in_use=False,
+        high_water_mark=True,
+    )
+
+
+def build_scenes(modem, device_list, seed: int = 1):
+    """Add the modem controller and device responder records of the scenes."""
+    rand = Random(seed)
+    links = set()
+    while len(links) < LINKS:
+        links.add((rand.randint(20, 20 + SCENES - 1), rand.choice(device_list)))
+
+    modem_records = {}
+    device_records = {device.address: {} for device in device_list}
+    mem_addr = FIRST_MEM_ADDR
+    for group, device in sorted(links, key=lambda link: (link[0], link[1].id)):
+        modem_records[mem_addr] = ALDBRecord(
+            memory=mem_addr,
+            controller=True,
+            group=group,
+            target=device.address,
+            data1=device.cat,
+            data2=device.subcat,
+            data3=0,
+        )
+        mem_addr -= 8
+        records = device_records[device.address]
+        device_mem_addr = 0x0FFF - 8 * len(records)
+        records[device_mem_addr] = ALDBRecord(
+            memory=device_mem_addr,
+            controller=False,
+            group=group,
+            target=modem.address,
+            data1=255,
+            data2=28,
+            data3=1,
+        )
+    modem_records[mem_addr] = _hwm(mem_addr)
+    modem.aldb.load_saved_records(ALDBStatus.LOADED, modem_records)
+    for device in device_list:
+        records = device_records[device.address]
+        hwm_mem_addr = 0x0FFF - 8 * len(records)
+        records[hwm_mem_addr] = _hwm(hwm_mem_addr)
+        device.aldb.load_saved_records(ALDBStatus.LOADED, records)
+
+
+def scan_scenes(devices):
+    """Return the scenes by scanning the ALDB of each device and the modem."""
+    scenes = {}
+    for addr in devices:
+        device = devices[addr]
+        if device == devices.modem:
+            continue
+        for rec in device.aldb.find(
+            target=devices.modem.address, is_controller=False, in_use=True
+        ):
+            if rec.group == 0:
+                continue
+            scene = scenes.setdefault(rec.group, {})
+            has_controller = False
+            for _ in devices.modem.aldb.find(
+                target=device.address, group=rec.group, is_controller=True, in_use=True
+            ):
+                has_controller = True
+                break
+            scene.setdefault(device.address, []).append(
+                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
+            )
+    return scenes
+
+
+async def async_main():
+    """Run the benchmark."""
+    device_list = create_devices(DEVICES)
+    # pylint: disable=protected-access
+    async with devices._loading_saved_lock:
+        devices.modem = Hub("1c1c1c", 0x03, 51, 165, "Benchmark modem")
+        for device in device_list:
+            devices[device.address] = device
+    build_scenes(devices.modem, device_list)
+
+    print(f"{DEVICES} devices, {SCENES} scenes, {LINKS} modem controller records")
+    old = timeit(lambda: scan_scenes(devices), repeat=1)
+    print_result("get scenes: scan", old)
+    new = timeit(lambda: SceneIndex(devices).get_scenes(), repeat=3)
+    print_result("get scenes: build index", new, old)
+    scene_index = SceneIndex(devices)
+    new = timeit(scene_index.get_scenes, repeat=5)
+    print_result("get scenes: current index", new, old)
+    new = timeit(lambda: scene_index.get_scene(20), repeat=5, number=100)
+    print_result("get scene: current index", new)
+
+    scenes = scene_index.get_scenes()
+    expected = scan_scenes(devices)
+    assert sorted(scenes) == sorted(expected)
+    for group, links in expected.items():
+        assert {addr: len(info) for addr, info in links.items()} == {
+            addr: len(info) for addr, info in scenes[group].items()
+        }
+        assert all(info[0].has_controller for info in scenes[group].values())
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
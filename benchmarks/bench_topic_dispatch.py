@@ -0,0 +1,98 @@
+"""Benchmark publishing received messages with and without the dispatch table.
+
+Creates 200 devices with their default handlers subscribed and publishes a
+mix of broadcast, cleanup and direct ACK messages from those devices.
+"""
+import asyncio
+from random import Random
+
+from pyinsteon.protocol.messages.inbound import create
+from pyinsteon.protocol.msg_to_topic import convert_to_topic
+from pyinsteon import pub
+from pyinsteon.protocol.topic_dispatcher import _message_key, topic_dispatcher
+from pyinsteon.utils import publish_topic
+
+from benchmarks.utils import create_devices, print_result, timeit
+
+DEVICES = 200
+MESSAGES = 2000
+MODEM = bytes.fromhex("1a2b3c")
+
+
+def build_messages(devices, count: int = MESSAGES, seed: int = 1):
+    """Build received messages from the devices."""
+    rand = Random(seed)
+    msgs = []
+    for _ in range(count):
+        address = bytes(rand.choice(devices).address)
+        group = rand.randint(1, 4)
+        cmd1 = rand.choice([0x11, 0x13])
+        kind = rand.randint(0, 2)
+        if kind == 0:
+            # All-Link broadcast
+            data = address + bytes([0, 0, group, 0xCB, cmd1, 0])
+        elif kind == 1:
+            # All-Link cleanup
+            data = address + MODEM + bytes([0x4B, cmd1, group])
+        else:
+            # Direct ACK of a status request
+            data = address + MODEM + bytes([0x2B, 0x00, rand.randint(0, 255)])
+        msg, _ = create(bytearray(b"\x02\x50" + data))
+        msgs.append(msg)
+    return msgs
+
+
+def publish_topic_tree(msgs):
+    """Publish the messages by building each topic."""
+    for msg in msgs:
+        for topic, kwargs in convert_to_topic(msg):
+            publish_topic(topic, **kwargs)
+
+
+def publish_dispatcher(msgs):
+    """Publish the messages through the dispatch table."""
+    for msg in msgs:
+        topic_dispatcher.publish(msg)
+
+
+def lookup_topic_tree(msgs):
+    """Build the topics of each message and find them in the topic tree."""
+    topic_mgr = pub.getDefaultTopicMgr()
+    for msg in msgs:
+        for topic, _ in convert_to_topic(msg):
+            topic_mgr.getTopic(topic, okIfNone=True)
+
+
+def lookup_dispatcher(msgs):
+    """Find the topics and listeners of each message in the dispatch table."""
+    # pylint: disable=protected-access
+    table = topic_dispatcher._table
+    for msg in msgs:
+        table.get(_message_key(msg))
+
+
+async def async_main():
+    """Run the benchmark."""
+    devices = create_devices(DEVICES)
+    msgs = build_messages(devices)
+    print(f"{len(devices)} devices, {len(msgs)} messages")
+
+    old = timeit(lambda: publish_topic_tree(msgs), repeat=3)
+    print_result("publish: topic strings + topic tree", old)
+    old_lookup = timeit(lambda: lookup_topic_tree(msgs), repeat=3)
+    await asyncio.sleep(0)
+
+    topic_dispatcher.enable()
+    publish_dispatcher(msgs)
+    new = timeit(lambda: publish_dispatcher(msgs), repeat=3)
+    print_result("publish: dispatch table", new, old)
+    print_result("lookup: topic strings + topic tree", old_lookup)
+    new = timeit(lambda: lookup_dispatcher(msgs), repeat=3)
+    print_result("lookup: dispatch table", new, old_lookup)
+    print(f"Table entries: {len(topic_dispatcher)}")
+    topic_dispatcher.disable()
+    await asyncio.sleep(0)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
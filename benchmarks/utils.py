@@ -0,0 +1,58 @@
+"""Utilities for the benchmarks."""
+from random import Random
+import time
+from typing import Callable
+
+from pyinsteon.address import Address
+from pyinsteon.managers.device_id_manager import DeviceId
+from pyinsteon.managers.utils import create_device
+
+# A mix of common products as (cat, subcat)
+PRODUCTS = [
+    (0x01, 0x20),  # SwitchLinc Dimmer
+    (0x01, 0x0E),  # LampLinc
+    (0x01, 0x41),  # KeypadLinc Dimmer 8 button
+    (0x02, 0x2A),  # SwitchLinc Relay
+    (0x02, 0x39),  # On/Off Outlet
+    (0x01, 0x2E),  # FanLinc
+    (0x10, 0x01),  # Motion Sensor
+    (0x10, 0x02),  # Open/Close Sensor
+    (0x05, 0x0B),  # Thermostat
+    (0x00, 0x1A),  # Mini Remote 8 scene
+]
+
+
+def timeit(func: Callable, repeat: int = 5, number: int = 1) -> float:
+    """Return the best time in seconds of `number` calls to `func`."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number
+
+
+def random_address(rand: Random) -> Address:
+    """Return a random address from a seeded random generator."""
+    return Address(bytes(rand.randint(0, 255) for _ in range(3)))
+
+
+def print_result(name: str, seconds: float, baseline: float = None):
+    """Print a benchmark result."""
+    if baseline:
+        print(f"{name:40s} {seconds * 1000:10.3f} ms  ({baseline / seconds:6.1f}x)")
+    else:
+        print(f"{name:40s} {seconds * 1000:10.3f} ms")
+
+
+def create_devices(count: int, seed: int = 1):
+    """Create a list of devices with random addresses from the product mix."""
+    rand = Random(seed)
+    devices = []
+    for index in range(count):
+        cat, subcat = PRODUCTS[index % len(PRODUCTS)]
+        device_id = DeviceId(random_address(rand), cat, subcat, 0x45)
+        devices.append(create_device(device_id))
+    return devices
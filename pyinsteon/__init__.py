@@ -1,30 +1,68 @@
 """Python module for controlling Insteon devices."""
 import asyncio
-import logging
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from pubsub import pub
 
-from .address import Address
-from .handlers.from_device.x10_received import X10Received
 from .listener_exception_handler import ListenerExceptionHandler
-from .managers.device_link_manager import DeviceLinkManager
-from .managers.device_manager import DeviceManager
-from .managers.link_manager.default_links import async_add_default_links
-
-# pylint: disable=unused-import
-from .managers.x10_manager import async_x10_all_lights_off  # noqa: F401
-from .managers.x10_manager import async_x10_all_lights_on  # noqa: F401
-from .managers.x10_manager import async_x10_all_units_off  # noqa: F401
-from .protocol import async_modem_connect
-from .topics import ADD_DEFAULT_LINKS
-from .utils import subscribe_topic
-
-_LOGGER_TOPICS = logging.getLogger("pyinsteon.topics")
-X10_RECEIVED_HANDLER = X10Received()
-
-devices = DeviceManager()
-link_manager = DeviceLinkManager(devices)
-subscribe_topic(async_add_default_links, ADD_DEFAULT_LINKS)
+from .topic_logger import topic_logger
+
+if TYPE_CHECKING:
+    from .handlers.from_device.x10_received import X10Received
+    from .managers.device_link_manager import DeviceLinkManager
+    from .managers.device_manager import DeviceManager
+
+# The managers are created the first time one of them is used
+X10_RECEIVED_HANDLER: "X10Received"
+devices: "DeviceManager"
+link_manager: "DeviceLinkManager"
+_managers = {}
+
+# Functions imported from their module the first time they are used
+_LAZY_IMPORTS = {
+    "async_x10_all_lights_off": ".managers.x10_manager",
+    "async_x10_all_lights_on": ".managers.x10_manager",
+    "async_x10_all_units_off": ".managers.x10_manager",
+}
+
+
+def __getattr__(name):
+    """Create the managers or import a function the first time it is used."""
+    if name in ("X10_RECEIVED_HANDLER", "devices", "link_manager"):
+        return _create_managers()[name]
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _create_managers():
+    """Create the device and link managers and subscribe to the global topics.
+
+    Returns the managers by attribute name. The managers are also kept in
+    `_managers` so they are found again if an attribute is deleted, such as by
+    `unittest.mock.patch`.
+    """
+    if _managers:
+        return _managers
+
+    # pylint: disable=import-outside-toplevel
+    from .handlers.from_device.x10_received import get_x10_received_handler
+    from .managers.device_link_manager import DeviceLinkManager
+    from .managers.device_manager import DeviceManager
+    from .managers.link_manager.default_links import async_add_default_links
+    from .topics import ADD_DEFAULT_LINKS
+    from .utils import subscribe_topic
+
+    device_manager = DeviceManager()
+    _managers["X10_RECEIVED_HANDLER"] = get_x10_received_handler()
+    _managers["devices"] = device_manager
+    _managers["link_manager"] = DeviceLinkManager(device_manager)
+    subscribe_topic(async_add_default_links, ADD_DEFAULT_LINKS)
+    globals().update(_managers)
+    return _managers
 
 
 async def async_connect(
@@ -49,6 +87,11 @@ async def async_connect(
     Returns an Insteon Modem (PLM or Hub).
 
     """
+    # pylint: disable=import-outside-toplevel
+    from .protocol import async_modem_connect
+
+    devices = _create_managers()["devices"]  # pylint: disable=redefined-outer-name
+    topic_logger.update()
     try:
         modem = await async_modem_connect(
             device=device,
@@ -69,10 +112,12 @@ async def async_connect(
 
 async def async_close():
     """Close the connection and stop all tasks."""
+    devices = _create_managers()["devices"]  # pylint: disable=redefined-outer-name
     await devices.modem.async_close()
-    for addr in devices:
-        if devices[addr].is_battery:
-            devices[addr].close()
+    # Saved devices that are not created yet have nothing to close
+    for device in devices.created_devices:
+        if device.is_battery:
+            device.close()
     devices.id_manager.close()
     await asyncio.sleep(0.1)
 
@@ -85,42 +130,19 @@ def set_exception_handler():
     pub.setListenerExcHandler(ListenerExceptionHandler())
 
 
-def _get_device_in_topic(topic: pub.Topic, **kwargs):
-    """Return a list of devices referenced in a topic."""
-    addresses = []
-    prefix = ["ack", "nak", "handler"]
-    topic_tuple = topic.getNameTuple()
-    try:
-        if topic_tuple[0] == "send":
-            pass
-        elif topic_tuple[0] in prefix:
-            addresses.append(Address(topic_tuple[1]))
-        else:
-            addresses.append(Address(topic_tuple[0]))
-    except ValueError:
-        pass
-
-    for key, value in kwargs.items():
-        if key in ["address", "target"]:
-            try:
-                addr = Address(value)
-            except ValueError:
-                continue
-            else:
-                if addr not in addresses and not str(addr).startswith("000"):
-                    addresses.append(addr)
-
-    return addresses
-
-
-def _log_all_topics(topic=pub.AUTO_TOPIC, **kwargs):
-    """Log all topics from pyinsteon."""
-    _LOGGER_TOPICS.debug("Topic: %s data: %s", topic.name, kwargs)
-    if _LOGGER_TOPICS.level > logging.DEBUG:
-        addresses = _get_device_in_topic(topic, **kwargs)
-        for addr in addresses:
-            logger = logging.getLogger(f"pyinsteon.{addr.id}")
-            logger.debug("Topic: %s data: %s", topic.name, kwargs)
-
-
-pub.subscribe(_log_all_topics, pub.ALL_TOPICS)
+def set_fast_dispatch(enabled: bool = True):
+    """Enable or disable the fast path dispatch of received messages.
+
+    When enabled, the topics and listeners of received standard and extended
+    messages are looked up in a table rather than built for every message.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .protocol.topic_dispatcher import topic_dispatcher
+
+    if enabled:
+        topic_dispatcher.enable()
+    else:
+        topic_dispatcher.disable()
+
+
+topic_logger.update()
@@ -28,22 +28,73 @@ def _normalize(addr):
     return normalize
 
 
+# Interned Address objects keyed by the normalized bytes and by the str and
+# bytes values used to create them
+_ADDRESSES = {}
+
+
 class Address:
-    """Datatype definition for INSTEON device address handling."""
+    """Datatype definition for INSTEON device address handling.
+
+    Address objects are immutable and interned so each address is a single
+    object with a precomputed hash, id and display string.
+    """
+
+    __slots__ = ("_addr", "_id", "_str", "_hash")
+    _addr: bytes
+    _id: str
+    _str: str
+    _hash: int
+
+    def __new__(cls, addr):
+        """Return the Address object of an address."""
+        if isinstance(addr, Address):
+            return addr
+        try:
+            return _ADDRESSES[addr]
+        except (KeyError, TypeError):
+            pass
 
-    def __init__(self, addr):
-        """Create an Address object."""
-        self._addr = _normalize(addr)
-        if self._addr is None:
+        normalized = _normalize(addr)
+        if normalized is None:
             raise ValueError("Address cannot be None")
+        address = _ADDRESSES.get(normalized)
+        if address is None:
+            address = super().__new__(cls)
+            addr_id = normalized.hex()
+            addr_str = f"{addr_id[0:2]}.{addr_id[2:4]}.{addr_id[4:6]}".upper()
+            object.__setattr__(address, "_addr", normalized)
+            object.__setattr__(address, "_id", addr_id)
+            object.__setattr__(address, "_str", addr_str)
+            object.__setattr__(address, "_hash", hash(addr_str))
+            _ADDRESSES[normalized] = address
+        if isinstance(addr, (str, bytes)):
+            _ADDRESSES[addr] = address
+        return address
+
+    def __setattr__(self, name, value):
+        """Prevent changes to the Address object."""
+        raise AttributeError("Address objects are immutable")
+
+    def __reduce__(self):
+        """Return the arguments to recreate the Address object."""
+        return (Address, (self._addr,))
+
+    def __copy__(self):
+        """Return the Address object since it is immutable."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return the Address object since it is immutable."""
+        return self
 
     def __repr__(self):
         """Representation of the Address object."""
-        return self._addr.hex()
+        return self._id
 
     def __str__(self):
         """Emit the address in human-readible format (AA.BB.CC)."""
-        return f"{self.__repr__()[0:2]}.{self.__repr__()[2:4]}.{self.__repr__()[4:6]}".upper()
+        return self._str
 
     def __bytes__(self):
         """Return the bytes representation of the address."""
@@ -52,13 +103,13 @@ class Address:
     def __eq__(self, other):
         """Test for equality."""
         if isinstance(other, Address):
-            return bytes(self) == bytes(other)
+            return self._addr == other._addr
         return False
 
     def __ne__(self, other):
         """Test for not equals."""
         if isinstance(other, Address):
-            return bytes(self) != bytes(other)
+            return self._addr != other._addr
         return True
 
     def __lt__(self, other):
@@ -74,8 +125,8 @@ class Address:
         raise TypeError
 
     def __hash__(self):
-        """Create a hash code for the Address object."""
-        return hash(str(self))
+        """Return the hash code of the Address object."""
+        return self._hash
 
     def __getitem__(self, byte):
         """Return a btye within the Address object."""
@@ -86,7 +137,7 @@ class Address:
     @property
     def id(self):
         """Return the address id."""
-        return repr(self)
+        return self._id
 
     @property
     def high(self):
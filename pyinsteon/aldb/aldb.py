@@ -5,12 +5,14 @@ Insteon devices that either respond to or control the current device.
 """
 import asyncio
 import logging
+from math import ceil
 
 from ..constants import ALDBStatus, EngineVersion, ReadWriteMode
 from ..managers.aldb_read_manager import ALDBReadManager
 from .aldb_base import ALDBBase
 
 _LOGGER = logging.getLogger(__name__)
+DELTA_SAMPLES = 8
 
 
 class ALDB(ALDBBase):
@@ -39,7 +41,7 @@ class ALDB(ALDBBase):
             # Pop any unused records to make sure we query them
             unused = list(self.find(in_use=False))
             for rec in unused:
-                self._records.pop(rec.mem_addr)
+                self._pop_record(rec.mem_addr)
 
         if self._read_write_mode == ReadWriteMode.UNKNOWN:
             mode = ReadWriteMode.STANDARD
@@ -124,7 +126,7 @@ class ALDB(ALDBBase):
         if old_record and old_record.is_in_use:
             self._notify_change(self._records[record.mem_addr], force_delete=True)
 
-        self._records[record.mem_addr] = record
+        self._set_record(record.mem_addr, record)
         self._notify_change(record)
         return True
 
@@ -145,3 +147,95 @@ class ALDB(ALDBBase):
                 return mem_addr
 
         return last_addr - 8
+
+    async def async_load_delta(self, samples: int = DELTA_SAMPLES):
+        """Refresh a loaded All-Link Database by reading only what changed.
+
+        The high water mark record and `samples` records spread across the
+        database are read one at a time and compared with the current records.
+        When a sample changed, the records up to the next sample are read. When
+        the high water mark record changed, the records are read until the new
+        high water mark. If the database is not loaded a full load is done. If
+        a record could not be read the status is set to `PARTIAL` so the next
+        load is a full load.
+
+        The refresh is probabilistic: a change to a record that is not a sample
+        is not seen unless its sample changed too. The load status is only
+        reviewed when every record was read, otherwise it is left unchanged.
+
+        Returns the number of records read.
+        """
+        hwm_mem_addr = self.high_water_mark_mem_addr
+        if not self.is_loaded or hwm_mem_addr is None:
+            await self.async_load()
+            return len(self._records)
+
+        mem_addrs = sorted(
+            (mem_addr for mem_addr in self._records if mem_addr > hwm_mem_addr),
+            reverse=True,
+        )
+        step = max(1, ceil(len(mem_addrs) / samples))
+        ranges = [
+            mem_addrs[index : index + step] for index in range(0, len(mem_addrs), step)
+        ]
+        reads = 0
+        failed = 0
+        verified = True
+
+        # New records are written at the high water mark
+        mem_addr = hwm_mem_addr
+        while mem_addr > 0:
+            record, _ = await self._async_read_delta_record(mem_addr)
+            reads += 1
+            if record is None:
+                failed += 1
+                break
+            if record.is_high_water_mark:
+                break
+            mem_addr -= 8
+
+        for mem_addr_range in ranges:
+            sample, changed = await self._async_read_delta_record(mem_addr_range[0])
+            reads += 1
+            if sample is None:
+                failed += 1
+            if sample is None or changed:
+                for mem_addr in mem_addr_range[1:]:
+                    record, _ = await self._async_read_delta_record(mem_addr)
+                    reads += 1
+                    if record is None:
+                        failed += 1
+            elif len(mem_addr_range) > 1:
+                verified = False
+
+        _LOGGER.debug(
+            "%s: Delta load read %d records, %d failed",
+            str(self._address),
+            reads,
+            failed,
+        )
+        if failed:
+            self._update_status(ALDBStatus.PARTIAL)
+        elif verified:
+            self.set_load_status()
+        return reads
+
+    async def _async_read_delta_record(self, mem_addr):
+        """Read one record and add it to the records if it changed.
+
+        Returns the record read and if it changed.
+        """
+        if self._read_write_mode == ReadWriteMode.PEEK_POKE:
+            mode = ReadWriteMode.PEEK_POKE
+        else:
+            mode = ReadWriteMode.STANDARD
+        record = None
+        changed = False
+        try:
+            async for record in self._read_manager.async_read(
+                mem_addr=mem_addr, num_recs=1, read_write_mode=mode
+            ):
+                changed = self._add_record(record)
+        finally:
+            await self._read_manager.async_stop()
+        return record, changed
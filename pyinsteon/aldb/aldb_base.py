@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Set, Tuple
 
 from ..address import Address
 from ..constants import ALDBStatus, EngineVersion, ReadWriteMode, ResponseStatus
@@ -40,6 +40,11 @@ class ALDBBase(ABC):
         """Instantiate the ALL-Link Database object."""
         self._read_write_mode = ReadWriteMode.STANDARD
         self._records = {}
+        # Memory addresses of the records by target, by group and link mode
+        # and by in use state
+        self._target_index: Dict[Address, Set[int]] = {}
+        self._group_index: Dict[Tuple[int, bool], Set[int]] = {}
+        self._in_use_index: Dict[bool, Set[int]] = {}
         self._status = ALDBStatus.EMPTY
         self._version = version
 
@@ -141,9 +146,7 @@ class ALDBBase(ABC):
 
         This does not write to the device.
         """
-        for _, rec in self.items():
-            self._notify_change(rec, force_delete=True)
-        self._records = {}
+        self._remove_records()
         self._dirty_records = {}
 
     def clear_pending(self):
@@ -162,9 +165,8 @@ class ALDBBase(ABC):
         a `responder` record that is not in the `controller`
         All-Link Database.
         """
-        for _, rec in self.items():
-            if rec.is_controller and rec.group == group:
-                yield rec.target
+        for mem_addr in sorted(self._group_index.get((group, True), ()), reverse=True):
+            yield self._records[mem_addr].target
 
     def update_version(self, version: EngineVersion):
         """Update the ALDB version number."""
@@ -198,7 +200,7 @@ class ALDBBase(ABC):
         self.clear()
         for mem_addr in records:
             record = records[mem_addr]
-            self._records[mem_addr] = record
+            self._set_record(mem_addr, record)
             self._notify_change(record)
 
         if self._is_loaded() and self._records:
@@ -337,8 +339,8 @@ class ALDBBase(ABC):
                     new_hwm_rec = new_aldb_record_from_existing(
                         HWM_RECORD, mem_addr=curr_rec.mem_addr - 8
                     )
-                    self._records[new_hwm_rec.mem_addr] = new_hwm_rec
-                self._records[rec_to_write.mem_addr] = rec_to_write
+                    self._set_record(new_hwm_rec.mem_addr, new_hwm_rec)
+                self._set_record(rec_to_write.mem_addr, rec_to_write)
                 success += 1
                 self._notify_change(rec_to_write)
             else:
@@ -378,11 +380,80 @@ class ALDBBase(ABC):
             data3=data3,
             in_use=in_use,
         )
-        for _, rec in self.items():
+        for mem_addr in self._find_candidates(
+            group, test_rec.target, is_controller, in_use
+        ):
+            rec = self._records[mem_addr]
             in_use_match = in_use is None or rec.is_in_use == in_use
             if rec == test_rec and in_use_match:
                 yield rec
 
+    def _find_candidates(
+        self, group: int, target: Address, is_controller: bool, in_use: bool
+    ) -> List[int]:
+        """Return the memory addresses of the records that may match a search.
+
+        Uses the smallest of the indexes that apply to the search criteria.
+        """
+        candidates = []
+        if target is not None:
+            candidates.append(self._target_index.get(target, set()))
+        if group is not None:
+            if is_controller is None:
+                candidates.append(
+                    self._group_index.get((group, True), set())
+                    | self._group_index.get((group, False), set())
+                )
+            else:
+                candidates.append(self._group_index.get((group, is_controller), set()))
+        if in_use is not None:
+            candidates.append(self._in_use_index.get(in_use, set()))
+        if not candidates:
+            return sorted(self._records, reverse=True)
+        return sorted(min(candidates, key=len), reverse=True)
+
+    def _record_indexes(self, record: ALDBRecord):
+        """Return the indexes of a record and the key of the record in each."""
+        return (
+            (self._target_index, record.target),
+            (self._group_index, (record.group, record.is_controller)),
+            (self._in_use_index, record.is_in_use),
+        )
+
+    def _set_record(self, mem_addr: int, record: ALDBRecord):
+        """Add or replace the record at a memory address and index it."""
+        self._pop_record(mem_addr)
+        self._records[mem_addr] = record
+        for index, key in self._record_indexes(record):
+            index.setdefault(key, set()).add(mem_addr)
+
+    def _pop_record(self, mem_addr: int) -> ALDBRecord:
+        """Remove the record at a memory address from the records and indexes."""
+        record = self._records.pop(mem_addr, None)
+        if record is None:
+            return None
+        for index, key in self._record_indexes(record):
+            mem_addrs = index.get(key)
+            if mem_addrs is None:
+                continue
+            mem_addrs.discard(mem_addr)
+            if not mem_addrs:
+                index.pop(key)
+        return record
+
+    def _remove_records(self):
+        """Remove all records and notify listeners they were deleted."""
+        for _, rec in self.items():
+            self._notify_change(rec, force_delete=True)
+        self._clear_records()
+
+    def _clear_records(self):
+        """Remove all records and clear the indexes."""
+        self._records = {}
+        self._target_index = {}
+        self._group_index = {}
+        self._in_use_index = {}
+
     def set_load_status(self):
         """Review the ALDB records and identify the load status."""
         _LOGGER.debug("Setting the load status")
@@ -520,7 +591,7 @@ class ALDBBase(ABC):
                 remove_records.append(curr_mem_addr)
 
         for mem_addr in remove_records:
-            self._records.pop(mem_addr)
+            self._pop_record(mem_addr)
 
         return True
 
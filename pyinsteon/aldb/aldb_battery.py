@@ -3,7 +3,7 @@ from collections import namedtuple
 import logging
 
 from ..constants import EngineVersion
-from .aldb import ALDB
+from .aldb import ALDB, DELTA_SAMPLES
 
 LoadCommandParams = namedtuple("LoadCommandParams", "mem_addr num_recs refresh")
 Command = namedtuple("Command", "action params")
@@ -38,6 +38,11 @@ class ALDBBattery(ALDB):
         )
         return True
 
+    async def async_load_delta(self, samples: int = DELTA_SAMPLES):
+        """Refresh the All-Link Database by reading only what changed."""
+        self._run_command(self.async_load_delta_on_wake, samples=samples)
+        return 0
+
     async def async_write(self, force=False):
         """Write modified records to the device."""
         self._run_command(self.async_write_on_wake, force=force)
@@ -56,6 +61,10 @@ class ALDBBattery(ALDB):
             refresh=refresh,
         )
 
+    async def async_load_delta_on_wake(self, samples: int = DELTA_SAMPLES):
+        """Refresh the All-Link Database when the device wakes up."""
+        return await super().async_load_delta(samples=samples)
+
     async def async_write_on_wake(self, force=False):
         """Write modified records to the device when the device wakes up."""
         return await super().async_write(force=force)
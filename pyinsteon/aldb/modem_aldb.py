@@ -82,10 +82,10 @@ class ModemALDB(ALDBBase):
     async def _async_load_standard(self):
         """Load using get first and get next methods."""
         next_mem_addr = self.first_mem_addr
-        self._records = {}
+        self._remove_records()
         async for rec in self._read_manager.async_load_standard():
             rec.mem_addr = next_mem_addr
-            self._records[next_mem_addr] = rec
+            self._set_record(next_mem_addr, rec)
             self._notify_change(rec)
             next_mem_addr -= 8
 
@@ -93,10 +93,10 @@ class ModemALDB(ALDBBase):
         """Load using EEPROM read method."""
         _LOGGER.debug("Loading from EEPROM")
         next_mem_addr = self.first_mem_addr
-        self._records = {}
+        self._remove_records()
         record = await self._read_manager.async_read_record(next_mem_addr)
         while record:
-            self._records[record.mem_addr] = record
+            self._set_record(record.mem_addr, record)
             self._notify_change(record)
             if record.is_high_water_mark:
                 return
@@ -148,6 +148,7 @@ class Commands:
         self._commands = {}
         self._use_group = {}
         self._commands_topic_map = {}
+        self._userdata_fields = {}
 
     def add(
         self,
@@ -182,6 +183,9 @@ class Commands:
         if self._commands_topic_map.get(cmd1) is None:
             self._commands_topic_map[cmd1] = []
         self._commands_topic_map[cmd1].append(topic)
+        if isinstance(userdata, dict) and userdata:
+            fields = self._userdata_fields.get(cmd1, ())
+            self._userdata_fields[cmd1] = tuple(sorted(set(fields) | set(userdata)))
 
     def get(self, topic: str) -> Command:
         """Get the command elements of the topic."""
@@ -198,6 +202,10 @@ class Commands:
         """Get a list of topics from a cmd1 value."""
         return self._commands_topic_map.get(cmd1)
 
+    def userdata_fields(self, cmd1):
+        """Return the user data fields that select a topic for a cmd1 value."""
+        return self._userdata_fields.get(cmd1, ())
+
     def use_group(self, topic):
         """Return if a topic requires a group number."""
         return self._use_group.get(topic)
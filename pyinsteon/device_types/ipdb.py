@@ -1,76 +1,56 @@
-"""Embodies the INSTEON Product Database static data and access methods."""
+"""Embodies the INSTEON Product Database static data and access methods.
+
+The device class of a product is given by its path in the `device_types`
+package, such as `"x10.X10OnOff"`, and the module of the class is imported
+the first time the class is used.
+"""
 import collections
+from importlib import import_module
 import logging
 
-from .access_control import AccessControl_Morningstar
-from .climate_control import (
-    ClimateControl_Thermostat,
-    ClimateControl_WirelessThermostat,
-)
-from .dimmable_lighting_control import (
-    DimmableLightingControl,
-    DimmableLightingControl_Dial,
-    DimmableLightingControl_DinRail,
-    DimmableLightingControl_FanLinc,
-    DimmableLightingControl_I3_KeypadLinc_4,
-    DimmableLightingControl_InLineLinc01,
-    DimmableLightingControl_InLineLinc02,
-    DimmableLightingControl_KeypadLinc_6,
-    DimmableLightingControl_KeypadLinc_8,
-    DimmableLightingControl_LampLinc,
-    DimmableLightingControl_OutletLinc,
-    DimmableLightingControl_SwitchLinc01,
-    DimmableLightingControl_SwitchLinc02,
-    DimmableLightingControl_ToggleLinc,
-)
-from .energy_management import EnergyManagement_LoadController
-from .general_controller import (
-    GeneralController,
-    GeneralController_ControlLinc,
-    GeneralController_MiniRemote_4,
-    GeneralController_MiniRemote_8,
-    GeneralController_MiniRemote_Switch,
-    GeneralController_RemoteLinc,
-)
-from .hub import Hub
-from .plm import PLM
-from .security_health_safety import (
-    SecurityHealthSafety,
-    SecurityHealthSafety_DoorSensor,
-    SecurityHealthSafety_LeakSensor,
-    SecurityHealthSafety_MotionSensor,
-    SecurityHealthSafety_OpenCloseSensor,
-    SecurityHealthSafety_Smokebridge,
-)
-from .sensors_actuators import SensorsActuators, SensorsActuators_IOLink
-from .switched_lighting_control import (
-    SwitchedLightingControl,
-    SwitchedLightingControl_ApplianceLinc,
-    SwitchedLightingControl_DinRail,
-    SwitchedLightingControl_I3Outlet,
-    SwitchedLightingControl_InLineLinc01,
-    SwitchedLightingControl_InLineLinc02,
-    SwitchedLightingControl_KeypadLinc_6,
-    SwitchedLightingControl_KeypadLinc_8,
-    SwitchedLightingControl_OnOffOutlet,
-    SwitchedLightingControl_OutletLinc,
-    SwitchedLightingControl_SwitchLinc01,
-    SwitchedLightingControl_SwitchLinc02,
-    SwitchedLightingControl_ToggleLinc,
-)
-from .unknown_device import UnknownDevice
-from .window_coverings import WindowCovering
-from .x10 import X10Dimmable, X10OnOff, X10OnOffSensor
-
 _LOGGER = logging.getLogger(__name__)
 
+_UNKNOWN_DEVICE = "unknown_device.UnknownDevice"
+_DEVICE_CLASSES = {}
+
+
+def _import_device_class(deviceclass):
+    """Return the device class of a path in the `device_types` package."""
+    if not isinstance(deviceclass, str):
+        return deviceclass
+    device_class = _DEVICE_CLASSES.get(deviceclass)
+    if device_class is None:
+        module_name, _, class_name = deviceclass.rpartition(".")
+        module = import_module(f".{module_name}", __package__)
+        device_class = getattr(module, class_name)
+        _DEVICE_CLASSES[deviceclass] = device_class
+    return device_class
+
+
+class Product(
+    collections.namedtuple(
+        "Product", "cat subcat product_key description model deviceclass"
+    )
+):
+    """An INSTEON product."""
+
+    __slots__ = ()
 
-Product = collections.namedtuple(
-    "Product", "cat subcat product_key description model deviceclass"
-)
+    @property
+    def deviceclass(self):
+        """Return the device class of the product."""
+        return _import_device_class(self[5])
 
 
-X10Product = collections.namedtuple("X10Product", "feature deviceclass")
+class X10Product(collections.namedtuple("X10Product", "feature deviceclass")):
+    """An X10 product."""
+
+    __slots__ = ()
+
+    @property
+    def deviceclass(self):
+        """Return the device class of the product."""
+        return _import_device_class(self[1])
 
 
 # flake8: noqa
@@ -78,11 +58,30 @@ class IPDB:
     """Embodies the INSTEON Product Database static data and access methods."""
 
     _products = [
-        Product(None, None, None, "Unknown Device", "", UnknownDevice),
-        Product(0x00, None, None, "Generic General Controller", "", GeneralController),
-        Product(0x00, 0x04, None, "ControLinc", "2430", GeneralController_ControlLinc),
+        Product(None, None, None, "Unknown Device", "", "unknown_device.UnknownDevice"),
         Product(
-            0x00, 0x05, 0x000034, "RemoteLinc", "2440", GeneralController_RemoteLinc
+            0x00,
+            None,
+            None,
+            "Generic General Controller",
+            "",
+            "general_controller.GeneralController",
+        ),
+        Product(
+            0x00,
+            0x04,
+            None,
+            "ControLinc",
+            "2430",
+            "general_controller.GeneralController_ControlLinc",
+        ),
+        Product(
+            0x00,
+            0x05,
+            0x000034,
+            "RemoteLinc",
+            "2440",
+            "general_controller.GeneralController_RemoteLinc",
         ),
         Product(
             0x00,
@@ -90,20 +89,55 @@ class IPDB:
             None,
             "ICON Tabletop Controller",
             "2830",
-            GeneralController_ControlLinc,
+            "general_controller.GeneralController_ControlLinc",
+        ),
+        Product(
+            0x00,
+            0x08,
+            None,
+            "EZBridge/EZServer",
+            "",
+            "general_controller.GeneralController",
+        ),
+        Product(
+            0x00,
+            0x09,
+            None,
+            "SignaLinc",
+            "2442",
+            "general_controller.GeneralController",
+        ),
+        Product(
+            0x00,
+            0x0A,
+            0x000007,
+            "Poolux LCD Controller",
+            "",
+            "general_controller.GeneralController",
+        ),
+        Product(
+            0x00,
+            0x0B,
+            0x000022,
+            "Range Extender",
+            "2443",
+            "general_controller.GeneralController",
+        ),
+        Product(
+            0x00,
+            0x0C,
+            0x000028,
+            "IES Color Touchscreen",
+            "",
+            "general_controller.GeneralController",
         ),
-        Product(0x00, 0x08, None, "EZBridge/EZServer", "", GeneralController),
-        Product(0x00, 0x09, None, "SignaLinc", "2442", GeneralController),
-        Product(0x00, 0x0A, 0x000007, "Poolux LCD Controller", "", GeneralController),
-        Product(0x00, 0x0B, 0x000022, "Range Extender", "2443", GeneralController),
-        Product(0x00, 0x0C, 0x000028, "IES Color Touchscreen", "", GeneralController),
         Product(
             0x00,
             0x10,
             None,
             "Mini Remote - 4 Scene",
             "2444A2WH4",
-            GeneralController_MiniRemote_4,
+            "general_controller.GeneralController_MiniRemote_4",
         ),
         Product(
             0x00,
@@ -111,7 +145,7 @@ class IPDB:
             None,
             "Mini Remote - Switch",
             "2444A3",
-            GeneralController_MiniRemote_Switch,
+            "general_controller.GeneralController_MiniRemote_Switch",
         ),
         Product(
             0x00,
@@ -119,7 +153,7 @@ class IPDB:
             None,
             "Mini Remote - 8 Scene",
             "2444A2WH8",
-            GeneralController_MiniRemote_8,
+            "general_controller.GeneralController_MiniRemote_8",
         ),
         Product(
             0x00,
@@ -127,7 +161,7 @@ class IPDB:
             None,
             "Mini Remote - 4 Scene",
             "2342-432",
-            GeneralController_MiniRemote_4,
+            "general_controller.GeneralController_MiniRemote_4",
         ),
         Product(
             0x00,
@@ -135,7 +169,7 @@ class IPDB:
             None,
             "Mini Remote - Switch",
             "2342-442",
-            GeneralController_MiniRemote_Switch,
+            "general_controller.GeneralController_MiniRemote_Switch",
         ),
         Product(
             0x00,
@@ -143,7 +177,7 @@ class IPDB:
             None,
             "Mini Remote - 8 Scene",
             "2342-422",
-            GeneralController_MiniRemote_8,
+            "general_controller.GeneralController_MiniRemote_8",
         ),
         Product(
             0x00,
@@ -151,7 +185,7 @@ class IPDB:
             None,
             "Mini Remote - 4 Scene",
             "2342-532",
-            GeneralController_MiniRemote_4,
+            "general_controller.GeneralController_MiniRemote_4",
         ),
         Product(
             0x00,
@@ -159,7 +193,7 @@ class IPDB:
             None,
             "Mini Remote - 8 Scene",
             "2342-522",
-            GeneralController_MiniRemote_8,
+            "general_controller.GeneralController_MiniRemote_8",
         ),
         Product(
             0x00,
@@ -167,7 +201,7 @@ class IPDB:
             None,
             "Mini Remote - Switch",
             "2342-542",
-            GeneralController_MiniRemote_Switch,
+            "general_controller.GeneralController_MiniRemote_Switch",
         ),
         Product(
             0x00,
@@ -175,7 +209,7 @@ class IPDB:
             None,
             "Mini Remote - 8 Scene",
             "2342-222",
-            GeneralController_MiniRemote_8,
+            "general_controller.GeneralController_MiniRemote_8",
         ),
         Product(
             0x00,
@@ -183,7 +217,7 @@ class IPDB:
             None,
             "Mini Remote - 4 Scene",
             "2342-232",
-            GeneralController_MiniRemote_4,
+            "general_controller.GeneralController_MiniRemote_4",
         ),
         Product(
             0x00,
@@ -191,16 +225,23 @@ class IPDB:
             None,
             "Mini Remote - Switch",
             "2342-242",
-            GeneralController_MiniRemote_Switch,
+            "general_controller.GeneralController_MiniRemote_Switch",
+        ),
+        Product(
+            0x00,
+            0x1D,
+            0x000022,
+            "Range Extender",
+            "2992-222",
+            "general_controller.GeneralController",
         ),
-        Product(0x00, 0x1D, 0x000022, "Range Extender", "2992-222", GeneralController),
         Product(
             0x01,
             None,
             None,
             "Generic Dimmable Lighting Control",
             "",
-            DimmableLightingControl,
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
             0x01,
@@ -208,7 +249,7 @@ class IPDB:
             None,
             "LampLinc Dimmer",
             "2456D3",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -216,7 +257,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2476D",
-            DimmableLightingControl_SwitchLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc01",
         ),
         Product(
             0x01,
@@ -224,7 +265,7 @@ class IPDB:
             None,
             "In-LineLinc Dimmer",
             "2475D",
-            DimmableLightingControl_InLineLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc01",
         ),
         Product(
             0x01,
@@ -232,7 +273,7 @@ class IPDB:
             None,
             "ICON Dimmer Switch",
             "2876D",
-            DimmableLightingControl_SwitchLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc01",
         ),
         Product(
             0x01,
@@ -240,7 +281,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2476DH",
-            DimmableLightingControl_SwitchLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc01",
         ),
         Product(
             0x01,
@@ -248,10 +289,15 @@ class IPDB:
             0x000041,
             "Keypad Countdown Timer",
             "2484DWH8",
-            DimmableLightingControl,
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
-            0x01, 0x06, None, "LampLinc", "2456D2", DimmableLightingControl_LampLinc
+            0x01,
+            0x06,
+            None,
+            "LampLinc",
+            "2456D2",
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -259,7 +305,7 @@ class IPDB:
             None,
             "ICON LampLinc",
             "2856D2",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -267,7 +313,7 @@ class IPDB:
             None,
             "ICON LampLinc",
             "2856D2B",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -275,7 +321,7 @@ class IPDB:
             0x000037,
             "KeypadLinc Dimmer",
             "2486DWH6",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),
         Product(
             0x01,
@@ -283,7 +329,7 @@ class IPDB:
             None,
             "ICON In-Wall Controller",
             "2886D",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),
         Product(
             0x01,
@@ -291,7 +337,7 @@ class IPDB:
             None,
             "Dimmer Module",
             "2632-422",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -299,10 +345,15 @@ class IPDB:
             0x00001D,
             "KeypadLinc Dimmer",
             "2486DWH8",
-            DimmableLightingControl_KeypadLinc_8,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_8",
         ),
         Product(
-            0x01, 0x0D, None, "SocketLinc", "2454D", DimmableLightingControl_LampLinc
+            0x01,
+            0x0D,
+            None,
+            "SocketLinc",
+            "2454D",
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -310,7 +361,7 @@ class IPDB:
             None,
             "LampLinc Dimmer",
             "2457D2",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -318,7 +369,7 @@ class IPDB:
             None,
             "Dimmer Module",
             "2632-432",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -326,7 +377,7 @@ class IPDB:
             None,
             "Dimmer Module",
             "2632-442",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -334,7 +385,7 @@ class IPDB:
             None,
             "Dimmer Module",
             "2632-522",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -342,7 +393,7 @@ class IPDB:
             0x000032,
             "SwitchLinc Dimmer (Lixar)",
             "2676D-B",
-            DimmableLightingControl,
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
             0x01,
@@ -350,7 +401,7 @@ class IPDB:
             None,
             "ToggleLinc Dimmer",
             "2466DW",
-            DimmableLightingControl_ToggleLinc,
+            "dimmable_lighting_control.DimmableLightingControl_ToggleLinc",
         ),
         Product(
             0x01,
@@ -358,7 +409,7 @@ class IPDB:
             None,
             "ICON SwitchLinc Dimmer In-line Companion",
             "2474D",
-            DimmableLightingControl_InLineLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc01",
         ),
         Product(
             0x01,
@@ -366,7 +417,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2476D",
-            DimmableLightingControl_SwitchLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc01",
         ),
         Product(
             0x01,
@@ -374,7 +425,7 @@ class IPDB:
             None,
             "In-LineLinc Dimmer",
             "2475D",
-            DimmableLightingControl_InLineLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc01",
         ),
         Product(
             0x01,
@@ -382,7 +433,7 @@ class IPDB:
             None,
             "KeypadLinc Dimmer",
             "2486DWH6",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),
         Product(
             0x01,
@@ -390,7 +441,7 @@ class IPDB:
             0x00001D,
             "KeypadLinc Dimmer",
             "2486DWH6",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),
         Product(
             0x01,
@@ -398,7 +449,7 @@ class IPDB:
             None,
             "KeypadLinc Dimmer",
             "2486DWH8",
-            DimmableLightingControl_KeypadLinc_8,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_8",
         ),
         Product(
             0x01,
@@ -406,7 +457,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2476DH",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -414,7 +465,7 @@ class IPDB:
             None,
             "ICON Dimmer Switch",
             "2876D",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -422,7 +473,7 @@ class IPDB:
             0x0000000,
             "ToggleLinc Dimmer",
             "2466DW",
-            DimmableLightingControl_ToggleLinc,
+            "dimmable_lighting_control.DimmableLightingControl_ToggleLinc",
         ),
         Product(
             0x01,
@@ -430,7 +481,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2477D",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -438,7 +489,7 @@ class IPDB:
             0x00006B,
             "SwitchLinc Dimmer",
             "2477D",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -446,7 +497,7 @@ class IPDB:
             None,
             "OutletLinc Dimmer",
             "2472DWH",
-            DimmableLightingControl_OutletLinc,
+            "dimmable_lighting_control.DimmableLightingControl_OutletLinc",
         ),
         Product(
             0x01,
@@ -454,10 +505,15 @@ class IPDB:
             None,
             "LampLinc Dimmer",
             "2457D2X",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
-            0x01, 0x23, None, "LampLinc EZ", "2457D2", DimmableLightingControl_LampLinc
+            0x01,
+            0x23,
+            None,
+            "LampLinc EZ",
+            "2457D2",
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -465,7 +521,7 @@ class IPDB:
             None,
             "SwitchLinc 2-Wire Dimmer",
             "2474DWH",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -473,7 +529,7 @@ class IPDB:
             None,
             "INSTEON Ballast Dimmer",
             "2475DA2",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -481,7 +537,7 @@ class IPDB:
             0x000087,
             "Wall Dimmer",
             "4701",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -489,7 +545,7 @@ class IPDB:
             0x000089,
             "Wall Keypad Dimmer",
             "4703",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),  # KPL
         Product(
             0x01,
@@ -497,7 +553,7 @@ class IPDB:
             0x00008B,
             "Plug-in Dimmer",
             "4705",
-            DimmableLightingControl_LampLinc,
+            "dimmable_lighting_control.DimmableLightingControl_LampLinc",
         ),
         Product(
             0x01,
@@ -505,7 +561,7 @@ class IPDB:
             0x000091,
             "Wall Dimmer - 1000W",
             "4711",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -513,7 +569,7 @@ class IPDB:
             0x000092,
             "In-Line Dimmer",
             "4712",
-            DimmableLightingControl_InLineLinc01,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc01",
         ),
         Product(
             0x01,
@@ -521,16 +577,23 @@ class IPDB:
             0x00009E,
             "SwitchLinc Dimmer",
             "2477DH",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
+        ),
+        Product(
+            0x01,
+            0x2E,
+            None,
+            "FanLinc",
+            "2475F",
+            "dimmable_lighting_control.DimmableLightingControl_FanLinc",
         ),
-        Product(0x01, 0x2E, None, "FanLinc", "2475F", DimmableLightingControl_FanLinc),
         Product(
             0x01,
             0x2F,
             None,
             "KeypadLinc Schedule Timer with Dimmer",
             "2484DST6",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),  # KPL
         Product(
             0x01,
@@ -538,7 +601,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2476D",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -546,7 +609,7 @@ class IPDB:
             None,
             "SwitchLinc Dimmer",
             "2478D",
-            DimmableLightingControl_SwitchLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_SwitchLinc02",
         ),
         Product(
             0x01,
@@ -554,7 +617,7 @@ class IPDB:
             None,
             "In-LineLinc Dimmer",
             "2475DA1",
-            DimmableLightingControl_InLineLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc02",
         ),
         Product(
             0x01,
@@ -562,16 +625,23 @@ class IPDB:
             None,
             "DIN Rail Dimmer",
             "2252-222",
-            DimmableLightingControl_DinRail,
+            "dimmable_lighting_control.DimmableLightingControl_DinRail",
+        ),
+        Product(
+            0x01,
+            0x35,
+            None,
+            "Micro Dimmer",
+            "2442-222",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
-        Product(0x01, 0x35, None, "Micro Dimmer", "2442-222", DimmableLightingControl),
         Product(
             0x01,
             0x36,
             None,
             "DIN Rail Dimmer",
             "2452-422",
-            DimmableLightingControl_DinRail,
+            "dimmable_lighting_control.DimmableLightingControl_DinRail",
         ),
         Product(
             0x01,
@@ -579,20 +649,55 @@ class IPDB:
             None,
             "DIN Rail Dimmer",
             "2452-522",
-            DimmableLightingControl_DinRail,
+            "dimmable_lighting_control.DimmableLightingControl_DinRail",
+        ),
+        Product(
+            0x01,
+            0x38,
+            None,
+            "Micro Dimmer",
+            "2442-422",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x39,
+            None,
+            "Micro Dimmer",
+            "2442-522",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x3A,
+            None,
+            "LED Bulb",
+            "2672-222",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x3B,
+            None,
+            "LED Bulb",
+            "2672-422",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x3C,
+            None,
+            "LED Bulb",
+            "2672-522",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
-        Product(0x01, 0x38, None, "Micro Dimmer", "2442-422", DimmableLightingControl),
-        Product(0x01, 0x39, None, "Micro Dimmer", "2442-522", DimmableLightingControl),
-        Product(0x01, 0x3A, None, "LED Bulb", "2672-222", DimmableLightingControl),
-        Product(0x01, 0x3B, None, "LED Bulb", "2672-422", DimmableLightingControl),
-        Product(0x01, 0x3C, None, "LED Bulb", "2672-522", DimmableLightingControl),
         Product(
             0x01,
             0x3D,
             None,
             "Ballast Dimmer",
             "2446-422",
-            DimmableLightingControl_InLineLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc02",
         ),
         Product(
             0x01,
@@ -600,7 +705,7 @@ class IPDB:
             None,
             "Ballast Dimmer",
             "2446-522",
-            DimmableLightingControl_InLineLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc02",
         ),
         Product(
             0x01,
@@ -608,7 +713,7 @@ class IPDB:
             None,
             "Fixture Dimmer",
             "2447-422",
-            DimmableLightingControl_InLineLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc02",
         ),
         Product(
             0x01,
@@ -616,7 +721,7 @@ class IPDB:
             None,
             "Fixture Dimmer",
             "2447-522",
-            DimmableLightingControl_InLineLinc02,
+            "dimmable_lighting_control.DimmableLightingControl_InLineLinc02",
         ),
         Product(
             0x01,
@@ -624,7 +729,7 @@ class IPDB:
             None,
             "Keypad Dimmer",
             "2334-222",
-            DimmableLightingControl_KeypadLinc_8,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_8",
         ),
         Product(
             0x01,
@@ -632,7 +737,7 @@ class IPDB:
             None,
             "Keypad Dimmer",
             "2334-232",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
         ),
         Product(
             0x01,
@@ -640,34 +745,87 @@ class IPDB:
             None,
             "Keypad with Dimmer",
             "2334-232",
-            DimmableLightingControl_KeypadLinc_6,
+            "dimmable_lighting_control.DimmableLightingControl_KeypadLinc_6",
+        ),
+        Product(
+            0x01,
+            0x49,
+            None,
+            "LED PAR38 Bulb",
+            "2674-222",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x4A,
+            None,
+            "LED PAR38 Bulb",
+            "2674-422",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
-            0x01, 0x49, None, "LED PAR38 Bulb", "2674-222", DimmableLightingControl
+            0x01,
+            0x4B,
+            None,
+            "LED PAR38 Bulb",
+            "2672-522",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
-            0x01, 0x4A, None, "LED PAR38 Bulb", "2674-422", DimmableLightingControl
+            0x01,
+            0x4C,
+            None,
+            "LED Bulb",
+            "2672-522",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
-            0x01, 0x4B, None, "LED PAR38 Bulb", "2672-522", DimmableLightingControl
+            0x01,
+            0x4D,
+            None,
+            "LED Bulb",
+            "2672-522",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
-        Product(0x01, 0x4C, None, "LED Bulb", "2672-522", DimmableLightingControl),
-        Product(0x01, 0x4D, None, "LED Bulb", "2672-522", DimmableLightingControl),
         Product(
-            0x01, 0x4E, None, "LED PAR38 Bulb", "2674-422", DimmableLightingControl
+            0x01,
+            0x4E,
+            None,
+            "LED PAR38 Bulb",
+            "2674-422",
+            "dimmable_lighting_control.DimmableLightingControl",
         ),
         Product(
-            0x01, 0x4F, None, "LED PAR38 Bulb", "2672-522", DimmableLightingControl
+            0x01,
+            0x4F,
+            None,
+            "LED PAR38 Bulb",
+            "2672-522",
+            "dimmable_lighting_control.DimmableLightingControl",
+        ),
+        Product(
+            0x01,
+            0x57,
+            None,
+            "i3 Paddle",
+            "PS01",
+            "dimmable_lighting_control.DimmableLightingControl_Dial",
+        ),
+        Product(
+            0x01,
+            0x58,
+            None,
+            "i3 Dial",
+            "DS01",
+            "dimmable_lighting_control.DimmableLightingControl_Dial",
         ),
-        Product(0x01, 0x57, None, "i3 Paddle", "PS01", DimmableLightingControl_Dial),
-        Product(0x01, 0x58, None, "i3 Dial", "DS01", DimmableLightingControl_Dial),
         Product(
             0x01,
             0x59,
             None,
             "i3 Keypad (4 Button)",
             "KP014",
-            DimmableLightingControl_I3_KeypadLinc_4,
+            "dimmable_lighting_control.DimmableLightingControl_I3_KeypadLinc_4",
         ),
         Product(
             0x02,
@@ -675,7 +833,7 @@ class IPDB:
             None,
             "Generic Switched Lighting Control",
             "",
-            SwitchedLightingControl,
+            "switched_lighting_control.SwitchedLightingControl",
         ),
         Product(
             0x02,
@@ -683,7 +841,7 @@ class IPDB:
             None,
             "KeypadLinc On/Off",
             "2486SWH8",
-            SwitchedLightingControl_KeypadLinc_8,
+            "switched_lighting_control.SwitchedLightingControl_KeypadLinc_8",
         ),
         Product(
             0x02,
@@ -691,16 +849,23 @@ class IPDB:
             None,
             "Outdoor ApplianceLinc",
             "2456S3E",
-            SwitchedLightingControl_ApplianceLinc,
+            "switched_lighting_control.SwitchedLightingControl_ApplianceLinc",
+        ),
+        Product(
+            0x02,
+            0x07,
+            None,
+            "TimerLinc",
+            "2456S3T",
+            "switched_lighting_control.SwitchedLightingControl",
         ),
-        Product(0x02, 0x07, None, "TimerLinc", "2456S3T", SwitchedLightingControl),
         Product(
             0x02,
             0x08,
             0x000023,
             "OutletLinc Relay",
             "2473SWH",
-            SwitchedLightingControl_OutletLinc,
+            "switched_lighting_control.SwitchedLightingControl_OutletLinc",
         ),
         Product(
             0x02,
@@ -708,7 +873,7 @@ class IPDB:
             None,
             "ApplianceLinc",
             "2456S3",
-            SwitchedLightingControl_ApplianceLinc,
+            "switched_lighting_control.SwitchedLightingControl_ApplianceLinc",
         ),
         Product(
             0x02,
@@ -716,7 +881,7 @@ class IPDB:
             None,
             "SwitchLinc Relay",
             "2476S",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -724,7 +889,7 @@ class IPDB:
             None,
             "ICON On/Off Switch",
             "2876S",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -732,7 +897,7 @@ class IPDB:
             None,
             "ICON Appliance Module",
             "2856S3B",
-            SwitchedLightingControl_ApplianceLinc,
+            "switched_lighting_control.SwitchedLightingControl_ApplianceLinc",
         ),
         Product(
             0x02,
@@ -740,7 +905,7 @@ class IPDB:
             None,
             "ToggleLinc On/Off",
             "2466SW",
-            SwitchedLightingControl_ToggleLinc,
+            "switched_lighting_control.SwitchedLightingControl_ToggleLinc",
         ),
         Product(
             0x02,
@@ -748,7 +913,7 @@ class IPDB:
             None,
             "SwitchLinc Relay Countdown Timer",
             "2476ST",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -756,7 +921,7 @@ class IPDB:
             0x000036,
             "KeypadLinc On/Off",
             "2486SWH6",
-            SwitchedLightingControl_KeypadLinc_6,
+            "switched_lighting_control.SwitchedLightingControl_KeypadLinc_6",
         ),
         Product(
             0x02,
@@ -764,16 +929,23 @@ class IPDB:
             0x00001B,
             "In-LineLinc Relay",
             "2475S",
-            SwitchedLightingControl_InLineLinc01,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc01",
+        ),
+        Product(
+            0x02,
+            0x11,
+            None,
+            "EZSwitch30",
+            "",
+            "switched_lighting_control.SwitchedLightingControl",
         ),
-        Product(0x02, 0x11, None, "EZSwitch30", "", SwitchedLightingControl),
         Product(
             0x02,
             0x12,
             0x00003E,
             "ICON In-LineLinc Relay",
             "2474S",
-            SwitchedLightingControl_InLineLinc01,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc01",
         ),
         Product(
             0x02,
@@ -781,7 +953,7 @@ class IPDB:
             None,
             "Icon SwitchLinc Relay (Lixar)",
             "2676R-B",
-            SwitchedLightingControl,
+            "switched_lighting_control.SwitchedLightingControl",
         ),
         Product(
             0x02,
@@ -789,7 +961,7 @@ class IPDB:
             None,
             "In-LineLinc Relay with Sense",
             "2475S2",
-            SwitchedLightingControl_InLineLinc01,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc01",
         ),
         Product(
             0x02,
@@ -797,7 +969,7 @@ class IPDB:
             None,
             "SwitchLinc Relay with Sense",
             "2476S",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -805,7 +977,7 @@ class IPDB:
             None,
             "ICON On/Off Switch",
             "2876S",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -813,7 +985,7 @@ class IPDB:
             None,
             "ICON Appliance Module",
             "2856S3B",
-            SwitchedLightingControl_ApplianceLinc,
+            "switched_lighting_control.SwitchedLightingControl_ApplianceLinc",
         ),
         Product(
             0x02,
@@ -821,7 +993,7 @@ class IPDB:
             0x000060,
             "SwitchLinc 220V Relay",
             "2494S220",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -829,7 +1001,7 @@ class IPDB:
             None,
             "SwitchLinc 220V Relay",
             "2494S220",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -837,7 +1009,7 @@ class IPDB:
             0x0000000,
             "ToggleLinc On/Off",
             "2466SW",
-            SwitchedLightingControl_ToggleLinc,
+            "switched_lighting_control.SwitchedLightingControl_ToggleLinc",
         ),
         Product(
             0x02,
@@ -845,7 +1017,7 @@ class IPDB:
             None,
             "SwitchLinc Relay",
             "2476S",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -853,7 +1025,7 @@ class IPDB:
             None,
             "KeypadLinc On/Off",
             "2487S",
-            SwitchedLightingControl_KeypadLinc_6,
+            "switched_lighting_control.SwitchedLightingControl_KeypadLinc_6",
         ),  # KPL
         Product(
             0x02,
@@ -861,10 +1033,15 @@ class IPDB:
             None,
             "In-LineLinc On/Off",
             "2475SDB",
-            SwitchedLightingControl_InLineLinc01,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc01",
         ),
         Product(
-            0x02, 0x20, 0x00008A, "Wall Keypad Switch", "4704", SwitchedLightingControl
+            0x02,
+            0x20,
+            0x00008A,
+            "Wall Keypad Switch",
+            "4704",
+            "switched_lighting_control.SwitchedLightingControl",
         ),  # KPL
         Product(
             0x02,
@@ -872,7 +1049,7 @@ class IPDB:
             0x00008C,
             "Outlet Switch",
             "4707",
-            SwitchedLightingControl_OutletLinc,
+            "switched_lighting_control.SwitchedLightingControl_OutletLinc",
         ),
         Product(
             0x02,
@@ -880,7 +1057,7 @@ class IPDB:
             0x000093,
             "In-Line Switch",
             "4713",
-            SwitchedLightingControl_InLineLinc01,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc01",
         ),
         Product(
             0x02,
@@ -888,7 +1065,7 @@ class IPDB:
             0x000088,
             "Wall Switch",
             "4702",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -896,7 +1073,7 @@ class IPDB:
             0x0000A1,
             "Wall Keypad Switch 277V",
             "4102",
-            SwitchedLightingControl,
+            "switched_lighting_control.SwitchedLightingControl",
         ),  # KPL
         Product(
             0x02,
@@ -904,7 +1081,7 @@ class IPDB:
             None,
             "Keypad Countdown Timer 8-button",
             "2484SWH8",
-            SwitchedLightingControl,
+            "switched_lighting_control.SwitchedLightingControl",
         ),
         Product(
             0x02,
@@ -912,7 +1089,7 @@ class IPDB:
             None,
             "KeypadLinc Schedule Timer On/Off Switch",
             "2485SWH6",
-            SwitchedLightingControl,
+            "switched_lighting_control.SwitchedLightingControl",
         ),
         Product(
             0x02,
@@ -920,7 +1097,7 @@ class IPDB:
             None,
             "SwitchLinc Relay Countdown Timer",
             "2476ST",
-            SwitchedLightingControl_SwitchLinc01,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc01",
         ),
         Product(
             0x02,
@@ -928,7 +1105,7 @@ class IPDB:
             None,
             "SwitchLinc Relay (Dual-Band)",
             "2477S",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
         ),
         Product(
             0x02,
@@ -936,7 +1113,7 @@ class IPDB:
             None,
             "In-LineLinc On/Off",
             "2475SDB-50",
-            SwitchedLightingControl_InLineLinc02,
+            "switched_lighting_control.SwitchedLightingControl_InLineLinc02",
         ),
         Product(
             0x02,
@@ -944,7 +1121,7 @@ class IPDB:
             None,
             "KeypadLinc On/Off",
             "2487S",
-            SwitchedLightingControl_KeypadLinc_6,
+            "switched_lighting_control.SwitchedLightingControl_KeypadLinc_6",
         ),
         Product(
             0x02,
@@ -952,7 +1129,7 @@ class IPDB:
             None,
             "On/Off Module",
             "2633-422",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
         ),
         Product(
             0x02,
@@ -960,26 +1137,47 @@ class IPDB:
             None,
             "DIN Rail On/Off",
             "2453-222",
-            SwitchedLightingControl_DinRail,
+            "switched_lighting_control.SwitchedLightingControl_DinRail",
+        ),
+        Product(
+            0x02,
+            0x2F,
+            None,
+            "Micro On/Off",
+            "2443-222",
+            "switched_lighting_control.SwitchedLightingControl",
         ),
-        Product(0x02, 0x2F, None, "Micro On/Off", "2443-222", SwitchedLightingControl),
         Product(
             0x02,
             0x30,
             None,
             "On/Off Module",
             "2633-432",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
+        ),
+        Product(
+            0x02,
+            0x31,
+            None,
+            "Micro On/Off",
+            "2443-422",
+            "switched_lighting_control.SwitchedLightingControl",
+        ),
+        Product(
+            0x02,
+            0x32,
+            None,
+            "Micro On/Off",
+            "2443-522",
+            "switched_lighting_control.SwitchedLightingControl",
         ),
-        Product(0x02, 0x31, None, "Micro On/Off", "2443-422", SwitchedLightingControl),
-        Product(0x02, 0x32, None, "Micro On/Off", "2443-522", SwitchedLightingControl),
         Product(
             0x02,
             0x33,
             None,
             "DIN Rail On/Off",
             "2453-422",
-            SwitchedLightingControl_DinRail,
+            "switched_lighting_control.SwitchedLightingControl_DinRail",
         ),
         Product(
             0x02,
@@ -987,7 +1185,7 @@ class IPDB:
             None,
             "DIN Rail On/Off",
             "2453-522",
-            SwitchedLightingControl_DinRail,
+            "switched_lighting_control.SwitchedLightingControl_DinRail",
         ),
         Product(
             0x02,
@@ -995,7 +1193,7 @@ class IPDB:
             None,
             "On/Off Module",
             "2633-442",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
         ),
         Product(
             0x02,
@@ -1003,7 +1201,7 @@ class IPDB:
             None,
             "On/Off Module",
             "2633-522",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
         ),
         Product(
             0x02,
@@ -1011,7 +1209,7 @@ class IPDB:
             None,
             "On/Off Module",
             "2635-222",
-            SwitchedLightingControl_SwitchLinc02,
+            "switched_lighting_control.SwitchedLightingControl_SwitchLinc02",
         ),
         Product(
             0x02,
@@ -1019,7 +1217,7 @@ class IPDB:
             None,
             "On/Off Outdoor Module",
             "2634-222",
-            SwitchedLightingControl_ApplianceLinc,
+            "switched_lighting_control.SwitchedLightingControl_ApplianceLinc",
         ),
         Product(
             0x02,
@@ -1027,7 +1225,7 @@ class IPDB:
             None,
             "On/Off Outlet",
             "2663-222",
-            SwitchedLightingControl_OnOffOutlet,
+            "switched_lighting_control.SwitchedLightingControl_OnOffOutlet",
         ),
         Product(
             0x02,
@@ -1035,73 +1233,108 @@ class IPDB:
             None,
             "I3 Outlet",
             "WR01",
-            SwitchedLightingControl_I3Outlet,
-        ),
-        Product(0x03, None, None, "Generic Network Bridge Controller", "", PLM),
-        Product(0x03, 0x01, None, "PowerLinc Serial", "2414S", PLM),
-        Product(0x03, 0x02, None, "PowerLinc USB", "2414U", PLM),
-        Product(0x03, 0x03, None, "ICON PLC Serial", "", PLM),
-        Product(0x03, 0x04, None, "ICON PLC USB", "", PLM),
-        Product(0x03, 0x05, 0x00000C, "PowerLinc Serial Modem", "2412S", PLM),
-        Product(0x03, 0x06, None, "IRLinc Receiver", "2411R", PLM),
-        Product(0x03, 0x07, None, "IRLinc Transmitter", "2411T", PLM),
-        Product(0x03, 0x0B, 0x000030, "PowerLinc USB Modem", "2412U", PLM),
-        Product(0x03, 0x0D, 0x000035, "SimpleHomeNet EZX10RF", "", PLM),
-        Product(0x03, 0x0F, 0x00003B, "EZX10IR", "", PLM),
-        Product(0x03, 0x10, None, "SmartLinc", "2412N", Hub),
-        Product(0x03, 0x11, None, "PowerLinc Serial Modem", "2413S", PLM),
-        Product(0x03, 0x13, 0x000030, "PowerLinc USB Modem", "2412UH", PLM),
-        Product(0x03, 0x14, 0x00000C, "PowerLinc Serial Modem", "2412SH", PLM),
-        Product(0x03, 0x15, None, "PowerLinc USB Modem", "2413U", PLM),
-        Product(0x03, 0x18, None, "Central Controller", "2243-222", Hub),
-        Product(0x03, 0x19, None, "PowerLinc Serial Modem", "2413SH", PLM),
-        Product(0x03, 0x1A, None, "PowerLinc USB Modem", "2413UH", PLM),
-        Product(0x03, 0x1B, None, "iGateway", "2423A4", PLM),
-        Product(0x03, 0x1F, 0x00007E, "USB Adapter", "2448A7", PLM),
-        Product(0x03, 0x20, 0x00007E, "USB Adapter", "2448A7", PLM),
-        Product(0x03, 0x21, 0x00008E, "USB Adapter", "2448A7H", PLM),
-        Product(0x03, 0x22, 0x00008F, "Central Controller Interface", "4706A", PLM),
-        Product(0x03, 0x23, 0x00008E, "USB Adapter", "2448A7H", PLM),
-        Product(0x03, 0x24, 0x0000A2, "TouchLinc", "2448A7T", PLM),
-        Product(0x03, 0x27, 0x0000A2, "TouchLinc", "2448A7T", PLM),
-        Product(0x03, 0x2B, None, "Hub", "2242-222", Hub),
-        Product(0x03, 0x2C, None, "Central Controller", "2243-422", Hub),
-        Product(0x03, 0x2C, None, "Central Controller", "2243-442", Hub),
-        Product(0x03, 0x2D, None, "Central Controller", "2243-522", Hub),
-        Product(0x03, 0x2E, None, "Hub", "2242-422", Hub),
-        Product(0x03, 0x2F, None, "Hub", "2242-522", Hub),
-        Product(0x03, 0x30, None, "Hub", "2242-442", Hub),
-        Product(0x03, 0x31, None, "Hub", "2242-232", Hub),
-        Product(0x03, 0x32, None, "Hub", "2242-222", Hub),
-        Product(0x03, 0x33, None, "Hub", "2245-555", Hub),
-        Product(0x03, 0x34, None, "Hub", "2245-442", Hub),
-        Product(0x03, 0x35, None, "Hub", "2245-422", Hub),
-        Product(0x03, 0x36, None, "Hub", "2245-522", Hub),
-        Product(0x03, 0x37, None, "Hub", "", Hub),
-        Product(0x04, None, None, "Generic Irrigation Controler", "", UnknownDevice),
+            "switched_lighting_control.SwitchedLightingControl_I3Outlet",
+        ),
+        Product(0x03, None, None, "Generic Network Bridge Controller", "", "plm.PLM"),
+        Product(0x03, 0x01, None, "PowerLinc Serial", "2414S", "plm.PLM"),
+        Product(0x03, 0x02, None, "PowerLinc USB", "2414U", "plm.PLM"),
+        Product(0x03, 0x03, None, "ICON PLC Serial", "", "plm.PLM"),
+        Product(0x03, 0x04, None, "ICON PLC USB", "", "plm.PLM"),
+        Product(0x03, 0x05, 0x00000C, "PowerLinc Serial Modem", "2412S", "plm.PLM"),
+        Product(0x03, 0x06, None, "IRLinc Receiver", "2411R", "plm.PLM"),
+        Product(0x03, 0x07, None, "IRLinc Transmitter", "2411T", "plm.PLM"),
+        Product(0x03, 0x0B, 0x000030, "PowerLinc USB Modem", "2412U", "plm.PLM"),
+        Product(0x03, 0x0D, 0x000035, "SimpleHomeNet EZX10RF", "", "plm.PLM"),
+        Product(0x03, 0x0F, 0x00003B, "EZX10IR", "", "plm.PLM"),
+        Product(0x03, 0x10, None, "SmartLinc", "2412N", "hub.Hub"),
+        Product(0x03, 0x11, None, "PowerLinc Serial Modem", "2413S", "plm.PLM"),
+        Product(0x03, 0x13, 0x000030, "PowerLinc USB Modem", "2412UH", "plm.PLM"),
+        Product(0x03, 0x14, 0x00000C, "PowerLinc Serial Modem", "2412SH", "plm.PLM"),
+        Product(0x03, 0x15, None, "PowerLinc USB Modem", "2413U", "plm.PLM"),
+        Product(0x03, 0x18, None, "Central Controller", "2243-222", "hub.Hub"),
+        Product(0x03, 0x19, None, "PowerLinc Serial Modem", "2413SH", "plm.PLM"),
+        Product(0x03, 0x1A, None, "PowerLinc USB Modem", "2413UH", "plm.PLM"),
+        Product(0x03, 0x1B, None, "iGateway", "2423A4", "plm.PLM"),
+        Product(0x03, 0x1F, 0x00007E, "USB Adapter", "2448A7", "plm.PLM"),
+        Product(0x03, 0x20, 0x00007E, "USB Adapter", "2448A7", "plm.PLM"),
+        Product(0x03, 0x21, 0x00008E, "USB Adapter", "2448A7H", "plm.PLM"),
+        Product(
+            0x03, 0x22, 0x00008F, "Central Controller Interface", "4706A", "plm.PLM"
+        ),
+        Product(0x03, 0x23, 0x00008E, "USB Adapter", "2448A7H", "plm.PLM"),
+        Product(0x03, 0x24, 0x0000A2, "TouchLinc", "2448A7T", "plm.PLM"),
+        Product(0x03, 0x27, 0x0000A2, "TouchLinc", "2448A7T", "plm.PLM"),
+        Product(0x03, 0x2B, None, "Hub", "2242-222", "hub.Hub"),
+        Product(0x03, 0x2C, None, "Central Controller", "2243-422", "hub.Hub"),
+        Product(0x03, 0x2C, None, "Central Controller", "2243-442", "hub.Hub"),
+        Product(0x03, 0x2D, None, "Central Controller", "2243-522", "hub.Hub"),
+        Product(0x03, 0x2E, None, "Hub", "2242-422", "hub.Hub"),
+        Product(0x03, 0x2F, None, "Hub", "2242-522", "hub.Hub"),
+        Product(0x03, 0x30, None, "Hub", "2242-442", "hub.Hub"),
+        Product(0x03, 0x31, None, "Hub", "2242-232", "hub.Hub"),
+        Product(0x03, 0x32, None, "Hub", "2242-222", "hub.Hub"),
+        Product(0x03, 0x33, None, "Hub", "2245-555", "hub.Hub"),
+        Product(0x03, 0x34, None, "Hub", "2245-442", "hub.Hub"),
+        Product(0x03, 0x35, None, "Hub", "2245-422", "hub.Hub"),
+        Product(0x03, 0x36, None, "Hub", "2245-522", "hub.Hub"),
+        Product(0x03, 0x37, None, "Hub", "", "hub.Hub"),
+        Product(
+            0x04,
+            None,
+            None,
+            "Generic Irrigation Controler",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
         Product(
             0x04,
             0x00,
             0x000001,
             "Compacta EZRain Sprinkler Controller",
             "31270",
-            UnknownDevice,
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x05,
+            None,
+            None,
+            "Generic Climate Controller",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x05,
+            0x00,
+            None,
+            "Broan SMSC080 Exhaust Fan",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(0x05, 0x01, 0x000002, "EZTherm", "", "unknown_device.UnknownDevice"),
+        Product(
+            0x05,
+            0x02,
+            None,
+            "Broan SMSC110 Exhaust Fan",
+            "",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0x05, None, None, "Generic Climate Controller", "", UnknownDevice),
-        Product(0x05, 0x00, None, "Broan SMSC080 Exhaust Fan", "", UnknownDevice),
-        Product(0x05, 0x01, 0x000002, "EZTherm", "", UnknownDevice),
-        Product(0x05, 0x02, None, "Broan SMSC110 Exhaust Fan", "", UnknownDevice),
         Product(
             0x05,
             0x03,
             0x00001F,
             "Thermostat Adapter",
             "2441V",
-            ClimateControl_Thermostat,
+            "climate_control.ClimateControl_Thermostat",
         ),
-        Product(0x05, 0x04, 0x000024, "EZTherm", "", UnknownDevice),
+        Product(0x05, 0x04, 0x000024, "EZTherm", "", "unknown_device.UnknownDevice"),
         Product(
-            0x05, 0x05, 0x000038, "Broan, Venmar, BEST Rangehoods", "", UnknownDevice
+            0x05,
+            0x05,
+            0x000038,
+            "Broan, Venmar, BEST Rangehoods",
+            "",
+            "unknown_device.UnknownDevice",
         ),
         Product(
             0x05,
@@ -1109,36 +1342,71 @@ class IPDB:
             None,
             "Wireless Thermostat",
             "2441ZTH",
-            ClimateControl_WirelessThermostat,
+            "climate_control.ClimateControl_WirelessThermostat",
+        ),
+        Product(
+            0x05,
+            0x08,
+            None,
+            "Thermostat",
+            "2441TH",
+            "climate_control.ClimateControl_Thermostat",
+        ),
+        Product(
+            0x05,
+            0x09,
+            0x000094,
+            "7 Day Thermostat",
+            "4715",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0x05, 0x08, None, "Thermostat", "2441TH", ClimateControl_Thermostat),
-        Product(0x05, 0x09, 0x000094, "7 Day Thermostat", "4715", UnknownDevice),
         Product(
             0x05,
             0x0A,
             None,
             "Wireless Thermostat",
             "2441ZTH",
-            ClimateControl_WirelessThermostat,
+            "climate_control.ClimateControl_WirelessThermostat",
+        ),
+        Product(
+            0x05,
+            0x0B,
+            None,
+            "Thermostat",
+            "2441TH",
+            "climate_control.ClimateControl_Thermostat",
         ),
-        Product(0x05, 0x0B, None, "Thermostat", "2441TH", ClimateControl_Thermostat),
         Product(
             0x05,
             0x0E,
             None,
             "Integrated Remote Control Thermostat",
             "2491T1E",
-            UnknownDevice,
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x05,
+            0x0F,
+            None,
+            "Thermostat",
+            "2732-422",
+            "climate_control.ClimateControl_Thermostat",
+        ),
+        Product(
+            0x05,
+            0x10,
+            None,
+            "Thermostat",
+            "2732-522",
+            "climate_control.ClimateControl_Thermostat",
         ),
-        Product(0x05, 0x0F, None, "Thermostat", "2732-422", ClimateControl_Thermostat),
-        Product(0x05, 0x10, None, "Thermostat", "2732-522", ClimateControl_Thermostat),
         Product(
             0x05,
             0x11,
             None,
             "Wireless Thermostat",
             "2732-432",
-            ClimateControl_WirelessThermostat,
+            "climate_control.ClimateControl_WirelessThermostat",
         ),
         Product(
             0x05,
@@ -1146,7 +1414,7 @@ class IPDB:
             None,
             "Wireless Thermostat",
             "2732-532",
-            ClimateControl_WirelessThermostat,
+            "climate_control.ClimateControl_WirelessThermostat",
         ),
         Product(
             0x05,
@@ -1154,7 +1422,7 @@ class IPDB:
             None,
             "Thermostat Heat Pump",
             "2732-232",
-            ClimateControl_Thermostat,
+            "climate_control.ClimateControl_Thermostat",
         ),
         Product(
             0x05,
@@ -1162,7 +1430,7 @@ class IPDB:
             None,
             "Thermostat Heat Pump",
             "2732-432",
-            ClimateControl_Thermostat,
+            "climate_control.ClimateControl_Thermostat",
         ),
         Product(
             0x05,
@@ -1170,10 +1438,15 @@ class IPDB:
             None,
             "Thermostat Heat Pump",
             "2732-532",
-            ClimateControl_Thermostat,
+            "climate_control.ClimateControl_Thermostat",
         ),
         Product(
-            0x05, 0x16, None, "Insteon Thermostat", "2441TH", ClimateControl_Thermostat
+            0x05,
+            0x16,
+            None,
+            "Insteon Thermostat",
+            "2441TH",
+            "climate_control.ClimateControl_Thermostat",
         ),
         Product(
             0x05,
@@ -1181,7 +1454,7 @@ class IPDB:
             None,
             "Insteon Thermostat",
             "2732-422",
-            ClimateControl_Thermostat,
+            "climate_control.ClimateControl_Thermostat",
         ),
         Product(
             0x05,
@@ -1189,41 +1462,158 @@ class IPDB:
             None,
             "Insteon Thermostat",
             "2732-522",
-            ClimateControl_Thermostat,
-        ),
-        Product(0x06, None, None, "Generic Pool Controller", "", UnknownDevice),
-        Product(0x06, 0x00, 0x000003, "EZPool", "", UnknownDevice),
-        Product(0x07, None, None, "Generic Sensor Actuator", "", SensorsActuators),
-        Product(0x07, 0x00, None, "I/O Linc", "2450", SensorsActuators_IOLink),
-        Product(0x07, 0x01, 0x000004, "EZSns1W", "", SensorsActuators),
-        Product(0x07, 0x02, 0x0000012, "EZIO8T I/O Module", "", SensorsActuators),
-        Product(0x07, 0x03, 0x0000005, "EZIO2X4", "", SensorsActuators),
-        Product(0x07, 0x04, 0x0000013, "EZIO8SA", "", SensorsActuators),
-        Product(0x07, 0x05, 0x0000014, "EZSnsRF", "", SensorsActuators),
-        Product(0x07, 0x06, 0x0000015, "EZISnsRf", "", SensorsActuators),
-        Product(0x07, 0x07, 0x0000014, "EZIO6I", "", SensorsActuators),
-        Product(0x07, 0x08, 0x0000014, "EZIO4O", "", SensorsActuators),
-        Product(0x07, 0x09, 0x0000000, "SynchroLinc", "2423A5", SensorsActuators),
-        Product(0x07, 0x0D, None, "I/O Linc", "2450-50-60", SensorsActuators_IOLink),
-        Product(0x07, 0x0E, None, "I/O Module", "2248-222", SensorsActuators),
-        Product(0x07, 0x0F, None, "I/O Module", "2248-422", SensorsActuators),
-        Product(0x07, 0x10, None, "I/O Module", "2248-442", SensorsActuators),
-        Product(0x07, 0x11, None, "I/O Module", "2248-522", SensorsActuators),
-        Product(
-            0x09, None, None, "Generic Energy Management Controller", "", UnknownDevice
-        ),
-        Product(0x09, 0x00, 0x0000006, "EZEnergy", "", UnknownDevice),
-        Product(0x09, 0x01, 0x0000020, "OnSitePro Leak Detector", "", UnknownDevice),
-        Product(0x09, 0x02, 0x0000021, "OnSitePro Control Valve", "", UnknownDevice),
-        Product(0x09, 0x07, 0x0000000, "iMeter Solo", "2423A1", UnknownDevice),
-        Product(0x09, 0x07, 0x000006C, "iMeter Solo", "2423A1", UnknownDevice),
+            "climate_control.ClimateControl_Thermostat",
+        ),
+        Product(
+            0x06,
+            None,
+            None,
+            "Generic Pool Controller",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(0x06, 0x00, 0x000003, "EZPool", "", "unknown_device.UnknownDevice"),
+        Product(
+            0x07,
+            None,
+            None,
+            "Generic Sensor Actuator",
+            "",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07,
+            0x00,
+            None,
+            "I/O Linc",
+            "2450",
+            "sensors_actuators.SensorsActuators_IOLink",
+        ),
+        Product(
+            0x07, 0x01, 0x000004, "EZSns1W", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07,
+            0x02,
+            0x0000012,
+            "EZIO8T I/O Module",
+            "",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07, 0x03, 0x0000005, "EZIO2X4", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07, 0x04, 0x0000013, "EZIO8SA", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07, 0x05, 0x0000014, "EZSnsRF", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07, 0x06, 0x0000015, "EZISnsRf", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07, 0x07, 0x0000014, "EZIO6I", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07, 0x08, 0x0000014, "EZIO4O", "", "sensors_actuators.SensorsActuators"
+        ),
+        Product(
+            0x07,
+            0x09,
+            0x0000000,
+            "SynchroLinc",
+            "2423A5",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07,
+            0x0D,
+            None,
+            "I/O Linc",
+            "2450-50-60",
+            "sensors_actuators.SensorsActuators_IOLink",
+        ),
+        Product(
+            0x07,
+            0x0E,
+            None,
+            "I/O Module",
+            "2248-222",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07,
+            0x0F,
+            None,
+            "I/O Module",
+            "2248-422",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07,
+            0x10,
+            None,
+            "I/O Module",
+            "2248-442",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x07,
+            0x11,
+            None,
+            "I/O Module",
+            "2248-522",
+            "sensors_actuators.SensorsActuators",
+        ),
+        Product(
+            0x09,
+            None,
+            None,
+            "Generic Energy Management Controller",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(0x09, 0x00, 0x0000006, "EZEnergy", "", "unknown_device.UnknownDevice"),
+        Product(
+            0x09,
+            0x01,
+            0x0000020,
+            "OnSitePro Leak Detector",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x09,
+            0x02,
+            0x0000021,
+            "OnSitePro Control Valve",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x09,
+            0x07,
+            0x0000000,
+            "iMeter Solo",
+            "2423A1",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x09,
+            0x07,
+            0x000006C,
+            "iMeter Solo",
+            "2423A1",
+            "unknown_device.UnknownDevice",
+        ),
         Product(
             0x09,
             0x0A,
             0x0000000,
             "220V/240V 30 AMP Load Controller Normally Open",
             "2477SA1",
-            EnergyManagement_LoadController,
+            "energy_management.EnergyManagement_LoadController",
         ),
         Product(
             0x09,
@@ -1231,25 +1621,69 @@ class IPDB:
             0x0000000,
             "220V/240V 30 AMP Load Controller Normally Closed",
             "2477SA2",
-            EnergyManagement_LoadController,
+            "energy_management.EnergyManagement_LoadController",
+        ),
+        Product(
+            0x09, 0x0D, None, "Energy Display", "2441TH", "unknown_device.UnknownDevice"
         ),
-        Product(0x09, 0x0D, None, "Energy Display", "2441TH", UnknownDevice),
-        Product(0x09, 0x10, 0x0000090, "Network Hub", "4700", UnknownDevice),
-        Product(0x0E, None, None, "Generic Window Coverings", "", UnknownDevice),
         Product(
-            0x0E, 0x00, 0x000000B, "Somfy Drape Controller RF Bridge", "", UnknownDevice
+            0x09, 0x10, 0x0000090, "Network Hub", "4700", "unknown_device.UnknownDevice"
+        ),
+        Product(
+            0x0E,
+            None,
+            None,
+            "Generic Window Coverings",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x0E,
+            0x00,
+            0x000000B,
+            "Somfy Drape Controller RF Bridge",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x0E,
+            0x01,
+            0x0000000,
+            "Micro Open/Close",
+            "2444-222",
+            "window_coverings.WindowCovering",
+        ),
+        Product(
+            0x0E,
+            0x02,
+            0x0000000,
+            "Micro Open/Close",
+            "2444-422",
+            "window_coverings.WindowCovering",
+        ),
+        Product(
+            0x0E,
+            0x03,
+            0x0000000,
+            "Micro Open/Close",
+            "2444-522",
+            "window_coverings.WindowCovering",
+        ),
+        Product(
+            0x0F,
+            None,
+            None,
+            "Generic Plumbing Controller",
+            "",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0x0E, 0x01, 0x0000000, "Micro Open/Close", "2444-222", WindowCovering),
-        Product(0x0E, 0x02, 0x0000000, "Micro Open/Close", "2444-422", WindowCovering),
-        Product(0x0E, 0x03, 0x0000000, "Micro Open/Close", "2444-522", WindowCovering),
-        Product(0x0F, None, None, "Generic Plumbing Controller", "", UnknownDevice),
         Product(
             0x0F,
             0x00,
             0x000000E,
             "Weiland Doors Central Drive and Controller",
             "",
-            UnknownDevice,
+            "unknown_device.UnknownDevice",
         ),
         Product(
             0x0F,
@@ -1257,27 +1691,64 @@ class IPDB:
             0x000000F,
             "Weiland Doors Secondary Central Drive",
             "",
-            UnknownDevice,
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x0F,
+            0x02,
+            0x0000010,
+            "Weiland Doors Assist Drive",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x0F,
+            0x03,
+            0x0000011,
+            "Weiland Doors Elevation Drive",
+            "",
+            "unknown_device.UnknownDevice",
+        ),
+        Product(
+            0x0F,
+            0x04,
+            0x0000000,
+            "GarageHawk Garage Unit",
+            "",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0x0F, 0x02, 0x0000010, "Weiland Doors Assist Drive", "", UnknownDevice),
         Product(
-            0x0F, 0x03, 0x0000011, "Weiland Doors Elevation Drive", "", UnknownDevice
+            0x0F,
+            0x05,
+            0x0000000,
+            "GarageHawk Remote Unit",
+            "",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0x0F, 0x04, 0x0000000, "GarageHawk Garage Unit", "", UnknownDevice),
-        Product(0x0F, 0x05, 0x0000000, "GarageHawk Remote Unit", "", UnknownDevice),
         Product(
-            0x0F, 0x06, 0x0000000, "MorningLinc", "2458A1", AccessControl_Morningstar
+            0x0F,
+            0x06,
+            0x0000000,
+            "MorningLinc",
+            "2458A1",
+            "access_control.AccessControl_Morningstar",
+        ),
+        Product(
+            0x0F, 0x07, None, "Deadbolt", "2863-222", "unknown_device.UnknownDevice"
+        ),
+        Product(
+            0x0F, 0x08, None, "Deadbolt", "2863-422", "unknown_device.UnknownDevice"
+        ),
+        Product(
+            0x0F, 0x09, None, "Deadbolt", "2863-522", "unknown_device.UnknownDevice"
         ),
-        Product(0x0F, 0x07, None, "Deadbolt", "2863-222", UnknownDevice),
-        Product(0x0F, 0x08, None, "Deadbolt", "2863-422", UnknownDevice),
-        Product(0x0F, 0x09, None, "Deadbolt", "2863-522", UnknownDevice),
         Product(
             0x0F,
             0x0A,
             0x0000000,
             "Lock Controller",
             "2862-222",
-            AccessControl_Morningstar,
+            "access_control.AccessControl_Morningstar",
         ),
         Product(
             0x10,
@@ -1285,7 +1756,7 @@ class IPDB:
             None,
             "Generic Security, Heath and Safety Device",
             "",
-            SecurityHealthSafety,
+            "security_health_safety.SecurityHealthSafety",
         ),
         Product(
             0x10,
@@ -1293,7 +1764,7 @@ class IPDB:
             None,
             "Motion Sensor",
             "2420M",
-            SecurityHealthSafety_MotionSensor,
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
         ),
         Product(
             0x10,
@@ -1301,7 +1772,7 @@ class IPDB:
             None,
             "Motion Sensor",
             "2842-222",
-            SecurityHealthSafety_MotionSensor,
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
         ),
         Product(
             0x10,
@@ -1309,10 +1780,15 @@ class IPDB:
             None,
             "Open/Close Sensor",
             "2843-222",
-            SecurityHealthSafety_OpenCloseSensor,
+            "security_health_safety.SecurityHealthSafety_OpenCloseSensor",
         ),
         Product(
-            0x10, 0x03, None, "Motion Sensor", "4716", SecurityHealthSafety_MotionSensor
+            0x10,
+            0x03,
+            None,
+            "Motion Sensor",
+            "4716",
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
         ),
         Product(
             0x10,
@@ -1320,7 +1796,7 @@ class IPDB:
             None,
             "Motion Sensor",
             "2842-422",
-            SecurityHealthSafety_MotionSensor,
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
         ),
         Product(
             0x10,
@@ -1328,7 +1804,7 @@ class IPDB:
             None,
             "Motion Sensor",
             "2842-522",
-            SecurityHealthSafety_MotionSensor,
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
         ),
         Product(
             0x10,
@@ -1336,7 +1812,7 @@ class IPDB:
             None,
             "Open/Close Sensor",
             "2843-422",
-            SecurityHealthSafety_OpenCloseSensor,
+            "security_health_safety.SecurityHealthSafety_OpenCloseSensor",
         ),
         Product(
             0x10,
@@ -1344,13 +1820,23 @@ class IPDB:
             None,
             "Open/Close Sensor",
             "2843-522",
-            SecurityHealthSafety_OpenCloseSensor,
+            "security_health_safety.SecurityHealthSafety_OpenCloseSensor",
         ),
         Product(
-            0x10, 0x08, None, "Leak Sensor", "2852-222", SecurityHealthSafety_LeakSensor
+            0x10,
+            0x08,
+            None,
+            "Leak Sensor",
+            "2852-222",
+            "security_health_safety.SecurityHealthSafety_LeakSensor",
         ),
         Product(
-            0x10, 0x09, None, "Door Sensor", "2843-232", SecurityHealthSafety_DoorSensor
+            0x10,
+            0x09,
+            None,
+            "Door Sensor",
+            "2843-232",
+            "security_health_safety.SecurityHealthSafety_DoorSensor",
         ),
         Product(
             0x10,
@@ -1358,16 +1844,31 @@ class IPDB:
             None,
             "Smoke Bridge",
             "2982-222",
-            SecurityHealthSafety_Smokebridge,
+            "security_health_safety.SecurityHealthSafety_Smokebridge",
         ),
         Product(
-            0x10, 0x11, None, "Door Sensor", "2845-222", SecurityHealthSafety_DoorSensor
+            0x10,
+            0x11,
+            None,
+            "Door Sensor",
+            "2845-222",
+            "security_health_safety.SecurityHealthSafety_DoorSensor",
         ),
         Product(
-            0x10, 0x14, None, "Door Sensor", "2845-422", SecurityHealthSafety_DoorSensor
+            0x10,
+            0x14,
+            None,
+            "Door Sensor",
+            "2845-422",
+            "security_health_safety.SecurityHealthSafety_DoorSensor",
         ),
         Product(
-            0x10, 0x15, None, "Door Sensor", "2845-522", SecurityHealthSafety_DoorSensor
+            0x10,
+            0x15,
+            None,
+            "Door Sensor",
+            "2845-522",
+            "security_health_safety.SecurityHealthSafety_DoorSensor",
         ),
         Product(
             0x10,
@@ -1375,16 +1876,23 @@ class IPDB:
             None,
             "Motion Sensor II",
             "2844-222",
-            SecurityHealthSafety_MotionSensor,
+            "security_health_safety.SecurityHealthSafety_MotionSensor",
+        ),
+        Product(
+            0xFF,
+            0x00,
+            None,
+            "Unrecognized INSTEON Device",
+            "",
+            "unknown_device.UnknownDevice",
         ),
-        Product(0xFF, 0x00, None, "Unrecognized INSTEON Device", "", UnknownDevice),
-        Product(0xFF, 0x01, None, "Unknown Device", "", UnknownDevice),
+        Product(0xFF, 0x01, None, "Unknown Device", "", "unknown_device.UnknownDevice"),
     ]
 
     _x10_products = [
-        X10Product("on_off", X10OnOff),
-        X10Product("dimmable", X10Dimmable),
-        X10Product("sensor", X10OnOffSensor),
+        X10Product("on_off", "x10.X10OnOff"),
+        X10Product("dimmable", "x10.X10Dimmable"),
+        X10Product("sensor", "x10.X10OnOffSensor"),
     ]
 
     def __len__(self):
@@ -1400,22 +1908,16 @@ class IPDB:
         """Return an item from the product database."""
         cat, subcat = key
 
-        device_product = None
-
-        for product in self._products:
-            if cat == product.cat and subcat == product.subcat:
-                device_product = product
+        device_product = _PRODUCTS_BY_ID.get((cat, subcat))
 
         # We failed to find a device in the database, so we will make a best
         # guess from the cat and return the generic class
         if not device_product:
-            for product in self._products:
-                if cat == product.cat and product.subcat is None:
-                    return product
+            device_product = _PRODUCTS_BY_CAT.get(cat)
 
         # We did not find the device or even a generic device of that category
         if not device_product:
-            device_product = Product(cat, subcat, None, "", "", UnknownDevice)
+            device_product = Product(cat, subcat, None, "", "", _UNKNOWN_DEVICE)
 
         return device_product
 
@@ -1427,12 +1929,40 @@ class IPDB:
         - dimmable
         - sensor
         """
-        x10_product = None
-        for product in self._x10_products:
-            if feature.lower() == product.feature:
-                x10_product = product
+        x10_product = _X10_PRODUCTS_BY_FEATURE.get(feature.lower())
 
         if not x10_product:
             x10_product = X10Product(feature, None)
 
         return x10_product
+
+
+def _index_products(products):
+    """Return the products by cat and subcat and the generic products by cat.
+
+    A later product with the same cat and subcat replaces an earlier one while
+    the first generic product of a cat is kept.
+    """
+    products_by_id = {}
+    products_by_cat = {}
+    for product in products:
+        products_by_id[(product.cat, product.subcat)] = product
+        if product.subcat is None:
+            products_by_cat.setdefault(product.cat, product)
+    return products_by_id, products_by_cat
+
+
+# pylint: disable=protected-access
+_PRODUCTS_BY_ID, _PRODUCTS_BY_CAT = _index_products(IPDB._products)
+_X10_PRODUCTS_BY_FEATURE = {product.feature: product for product in IPDB._x10_products}
+_DEVICE_CLASS_PATHS = {
+    product[-1].rpartition(".")[2]: product[-1]
+    for product in IPDB._products + IPDB._x10_products
+}
+
+
+def __getattr__(name):
+    """Return a device class by name."""
+    if name in _DEVICE_CLASS_PATHS:
+        return _import_device_class(_DEVICE_CLASS_PATHS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
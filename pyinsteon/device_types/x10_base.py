@@ -2,6 +2,7 @@
 
 from ..aldb.no_aldb import NoALDB
 from ..constants import EngineVersion, ResponseStatus
+from ..handlers.from_device.x10_received import get_x10_received_handler
 from ..x10_address import create
 
 
@@ -10,6 +11,7 @@ class X10DeviceBase:
 
     def __init__(self, housecode, unitcode):
         """Init the X10DeviceBase class."""
+        get_x10_received_handler()
 
         self._address = create(housecode, unitcode)
         self._aldb = NoALDB(self._address)
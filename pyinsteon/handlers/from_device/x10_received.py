@@ -44,3 +44,18 @@ class X10Received(InboundHandlerBase):
             publish_topic(topic=topic)
             self._last_housecode = None
             self._last_unitcode = None
+
+
+_X10_RECEIVED_HANDLER = None
+
+
+def get_x10_received_handler() -> X10Received:
+    """Return the handler of the received X10 messages.
+
+    The handler is created the first time it is needed, either by an X10 device
+    or by the device manager.
+    """
+    global _X10_RECEIVED_HANDLER  # pylint: disable=global-statement
+    if _X10_RECEIVED_HANDLER is None:
+        _X10_RECEIVED_HANDLER = X10Received()
+    return _X10_RECEIVED_HANDLER
@@ -8,11 +8,36 @@ from ..subscriber_base import SubscriberBase
 from ..utils import build_topic
 
 
+def _handler_attrs(cls):
+    """Return the methods of a handler class that subscribe to topics.
+
+    Each method is listed with whether it is a message handler and whether it
+    is a status handler.
+    """
+    handler_attrs = []
+    for attr_str in dir(cls):
+        attr = getattr(cls, attr_str, None)
+        is_handler = hasattr(attr, "register_handler")
+        is_status = hasattr(attr, "register_status")
+        if is_handler or is_status:
+            handler_attrs.append((attr_str, is_handler, is_status))
+    return tuple(handler_attrs)
+
+
 class InboundHandlerBase(SubscriberBase):
     """Inbound message handler."""
 
     __meta__ = ABCMeta
 
+    # (attribute name, is message handler, is status handler) of each method
+    # that subscribes to topics, found once per handler class
+    _handler_attrs = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Find the handler methods of a handler class."""
+        super().__init_subclass__(**kwargs)
+        cls._handler_attrs = _handler_attrs(cls)
+
     def __init__(self, topic, address=None, group=None, message_type=None):
         """Init the InboundHandlerBase class."""
 
@@ -32,9 +57,13 @@ class InboundHandlerBase(SubscriberBase):
         )
 
         super().__init__(subscriber_topic=subscriber_topic)
-        for attr_str in dir(self):
+        self._subscribe_handlers(topic, address, group, message_type)
+
+    def _subscribe_handlers(self, topic, address, group, message_type):
+        """Subscribe the handler methods to their topics."""
+        for attr_str, is_handler, is_status in self._handler_attrs:
             attr = getattr(self, attr_str)
-            if hasattr(attr, "register_handler"):
+            if is_handler:
                 attr.register_handler(
                     func=attr,
                     topic=topic,
@@ -42,6 +71,6 @@ class InboundHandlerBase(SubscriberBase):
                     group=group,
                     message_type=message_type,
                 )
-            if hasattr(attr, "register_status"):
+            if is_status:
                 # pylint: disable=no-member
                 attr.register_status(attr, self._address.id)
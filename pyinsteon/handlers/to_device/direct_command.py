@@ -13,14 +13,24 @@ TIMEOUT = 6  # Wait time for device response
 
 
 class DirectCommandHandlerBase(OutboundHandlerBase):
-    """Abstract base class for outbound direct message handling."""
+    """Abstract base class for outbound direct message handling.
+
+    Commands that set a state or read a value can set `_coalesce_pending` so a
+    send that is waiting for an earlier send of the same command is replaced
+    by a newer send. The callers of the replaced send receive the result of
+    the newer one. If the caller making the newer send is cancelled, one of
+    the waiting callers makes the send instead.
+    """
 
     __meta__ = ABCMeta
+    _coalesce_pending = False
+    coalesced = 0  # Sends replaced by a newer send of the same command
 
     def __init__(self, topic, address, group=None, message_type=MessageFlagType.DIRECT):
         """Init the DirectCommandHandlerBase class."""
         self._response_lock = asyncio.Lock()
         self._direct_response = asyncio.Queue()
+        self._pending_send = None
         super().__init__(topic, address=address, group=group, message_type=message_type)
 
     @property
@@ -30,6 +40,52 @@ class DirectCommandHandlerBase(OutboundHandlerBase):
 
     async def async_send(self, **kwargs):
         """Send the command and wait for a direct_nak."""
+        if not self._coalesce_pending:
+            return await self._async_send_direct(**kwargs)
+
+        if self._pending_send is not None:
+            # Replace the arguments of the send waiting to go out
+            pending_send = self._pending_send
+            pending_send[0] = kwargs
+            DirectCommandHandlerBase.coalesced += 1
+            try:
+                return await asyncio.shield(pending_send[1])
+            except asyncio.CancelledError:
+                if not pending_send[1].cancelled():
+                    raise
+            # The caller making the send was cancelled so send it again
+            return await DirectCommandHandlerBase.async_send(self, **pending_send[0])
+
+        if not self._send_lock.locked():
+            return await self._async_send_direct(**kwargs)
+
+        pending_send = self._pending_send = [
+            kwargs,
+            asyncio.get_running_loop().create_future(),
+        ]
+        try:
+            async with self._send_lock:
+                pass
+        except BaseException:
+            pending_send[1].cancel()
+            raise
+        finally:
+            self._pending_send = None
+        try:
+            result = await self._async_send_direct(**pending_send[0])
+        except asyncio.CancelledError:
+            pending_send[1].cancel()
+            raise
+        except Exception as ex:
+            pending_send[1].set_exception(ex)
+            # Retrieve the exception so it is not logged if no caller waits
+            pending_send[1].exception()
+            raise
+        pending_send[1].set_result(result)
+        return result
+
+    async def _async_send_direct(self, **kwargs):
+        """Send the command and wait for the device response."""
         ack_response = await super().async_send(address=self._address, **kwargs)
         if ack_response == ResponseStatus.SUCCESS:
             try:
@@ -7,6 +7,8 @@ from .direct_command import DirectCommandHandlerBase
 class EngineVersionRequest(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address):
         """Init the OnLevelCommand class."""
         super().__init__(topic=GET_INSTEON_ENGINE_VERSION, address=address)
@@ -7,6 +7,8 @@ from .direct_command import DirectCommandHandlerBase
 class IdRequestCommand(DirectCommandHandlerBase):
     """Get Device ID command handler."""
 
+    _coalesce_pending = True
+
     def __init__(self, address: Address):
         """Init the IdRequest class."""
         super().__init__(topic=ID_REQUEST, address=address)
@@ -7,6 +7,8 @@ from .direct_command import DirectCommandHandlerBase
 class OffCommand(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address, group):
         """Init the OnLevelCommand class."""
         super().__init__(topic=OFF, address=address, group=group)
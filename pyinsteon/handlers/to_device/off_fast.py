@@ -6,6 +6,8 @@ from .direct_command import DirectCommandHandlerBase
 class OffFastCommand(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address, group):
         """Init the OnLevelCommand class."""
         super().__init__(topic=OFF_FAST, address=address, group=group)
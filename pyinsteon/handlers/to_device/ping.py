@@ -6,6 +6,8 @@ from .direct_command import DirectCommandHandlerBase
 class PingCommand(DirectCommandHandlerBase):
     """Manage an outbound Ping command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address):
         """Init the PingCommand class."""
         super().__init__(topic=PING, address=address)
@@ -6,6 +6,8 @@ from .direct_command import DirectCommandHandlerBase
 class ProductDataRequestCommand(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address):
         """Init the OnLevelCommand class."""
         super().__init__(topic=PRODUCT_DATA_REQUEST, address=address)
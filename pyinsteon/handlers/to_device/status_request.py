@@ -12,6 +12,8 @@ from .direct_command import DirectCommandHandlerBase
 class StatusRequestCommand(DirectCommandHandlerBase):
     """Manage an outbound Status command to a device."""
 
+    _coalesce_pending = True
+
     def __init__(self, address, status_type: int = 0):
         """Init the OnLevelCommand class."""
         self._status_type = status_type
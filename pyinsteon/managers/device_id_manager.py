@@ -3,6 +3,7 @@ import asyncio
 from binascii import unhexlify
 from collections import namedtuple
 import logging
+from time import monotonic
 
 import async_timeout
 
@@ -23,6 +24,12 @@ _LOGGER = logging.getLogger(__name__)
 MAX_RETRIES = 5
 RETRY_PAUSE = 2
 PING_DELAY = 20
+ID_CONCURRENCY = 4
+_REFUSED_RESPONSES = (
+    ResponseStatus.DIRECT_NAK_ALDB,
+    ResponseStatus.DIRECT_NAK_CHECK_SUM,
+    ResponseStatus.DIRECT_NAK_INVALID_COMMAND,
+)
 
 
 DeviceId = namedtuple("DeviceId", "address cat subcat firmware")  # product_id')
@@ -57,6 +64,9 @@ class DeviceIdManager(SubscriberBase):
         self._all_link_complete = AllLinkCompletedHandler()
         self._all_link_complete.subscribe(self._all_link_complete_received)
         self._ping_tasks = {}
+        self._id_total = 0
+        self._id_failed = 0
+        self._id_latency = {}
 
     def __getitem__(self, address):
         """Return the unknown device list."""
@@ -72,6 +82,22 @@ class DeviceIdManager(SubscriberBase):
         """Return a list of addresses where the device type has not been identified."""
         return self._unknown_devices
 
+    @property
+    def id_progress(self):
+        """Return the progress of the last call to `async_id_devices`.
+
+        `latency` holds the seconds from the first ID request to the device
+        ID for each identified device.
+        """
+        identified = len(self._id_latency)
+        return {
+            "total": self._id_total,
+            "identified": identified,
+            "failed": self._id_failed,
+            "pending": self._id_total - identified - self._id_failed,
+            "latency": dict(self._id_latency),
+        }
+
     def start(self):
         """Start the ID manager for unknown devices."""
         if self._awake_devices_queue is None:
@@ -128,8 +154,15 @@ class DeviceIdManager(SubscriberBase):
         self._device_ids[address] = device_id
         self._call_subscribers(device_id=device_id, link_mode=link_mode)
 
-    async def async_id_devices(self, refresh: bool = False):
-        """Identify the devices in the unknown device list."""
+    async def async_id_devices(
+        self, refresh: bool = False, max_concurrent: int = ID_CONCURRENCY
+    ):
+        """Identify the devices in the unknown device list.
+
+        Up to `max_concurrent` devices are identified at the same time. A
+        device that does not respond goes back in the queue behind the devices
+        with fewer attempts rather than holding up the other devices.
+        """
         if refresh:
             for address_id in self._device_ids:
                 self.append(address_id, refresh=True)
@@ -137,62 +170,105 @@ class DeviceIdManager(SubscriberBase):
         # We change the unknown device list during the process so we make a copy
         address_list = self._unknown_devices.copy()
         async with self._id_device_lock:
-            for address in address_list:
-                await self.async_id_device(address)
+            self._id_total = len(address_list)
+            self._id_failed = 0
+            self._id_latency = {}
+            id_queue = asyncio.PriorityQueue()
+            for order, address in enumerate(address_list):
+                # (attempts, not before time, order, address, first attempt time)
+                id_queue.put_nowait((0, 0, order, address, None))
+            workers = min(max_concurrent, len(address_list))
+            await asyncio.gather(
+                *[self._async_id_worker(id_queue) for _ in range(workers)]
+            )
         return self._device_ids
 
+    async def _async_id_worker(self, id_queue: asyncio.PriorityQueue):
+        """Identify devices from the queue until it is empty."""
+        while not id_queue.empty():
+            attempts, not_before, order, address, started = id_queue.get_nowait()
+            wait = not_before - monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started = started or monotonic()
+            device_id = self._device_ids.get(address)
+            if device_id is None or device_id.cat is None:
+                # The device may have been identified since it was queued
+                device_id = await self._async_id_attempt(address)
+            if device_id is not None and device_id.cat is not None:
+                self._id_latency[address] = monotonic() - started
+                _LOGGER.debug(
+                    "Identified device %s in %.1f seconds (%d of %d)",
+                    str(address),
+                    self._id_latency[address],
+                    len(self._id_latency),
+                    self._id_total,
+                )
+            elif device_id is None or attempts + 1 >= MAX_RETRIES:
+                self._id_failed += 1
+                _LOGGER.debug("Could not identify device %s", str(address))
+            else:
+                id_queue.put_nowait(
+                    (attempts + 1, monotonic() + RETRY_PAUSE, order, address, started)
+                )
+
     async def async_id_device(self, address: Address, refresh: bool = False):
         """Call ID Request command for all unknown devices."""
+        address = Address(address)
+        device_id = DeviceId(address, None, None, None)
+        self.append(address, refresh)
+
+        retries = MAX_RETRIES
+        while retries:
+            device_id = await self._async_id_attempt(address)
+            if device_id is None or device_id.cat is not None:
+                return device_id
+            retries -= 1
+            await asyncio.sleep(RETRY_PAUSE)
+        return device_id
 
+    async def _async_id_attempt(self, address: Address):
+        """Send one ID Request to a device and wait for the device ID.
+
+        Returns None if the device refused the request or a device ID with no
+        category if the device did not respond.
+        """
+        address = Address(address)
         received_queue = asyncio.Queue()
 
         async def async_device_id_received(device_id, link_mode):
             """Receive notification a device has been identified."""
-            await received_queue.put(device_id)
+            if device_id.address == address:
+                await received_queue.put(device_id)
 
         self.subscribe(async_device_id_received)
-
         id_handler = IdRequestCommand(address)
         id_response_handler = AssignToAllLinkGroupCommand(address)
         id_response_handler_alt = DeleteFromAllLinkGroupCommand(address)
         id_response_handler.subscribe(self._id_response)
         id_response_handler_alt.subscribe(self._id_response)
-
-        address = Address(address)
-        device_id = DeviceId(address, None, None, None)
-        self.append(address, refresh)
-
-        retries = MAX_RETRIES
         try:
-            while retries:
-                response = await id_handler.async_send()
-                if response == ResponseStatus.SUCCESS:
-                    try:
-                        async with async_timeout.timeout(RETRY_PAUSE):
-                            return await received_queue.get()
-                    except asyncio.TimeoutError:
-                        pass
-                elif response in [
-                    ResponseStatus.DIRECT_NAK_ALDB,
-                    ResponseStatus.DIRECT_NAK_CHECK_SUM,
-                    ResponseStatus.DIRECT_NAK_INVALID_COMMAND,
-                ]:
-                    _LOGGER.warning(
-                        "Device %s refused the Device ID request with error: %s (%r)",
-                        str(address),
-                        str(response),
-                        response,
-                    )
-                    return None
-
-                retries -= 1
-                await asyncio.sleep(RETRY_PAUSE)
-
+            response = await id_handler.async_send()
+            if response == ResponseStatus.SUCCESS:
+                try:
+                    async with async_timeout.timeout(RETRY_PAUSE):
+                        return await received_queue.get()
+                except asyncio.TimeoutError:
+                    pass
+            elif response in _REFUSED_RESPONSES:
+                _LOGGER.warning(
+                    "Device %s refused the Device ID request with error: %s (%r)",
+                    str(address),
+                    str(response),
+                    response,
+                )
+                return None
         finally:
+            self.unsubscribe(async_device_id_received)
             id_response_handler.unsubscribe(self._id_response)
             id_response_handler_alt.unsubscribe(self._id_response)
 
-        return device_id
+        return DeviceId(address, None, None, None)
 
     def _id_response(self, address, cat, subcat, firmware, group, link_mode):
         """Receive a device ID response."""
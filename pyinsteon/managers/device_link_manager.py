@@ -8,7 +8,7 @@ import voluptuous as vol
 from .. import pub
 from ..address import Address
 from ..aldb.aldb_record import ALDBRecord
-from ..constants import AllLinkMode, DeviceAction, MessageFlagType, ResponseStatus
+from ..constants import DeviceAction, MessageFlagType, ResponseStatus
 from ..topics import ALDB_LINK_CHANGED
 from ..utils import subscribe_topic, unsubscribe_topic
 
@@ -44,42 +44,14 @@ class LinkInfo:
 EMPTY_ADDRESS = Address("000000")
 
 
-def _add_controller_group_responder_tree(links, controller, group, responder):
-    """Add a controller, group, responder set."""
-    if not links.get(controller):
-        links[controller] = {}
-    if not links[controller].get(group):
-        links[controller][group] = {}
-    if not links[controller][group].get(responder):
-        links[controller][group][responder] = []
-    return links
-
-
-def _add_controller_link(links, controller, record):
-    """Add a controller link."""
-    return _add_controller_group_responder_tree(
-        links, controller, record.group, record.target
-    )
-
-
-def _add_responder_link(links, devices, responder, record):
-    """Add a responder link."""
-    links = _add_controller_group_responder_tree(
-        links, record.target, record.group, responder
-    )
-    responder_links = links[record.target][record.group][responder]
-    controller_device = devices[record.target]
-    has_controller = False
-    if controller_device:
-        for _ in controller_device.aldb.find(
-            target=responder,
-            is_controller=True,
-            group=record.group,
-        ):
-            has_controller = True
-    link = LinkInfo(record.data1, record.data2, record.data3, has_controller, True)
-    responder_links.append(link)
-    return links
+def _link_list(records):
+    """Return the responder link data of the records of a responder."""
+    has_controller = any(rec.is_controller for rec in records.values())
+    return [
+        LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
+        for rec in records.values()
+        if not rec.is_controller
+    ]
 
 
 def _topic_to_addr_group(topic):
@@ -110,102 +82,168 @@ class DeviceLinkManager:
         # If the last command is the same as the current command, do nothing.
         # Otherwise we send a status request
         self._last_command: Dict[Address, Dict[int, Tuple[str, datetime]]] = {}
+        # Running status requests of responders
+        self._status_tasks = set()
+        # Link index of controller -> group -> responder -> records where the
+        # records are keyed by the device address and memory address
+        self._index: Dict[
+            ControllerAddress,
+            Dict[Group, Dict[ResponderAddress, Dict[Tuple[Address, int], ALDBRecord]]],
+        ] = {}
+        # Index entries of the records of each device keyed by memory address
+        self._device_records: Dict[
+            Address, Dict[int, Tuple[ControllerAddress, Group, ResponderAddress]]
+        ] = {}
+        # Devices loaded before the link manager was created are not announced
+        self.rebuild()
 
     @property
     def links(
         self,
     ) -> Dict[ControllerAddress, Dict[Group, Dict[ResponderAddress, LinkInfo]]]:
         """Return a list of device links."""
-        return self._get_links()
+        modem_address = self._devices.modem.address if self._devices.modem else None
+        links = {}
+        for controller, groups in self._index.items():
+            if controller == modem_address:
+                continue
+            for group, responders in groups.items():
+                for responder, records in responders.items():
+                    if responder == modem_address:
+                        continue
+                    controller_links = links.setdefault(controller, {})
+                    group_links = controller_links.setdefault(group, {})
+                    group_links[responder] = _link_list(records)
+        return links
 
     def get_responders(
         self, controller: Address, group: int
     ) -> Dict[ResponderAddress, LinkInfo]:
         """Return the responders to a controller/group combination."""
-        responders = self._get_links(controller, group)
-        return responders.get(controller, {}).get(group, {})
-
-    def _get_links(self, controller=None, group=None):
-        """Return a list of links.
-
-        If controller is not None -> Only return responders for that controller
-        If group is not None -> Only return responders for that group
-        """
         modem_address = self._devices.modem.address if self._devices.modem else None
-        links = {}
-        for addr in self._devices:
-            if addr == modem_address:
-                continue
-            device = self._devices[addr]
-            for mem_addr in device.aldb:
-                rec: ALDBRecord = device.aldb[mem_addr]
-                if (
-                    rec.target == modem_address
-                    or rec.target == EMPTY_ADDRESS
-                    or not rec.is_in_use
-                ):
-                    continue
-                if rec.mode == AllLinkMode.CONTROLLER:
-                    if not controller or device.address == controller:
-                        links = _add_controller_link(links, device.address, rec)
-                    continue
-                if (not controller or rec.target == controller) and (
-                    not group or rec.group != group
-                ):
-                    links = _add_responder_link(
-                        links, self._devices, device.address, rec
-                    )
-        return links
+        controller = Address(controller)
+        if controller == modem_address:
+            return {}
+        responders = self._index.get(controller, {}).get(group, {})
+        return {
+            responder: _link_list(records)
+            for responder, records in responders.items()
+            if responder != modem_address
+        }
 
-    def _link_changed(self, record: ALDBRecord, sender: Address, deleted: bool) -> None:
-        """Add a record to the controller/responder list."""
+    def rebuild(self):
+        """Rebuild the link index from the All-Link Database of all devices."""
+        self._index = {}
+        self._device_records = {}
+        for address in list(self._devices):
+            try:
+                address = Address(address)
+            except ValueError:
+                # X10 devices do not have an All-Link Database
+                continue
+            self._follow_device(address)
+
+    def _follow_device(self, address: Address):
+        """Index the records of a device and listen for its link changes."""
+        # Saved devices are indexed from their saved records so the device
+        # is not created until it is used
+        subscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+        self._index_device(address)
+        entries = self._device_records.get(address, {})
+        for controller, group, responder in set(entries.values()):
+            self._add_link(controller, group, responder)
+
+    def _index_device(self, address: Address):
+        """Replace the index entries of a device with its in use records."""
+        self._unindex_device(address)
+        for record in self._devices.get_aldb_records(address).values():
+            if record.is_in_use:
+                self._index_record(address, record)
+
+    def _index_record(self, sender: Address, record: ALDBRecord):
+        """Add a record to the link index."""
+        self._unindex_record(sender, record.mem_addr)
+        if not record.is_in_use or record.target == EMPTY_ADDRESS:
+            return None
         if record.is_controller:
-            controller = Address(sender)
-            responder = Address(record.target)
+            controller, responder = sender, Address(record.target)
         else:
-            controller = Address(record.target)
-            responder = Address(sender)
+            controller, responder = Address(record.target), sender
+        groups = self._index.setdefault(controller, {})
+        responders = groups.setdefault(record.group, {})
+        records = responders.setdefault(responder, {})
+        records[(sender, record.mem_addr)] = record
+        entry = (controller, record.group, responder)
+        self._device_records.setdefault(sender, {})[record.mem_addr] = entry
+        return entry
+
+    def _unindex_record(self, sender: Address, mem_addr: int):
+        """Remove a record from the link index."""
+        entry = self._device_records.get(sender, {}).pop(mem_addr, None)
+        if entry is None:
+            return None
+        controller, group, responder = entry
+        groups = self._index[controller]
+        responders = groups[group]
+        records = responders[responder]
+        records.pop((sender, mem_addr), None)
+        # Remove empty branches so the index only holds existing links
+        if not records:
+            responders.pop(responder)
+        if not responders:
+            groups.pop(group)
+        if not groups:
+            self._index.pop(controller)
+        return entry
+
+    def _unindex_device(self, address: Address):
+        """Remove all records of a device from the link index."""
+        for mem_addr in list(self._device_records.get(address, {})):
+            self._unindex_record(address, mem_addr)
+        self._device_records.pop(address, None)
 
+    def _link_changed(self, record: ALDBRecord, sender: Address, deleted: bool) -> None:
+        """Add a record to the controller/responder list."""
+        sender = Address(sender)
+        entry = self._unindex_record(sender, record.mem_addr)
+        if entry is not None:
+            controller, group, _ = entry
+            self._remove_link(controller=controller, group=group)
         if deleted:
-            self._remove_link(record=record, controller=controller)
-        else:
-            self._add_link(record=record, controller=controller, responder=responder)
+            return
 
-    def _add_link(self, record, controller, responder):
+        entry = self._index_record(sender, record)
+        if entry is not None:
+            controller, group, responder = entry
+            self._add_link(controller=controller, group=group, responder=responder)
+
+    def _add_link(self, controller, group, responder):
         """Add a link to the controller/responder list."""
-        if self._is_standard_modem_link(controller, responder, record.group):
+        if self._is_modem_link(controller, responder):
             return
         # Listen for the controller group topic and check known responders.
-        subscribe_topic(self._async_check_responders, f"{controller.id}.{record.group}")
+        subscribe_topic(self._async_check_responders, f"{controller.id}.{group}")
 
-    def _remove_link(self, record, controller):
+    def _remove_link(self, controller, group):
         """Remove a controller or responder link from the controller/responder list."""
-        responders = self.get_responders(controller, record.group)
+        responders = self.get_responders(controller, group)
         if not responders:
-            unsubscribe_topic(
-                self._async_check_responders, f"{controller.id}.{record.group}"
-            )
+            unsubscribe_topic(self._async_check_responders, f"{controller.id}.{group}")
 
     async def _device_added_or_removed(self, address: Address, action: DeviceAction):
         """Track device list changes."""
         await asyncio.sleep(0.1)
+        try:
+            address = Address(address)
+        except ValueError:
+            # X10 devices do not have an All-Link Database
+            return
         if action == DeviceAction.REMOVED:
+            self._unindex_device(address)
             unsubscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
 
         elif action == DeviceAction.ADDED:
-            device = self._devices[address]
-            if not device:
-                await asyncio.sleep(0.1)
-                device = self._devices[address]
-                if not device:
-                    subscribe_topic(
-                        self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}"
-                    )
-                    return
-            device.aldb.subscribe_record_changed(self._link_changed)
-            for _, record in device.aldb.items():
-                if record.is_in_use:
-                    self._link_changed(record=record, sender=address, deleted=False)
+            self._follow_device(address)
 
     async def _async_check_responders(self, topic=pub.AUTO_TOPIC, **kwargs) -> None:
         controller, group, command, msg_type = _topic_to_addr_group(topic)
@@ -220,33 +258,43 @@ class DeviceLinkManager:
         if self._is_duplicate_message(controller, group, command):
             return
         responder_data = self.get_responders(controller, group)
+        status_devices = []
         for addr, data_list in responder_data.items():
             device = self._devices[addr]
             if device:
                 # If the device is a category 1 or 2 device we can pre-load the device state with the
                 # ALDB record data1 field value. We will then check the actual status later.
                 for data in data_list:
-                    if device.cat in [0x01, 0x02] and data.data3 is not None:
+                    if device.cat in [0x01, 0x02] and data.data3 in device.groups:
                         device.groups[data.data3].value = data.data1
                 if not device.is_battery:
-                    response = ResponseStatus.UNSENT
-                    retries = 5
-                    while retries and response != ResponseStatus.SUCCESS:
-                        response = await device.async_status()
-                        retries -= 1
-
-    def _is_standard_modem_link(self, controller, responder, group):
-        """Test if a link is a standard modem link."""
-        if self._devices.modem and responder == self._devices.modem.address:
-            return True
-        if self._devices.modem and controller == self._devices.modem.address:
-            device = self._devices[responder]
-            if device:
-                groups = list(device.groups)
-            groups.append(0)
-            if group in groups:
-                return True
-        return False
+                    status_devices.append(device)
+        if status_devices:
+            # The status requests run in their own task so the cleanup and
+            # duplicate messages of the controller are checked while they wait
+            task = asyncio.create_task(self._async_status_responders(status_devices))
+            self._status_tasks.add(task)
+            task.add_done_callback(self._status_tasks.discard)
+
+    async def _async_status_responders(self, devices):
+        """Request the status of the responders of a controller group."""
+        for device in devices:
+            response = ResponseStatus.UNSENT
+            retries = 5
+            while retries and response != ResponseStatus.SUCCESS:
+                response = await device.async_status()
+                retries -= 1
+
+    def _is_modem_link(self, controller, responder):
+        """Test if the modem is the controller or the responder of a link.
+
+        The responders of the modem are not returned by `get_responders` so
+        these links do not need to be followed. This does not look up the
+        responder device so a saved device is not created.
+        """
+        if not self._devices.modem:
+            return False
+        return self._devices.modem.address in (controller, responder)
 
     def _is_duplicate_message(self, controller: Address, group: int, command: str):
         """Test if this is the duplicate message to notify of a change.
@@ -2,18 +2,22 @@
 
 import asyncio
 import logging
-from typing import ValuesView
+from time import monotonic
+from typing import Dict, ItemsView, List, ValuesView
 
 import async_timeout
 
+from .. import pub
 from ..address import Address
-from ..constants import AllLinkMode, DeviceAction
+from ..aldb.aldb_record import ALDBRecord
+from ..constants import ALDBStatus, AllLinkMode, DeviceAction
 from ..device_types.device_base import Device
 from ..device_types.modem_base import ModemBase
 from ..device_types.x10_base import X10DeviceBase
-from ..managers.saved_devices_manager import SavedDeviceManager
+from ..managers.saved_devices_manager import SavedDevice, SavedDeviceManager
 from ..subscriber_base import SubscriberBase
-from ..topics import DEVICE_LIST_CHANGED
+from ..topics import ALDB_STATUS_CHANGED, DEVICE_LIST_CHANGED, ENGINE_VERSION
+from ..utils import subscribe_topic, unsubscribe_topic
 from ..x10_address import X10Address
 from .device_id_manager import DeviceId, DeviceIdManager
 from .link_manager import (
@@ -24,6 +28,12 @@ from .link_manager import (
 from .utils import create_device, create_x10_device
 
 DEVICE_INFO_FILE = "insteon_devices.json"
+ALDB_LOAD_CONCURRENCY = 3
+ALDB_LOAD_RETRIES = 1
+AUTOSAVE_DELAY = 5
+AUTOSAVE_MAX_DELAY = 60
+# Parent topics of the ALDB record, property and operating flag changes
+_CHANGE_TOPICS = ("aldb", "property", "operating_flag")
 _LOGGER = logging.getLogger(__name__)
 _DEVICE_LOGGERS = []
 
@@ -35,6 +45,7 @@ class DeviceManager(SubscriberBase):
         """Init the DeviceManager class."""
         super().__init__(subscriber_topic=DEVICE_LIST_CHANGED)
         self._devices: dict[Address, Device] = {}
+        self._saved_devices: dict[Address, SavedDevice] = {}
         self._modem = None
         self._id_manager = DeviceIdManager()
         self._id_manager.subscribe(self._async_device_identified)
@@ -42,8 +53,25 @@ class DeviceManager(SubscriberBase):
 
         self._delay_device_inspection = False
         self._to_be_inspected = []
+        self._inspection_stats = {"devices": 0, "seconds": 0}
+        self._aldb_load_progress = {
+            "total": 0,
+            "loaded": 0,
+            "failed": 0,
+            "deferred": 0,
+        }
+        self._load_stats = {"devices": 0, "deferred": 0, "seconds": 0}
+        self._create_stats = {"devices": 0, "seconds": 0}
         self._linked_device = asyncio.Queue()
-        self.items = self._devices.items
+        self._changed_devices = set()
+        self._saved_workdir = None
+        self._saving_lock = asyncio.Lock()
+        self._autosave_workdir = None
+        self._autosave_delay = AUTOSAVE_DELAY
+        self._autosave_max_delay = AUTOSAVE_MAX_DELAY
+        self._autosave_deadline = None
+        self._autosave_handle = None
+        self._autosave_task = None
 
     def __getitem__(self, address) -> Device:
         """Return a a device from the device address."""
@@ -51,19 +79,25 @@ class DeviceManager(SubscriberBase):
             address = Address(address)
         except ValueError:
             address = X10Address(address)
+        if address in self._saved_devices:
+            return self._create_saved_device(address)
         return self._devices.get(address)
 
     def __iter__(self):
         """Return an iterator of device addresses."""
-        for address in self._devices:
+        for address in list(self._devices) + list(self._saved_devices):
             yield address
 
     def __setitem__(self, address, device):
         """Add a device to the device list."""
         if device is None:
             _LOGGER.info("Removing device from INSTEON devices list: %s", address.id)
+            if address in self._saved_devices:
+                self._remove_saved_device(address)
+                self._mark_changed(address)
+                self._call_subscribers(address=address.id, action=DeviceAction.REMOVED)
             if address in self._devices:
-                self._devices.pop(address)
+                self._untrack_changes(self._devices.pop(address))
                 self._call_subscribers(address=address.id, action=DeviceAction.REMOVED)
             return
 
@@ -74,24 +108,25 @@ class DeviceManager(SubscriberBase):
         if isinstance(device, DeviceId):
             device = create_device(device)
 
+        if device.address in self._saved_devices:
+            self._remove_saved_device(device.address)
+        if device.address in self._devices:
+            self._untrack_changes(self._devices[device.address])
         self._devices[device.address] = device
         if isinstance(device, Device):
             self._id_manager.set_device_id(
                 device.address, device.cat, device.subcat, device.firmware
             )
+            self._track_changes(device)
         self._call_subscribers(address=device.address.id, action=DeviceAction.ADDED)
 
     def __len__(self):
         """Return the number of devices."""
-        return len(self._devices)
+        return len(self._devices) + len(self._saved_devices)
 
     def get(self, address) -> Device:
         """Return a device from an address."""
-        try:
-            address = Address(address)
-        except ValueError:
-            address = X10Address(address)
-        return self._devices.get(address)
+        return self[address]
 
     def pop(self, address):
         """Remove a device from the device list."""
@@ -113,6 +148,7 @@ class DeviceManager(SubscriberBase):
             raise ValueError("Must be an Insteon Modem object")
         self._modem = modem
         self._devices[self._modem.address] = self._modem
+        self._track_changes(modem)
 
     @property
     def id_manager(self):
@@ -143,19 +179,208 @@ class DeviceManager(SubscriberBase):
 
     def values(self) -> ValuesView[Device]:
         """Return the devices."""
+        self.create_saved_devices()
         return self._devices.values()
 
+    def items(self) -> ItemsView[Address, Device]:
+        """Return the devices by address."""
+        self.create_saved_devices()
+        return self._devices.items()
+
+    @property
+    def saved_devices(self) -> List[Address]:
+        """Return the addresses of the saved devices that are not created yet."""
+        return list(self._saved_devices)
+
+    @property
+    def created_devices(self) -> List[Device]:
+        """Return the devices that are created without creating the saved devices."""
+        return list(self._devices.values())
+
+    @property
+    def changed_devices(self) -> List[Address]:
+        """Return the addresses of the devices that changed since the last save."""
+        return list(self._changed_devices)
+
+    @property
+    def load_stats(self):
+        """Return the number of devices and seconds of the last saved device load.
+
+        `deferred` is the number of saved devices that were not created by the
+        load. `created` holds the number of those devices created since then
+        and the seconds spent creating them.
+        """
+        return {**self._load_stats, "created": dict(self._create_stats)}
+
+    def create_saved_devices(self):
+        """Create all the saved devices that are not created yet."""
+        for address in list(self._saved_devices):
+            self._create_saved_device(address)
+
+    def get_aldb_records(self, address) -> Dict[int, ALDBRecord]:
+        """Return the All-Link Database records of a device by memory address.
+
+        The records of a saved device that is not created yet are read from its
+        saved data so the device is not created.
+        """
+        try:
+            address = Address(address)
+        except ValueError:
+            address = X10Address(address)
+        saved_device = self._saved_devices.get(address)
+        if saved_device is not None:
+            return saved_device.aldb_records
+        device = self._devices.get(address)
+        if device is None:
+            return {}
+        return dict(device.aldb.items())
+
+    @property
+    def inspection_stats(self):
+        """Return the number of devices and total seconds of the last inspection."""
+        return dict(self._inspection_stats)
+
     async def async_inspect_device(self, device: Device):
         """Inspect the properties of the devices."""
-        await device.async_read_config()
+        await self.async_inspect_devices([device])
+
+    async def async_inspect_devices(self, devices: List[Device]):
+        """Inspect the properties of a batch of devices.
+
+        The operating flags, extended properties and All-Link Database of each
+        device are read first, then the modem ALDB is loaded once for the batch
+        before the default links of each device are added.
+        """
+        if not devices:
+            return
+        start = monotonic()
+        for device in devices:
+            await device.async_read_config()
         await self.modem.aldb.async_load()
-        await device.async_add_default_links()
+        for device in devices:
+            await device.async_add_default_links()
+        self._inspection_stats = {
+            "devices": len(devices),
+            "seconds": monotonic() - start,
+        }
+        _LOGGER.debug(
+            "Inspected %d devices in %.1f seconds",
+            len(devices),
+            self._inspection_stats["seconds"],
+        )
+
+    @property
+    def aldb_load_progress(self):
+        """Return the progress of the last call to `async_load_all`.
+
+        `deferred` is the number of battery operated devices that will load
+        their ALDB when they wake up.
+        """
+        return dict(self._aldb_load_progress)
+
+    async def async_load_all(
+        self,
+        addresses: List[Address] = None,
+        refresh: bool = False,
+        max_concurrent: int = ALDB_LOAD_CONCURRENCY,
+        retries: int = ALDB_LOAD_RETRIES,
+        delta: bool = False,
+    ):
+        """Load the All-Link Database of several devices.
+
+        Up to `max_concurrent` devices are loaded at the same time so the wait
+        for the records of one device overlaps with the commands sent to other
+        devices. A device that does not load goes back in the queue behind the
+        devices with fewer attempts and is loaded with `refresh=True` up to
+        `retries` more times.
+
+        If `delta` is True, the first attempt for a loaded ALDB only reads the
+        records that changed (see `ALDB.async_load_delta`).
+
+        Yields the address and ALDB status of a device after each attempt.
+
+        The modem and battery operated devices are not retried. The battery
+        operated devices load when they wake up.
+        """
+        if addresses is None:
+            addresses = list(self)
+        load_queue = asyncio.PriorityQueue()
+        for order, address in enumerate(addresses):
+            device = self[address]
+            if device is None or device == self.modem or device.cat == 0x03:
+                continue
+            # (attempts, order, device)
+            load_queue.put_nowait((0, order, device))
+
+        self._aldb_load_progress = {
+            "total": load_queue.qsize(),
+            "loaded": 0,
+            "failed": 0,
+            "deferred": 0,
+        }
+        progress = asyncio.Queue()
+        workers = asyncio.ensure_future(
+            self._async_load_aldb_workers(
+                load_queue, progress, refresh, retries, max_concurrent, delta
+            )
+        )
+        try:
+            while (result := await progress.get()) is not None:
+                yield result
+            await workers
+        finally:
+            workers.cancel()
+
+    async def _async_load_aldb_workers(
+        self, load_queue, progress, refresh, retries, max_concurrent, delta
+    ):
+        """Run the ALDB load workers and signal when they are done."""
+        workers = min(max_concurrent, load_queue.qsize())
+        try:
+            await asyncio.gather(
+                *[
+                    self._async_load_aldb_worker(
+                        load_queue, progress, refresh, retries, delta
+                    )
+                    for _ in range(workers)
+                ]
+            )
+        finally:
+            progress.put_nowait(None)
+
+    async def _async_load_aldb_worker(
+        self,
+        load_queue: asyncio.PriorityQueue,
+        progress: asyncio.Queue,
+        refresh: bool,
+        retries: int,
+        delta: bool,
+    ):
+        """Load the ALDB of devices from the queue until it is empty."""
+        while not load_queue.empty():
+            attempts, order, device = load_queue.get_nowait()
+            if delta and not attempts:
+                await device.aldb.async_load_delta()
+            else:
+                await device.aldb.async_load(refresh=refresh or attempts > 0)
+            status = device.aldb.status
+            if status == ALDBStatus.LOADED:
+                self._aldb_load_progress["loaded"] += 1
+            elif device.is_battery:
+                self._aldb_load_progress["deferred"] += 1
+            elif attempts >= retries:
+                self._aldb_load_progress["failed"] += 1
+                _LOGGER.debug("ALDB of device %s did not load", str(device.address))
+            else:
+                load_queue.put_nowait((attempts + 1, order, device))
+            await progress.put((device.address, status))
 
     async def _async_ensure_inspect_devices(self):
         """Insepct the properties of the device who's insepection was delayed earlier."""
         while self._to_be_inspected:
-            device = self._to_be_inspected.pop()
-            await self.async_inspect_device(device)
+            devices = list(reversed(self._to_be_inspected))
+            self._to_be_inspected.clear()
+            await self.async_inspect_devices(devices)
 
     def set_id(self, address: Address, cat: int, subcat: int, firmware: int):
         """Add a device override to identify the device information.
@@ -180,7 +405,12 @@ class DeviceManager(SubscriberBase):
         been run to create a device override. The `async_reidentify_device` command will
         reset that override and allow normal device identification to run.
         """
-        self._devices.pop(Address(address))
+        address = Address(address)
+        if address in self._saved_devices:
+            self._remove_saved_device(address)
+            self._mark_changed(address)
+        else:
+            self._untrack_changes(self._devices.pop(address))
         await self._id_manager.async_id_device(address=address, refresh=True)
 
     async def async_add_device(self, address: Address = None, multiple: bool = False):
@@ -241,7 +471,12 @@ class DeviceManager(SubscriberBase):
 
         address = Address(address)
         try:
-            device_to_delete = self._devices.pop(address)
+            if address in self._saved_devices:
+                device_to_delete = self._remove_saved_device(address).create_device()
+                self._mark_changed(address)
+            else:
+                device_to_delete = self._devices.pop(address)
+                self._untrack_changes(device_to_delete)
         except KeyError:
             force = True
 
@@ -295,10 +530,14 @@ class DeviceManager(SubscriberBase):
         return device
 
     async def async_close(self):
-        """Close the device ID listener."""
+        """Close the device ID listener and save the changes waiting for autosave."""
         self._id_manager.close()
+        workdir = self._autosave_workdir
+        self.stop_autosave()
+        if workdir is not None and self._changed_devices:
+            await self.async_save(workdir)
 
-    async def async_load(self, workdir="", id_devices=1, load_modem_aldb=1):
+    async def async_load(self, workdir="", id_devices=1, load_modem_aldb=1, lazy=False):
         """Load devices from the `insteon_devices.yaml` file and device overrides.
 
         Parameters:
@@ -316,15 +555,40 @@ class DeviceManager(SubscriberBase):
                 2: Load
             (default=1)
 
+            lazy: Indicate if the saved devices are created when first used
+                The device ID and ALDB of a saved device are known right away
+                but the device is created when it is accessed through the
+                Device Manager or when it sends its first message. Use
+                `get_aldb_records` to read the ALDB of a device without
+                creating it.
+            (default=False)
+
         The Modem ALDB is loaded if `refresh` is True or if the saved file has no devices.
 
         """
         if workdir:
             async with self._loading_saved_lock:
+                start = monotonic()
                 saved_devices_manager = SavedDeviceManager(workdir, self.modem)
-                devices = await saved_devices_manager.async_load()
-                for address in devices:
-                    self[address] = devices[address]
+                devices = await saved_devices_manager.async_load(lazy=lazy)
+                for address, device in devices.items():
+                    if isinstance(device, SavedDevice):
+                        self._add_saved_device(device)
+                    else:
+                        self[address] = device
+                self._changed_devices.clear()
+                self._saved_workdir = workdir
+                self._load_stats = {
+                    "devices": len(devices),
+                    "deferred": len(self._saved_devices),
+                    "seconds": monotonic() - start,
+                }
+                _LOGGER.debug(
+                    "Loaded %d saved devices in %.3f seconds, %d deferred",
+                    len(devices),
+                    self._load_stats["seconds"],
+                    self._load_stats["deferred"],
+                )
 
         if load_modem_aldb == 0:
             load_modem_aldb = False
@@ -345,10 +609,166 @@ class DeviceManager(SubscriberBase):
             id_all = id_devices == 2
             await self._id_manager.async_id_devices(refresh=id_all)
 
-    async def async_save(self, workdir):
-        """Save devices to a device information file."""
-        saved_devices_manager = SavedDeviceManager(workdir, self.modem)
-        await saved_devices_manager.async_save(self._devices)
+    async def async_save(self, workdir, compact=False):
+        """Save devices to a device information file.
+
+        Only the devices that changed since the devices were last loaded from or
+        saved to `workdir` are written, to the journal file. All devices are
+        written if `compact` is True or if the devices were not loaded from or
+        saved to `workdir` before.
+        """
+        async with self._saving_lock:
+            changed = self._changed_devices
+            self._changed_devices = set()
+            if compact or workdir != self._saved_workdir:
+                changed = None
+            saved_devices_manager = SavedDeviceManager(workdir, self.modem)
+            saved = await saved_devices_manager.async_save(
+                self._devices, self._saved_devices, changed
+            )
+            if saved:
+                self._saved_workdir = workdir
+            elif changed:
+                self._changed_devices.update(changed)
+
+    def start_autosave(
+        self,
+        workdir,
+        delay: float = AUTOSAVE_DELAY,
+        max_delay: float = AUTOSAVE_MAX_DELAY,
+    ):
+        """Save the changed devices when no device has changed for `delay` seconds.
+
+        The changed devices are saved at most `max_delay` seconds after the
+        first change. Must be called from the event loop.
+        """
+        self._autosave_workdir = workdir
+        self._autosave_delay = delay
+        self._autosave_max_delay = max_delay
+        if self._changed_devices:
+            self._schedule_autosave()
+
+    def stop_autosave(self):
+        """Stop saving the changed devices."""
+        self._autosave_workdir = None
+        self._autosave_deadline = None
+        if self._autosave_handle:
+            self._autosave_handle.cancel()
+            self._autosave_handle = None
+
+    def _schedule_autosave(self):
+        """Save the changed devices after the autosave delay."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._autosave_deadline is None:
+            self._autosave_deadline = now + self._autosave_max_delay
+        if self._autosave_handle:
+            self._autosave_handle.cancel()
+        delay = min(self._autosave_delay, self._autosave_deadline - now)
+        self._autosave_handle = loop.call_later(delay, self._autosave)
+
+    def _autosave(self):
+        """Save the changed devices."""
+        self._autosave_handle = None
+        self._autosave_deadline = None
+        if self._autosave_workdir is not None:
+            self._autosave_task = asyncio.ensure_future(
+                self.async_save(self._autosave_workdir)
+            )
+
+    def _track_changes(self, device: Device):
+        """Mark a device as changed now and when its ALDB or properties change."""
+        address = device.address
+        for topic in _CHANGE_TOPICS:
+            subscribe_topic(self._device_changed, f"{address.id}.{topic}")
+        subscribe_topic(
+            self._aldb_status_changed, f"{address.id}.{ALDB_STATUS_CHANGED}"
+        )
+        subscribe_topic(self._engine_version_changed, f"{address.id}.{ENGINE_VERSION}")
+        self._mark_changed(address)
+
+    def _untrack_changes(self, device: Device):
+        """Stop tracking the changes of a removed device and mark it as changed."""
+        if not isinstance(device, Device):
+            return
+        address = device.address
+        for topic in _CHANGE_TOPICS:
+            unsubscribe_topic(self._device_changed, f"{address.id}.{topic}")
+        unsubscribe_topic(
+            self._aldb_status_changed, f"{address.id}.{ALDB_STATUS_CHANGED}"
+        )
+        unsubscribe_topic(
+            self._engine_version_changed, f"{address.id}.{ENGINE_VERSION}"
+        )
+        self._mark_changed(address)
+
+    def _mark_changed(self, address: Address):
+        """Mark a device to be saved by the next save."""
+        self._changed_devices.add(address)
+        if self._autosave_workdir is not None:
+            self._schedule_autosave()
+
+    def _device_changed(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Mark a device as changed when its ALDB or properties change.
+
+        Subscribed to the parent topics so any argument is accepted.
+        """
+        self._mark_changed(Address(topic.getNameTuple()[0]))
+
+    def _aldb_status_changed(self, status, topic=pub.AUTO_TOPIC):
+        """Mark a device as changed when its ALDB status changes."""
+        self._mark_changed(Address(topic.getNameTuple()[0]))
+
+    def _engine_version_changed(self, version, topic=pub.AUTO_TOPIC):
+        """Mark a device as changed when its engine version changes."""
+        self._mark_changed(Address(topic.getNameTuple()[0]))
+
+    def _add_saved_device(self, saved_device: SavedDevice):
+        """Add a saved device to be created when it is first used."""
+        address = saved_device.address
+        self._devices.pop(address, None)
+        self._saved_devices[address] = saved_device
+        self._id_manager[address] = saved_device.device_id
+        subscribe_topic(self._saved_device_message, address.id)
+        self._call_subscribers(address=address.id, action=DeviceAction.ADDED)
+
+    def _remove_saved_device(self, address: Address) -> SavedDevice:
+        """Remove a saved device that is not created yet."""
+        unsubscribe_topic(self._saved_device_message, address.id)
+        return self._saved_devices.pop(address)
+
+    def _create_saved_device(self, address: Address) -> Device:
+        """Create a saved device.
+
+        The subscribers were told the device was added when it was loaded so
+        they are not told again.
+        """
+        saved_device = self._remove_saved_device(address)
+        start = monotonic()
+        device = saved_device.create_device()
+        if device is not None:
+            changed = address in self._changed_devices
+            self._devices[address] = device
+            self._track_changes(device)
+            # The new device is the same as the saved device
+            if not changed:
+                self._changed_devices.discard(address)
+        self._create_stats["devices"] += 1
+        self._create_stats["seconds"] += monotonic() - start
+        return device
+
+    def _saved_device_message(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Create a saved device when it sends its first message.
+
+        Listeners of the root topic receive a message before the listeners of
+        the subtopics so the handlers of the new device receive it as well.
+        """
+        try:
+            address = Address(topic.name.split(".")[0])
+        except ValueError:
+            return
+        if address in self._saved_devices:
+            self._create_saved_device(address)
 
     async def _async_device_identified(
         self, device_id: DeviceId, link_mode: AllLinkMode
@@ -358,7 +778,10 @@ class DeviceManager(SubscriberBase):
             return
 
         await self._linked_device.put(device_id.address)
-        device = self._devices.get(device_id.address)
+        saved_device = self._saved_devices.get(device_id.address)
+        if saved_device and saved_device.device_id == device_id:
+            return
+        device = self.get(device_id.address)
         if (
             device
             and device.cat == device_id.cat
@@ -398,7 +821,7 @@ class DeviceManager(SubscriberBase):
         This does not remove the modem as a controller to group 0.
         That is removed via All-Linking.
         """
-        if self._devices.get(address) is None:
+        if self.get(address) is None:
             return
         for rec in self[address].aldb.find(target=self.modem.address, in_use=True):
             if rec.group != 0 or rec.is_controller:  # do not process group 0 responder
@@ -0,0 +1,138 @@
+"""Find broken links between devices."""
+
+from __future__ import annotations
+
+from collections import Counter
+import logging
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from ...address import Address
+from ...aldb.aldb_record import ALDBRecord
+from ...constants import LinkStatus
+from ...topics import ALDB_LINK_CHANGED
+from ...utils import subscribe_topic, unsubscribe_topic
+
+if TYPE_CHECKING:
+    from ...device_types.device_base import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+# (device address, target address, group, is controller)
+LinkKey = Tuple[Address, Address, int, bool]
+
+
+class LinkAudit:
+    """Index the in use ALDB records of all devices to find broken links.
+
+    Every in use record is indexed by device, target, group and link mode so
+    the corresponding record in the target device is found with one lookup.
+    Call `subscribe` to keep the index current as ALDB records change.
+    """
+
+    def __init__(self, devices: dict[Address, Device]):
+        """Init the LinkAudit class."""
+        self._devices = devices
+        self._links: Counter[LinkKey] = Counter()
+        self._records: Dict[Address, Dict[int, Tuple[LinkKey, ALDBRecord]]] = {}
+        self._subscribed = []
+        self.rebuild()
+
+    def rebuild(self):
+        """Index the in use records of all devices."""
+        self._links.clear()
+        self._records = {}
+        for address in list(self._devices):
+            for rec in self._get_aldb_records(address).values():
+                if rec.is_in_use:
+                    self._add_record(address, rec)
+
+    def subscribe(self):
+        """Update the index when the ALDB records of a device change."""
+        for address in self._devices:
+            if address not in self._subscribed:
+                subscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+                self._subscribed.append(address)
+
+    def unsubscribe(self):
+        """Stop updating the index."""
+        for address in self._subscribed:
+            unsubscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+        self._subscribed = []
+
+    def get_broken_links(self) -> list[tuple[Address, ALDBRecord, LinkStatus]]:
+        """Return a list of broken links."""
+        broken_link_list = []
+        # The load status of each target device
+        loaded = {}
+        for address, records in self._records.items():
+            for key, rec in records.values():
+                _, target, group, is_controller = key
+                if target not in loaded:
+                    device = self._devices.get(target)
+                    loaded[target] = device.aldb.is_loaded if device else None
+                status = self._link_status(
+                    loaded[target], (target, address, group, not is_controller)
+                )
+                if status != LinkStatus.FOUND:
+                    broken_link_list.append((address, rec, status))
+        return broken_link_list
+
+    def test_link(self, address: Address, rec: ALDBRecord) -> LinkStatus:
+        """Test if a corresponding record exists in the linked device."""
+        device = self._devices.get(rec.target)
+        loaded = device.aldb.is_loaded if device else None
+        return self._link_status(
+            loaded, (rec.target, address, rec.group, not rec.is_controller)
+        )
+
+    def _link_status(self, loaded: bool, corresponding_key: LinkKey) -> LinkStatus:
+        """Return the status of a link from the key of the corresponding record.
+
+        `loaded` is None if the target device is not found.
+        """
+        if loaded is None:
+            return LinkStatus.MISSING_TARGET
+        if not loaded:
+            return LinkStatus.TARGET_DB_NOT_LOADED
+        if corresponding_key in self._links:
+            return LinkStatus.FOUND
+        if corresponding_key[3]:
+            return LinkStatus.MISSING_CONTROLLER
+        return LinkStatus.MISSING_RESPONDER
+
+    def _get_aldb_records(self, address: Address) -> Dict[int, ALDBRecord]:
+        """Return the ALDB records of a device by memory address.
+
+        The device manager reads the records of a saved device from its saved
+        data so the device is not created.
+        """
+        get_aldb_records = getattr(self._devices, "get_aldb_records", None)
+        if get_aldb_records is not None:
+            return get_aldb_records(address)
+        return dict(self._devices[address].aldb.items())
+
+    def _add_record(self, address: Address, rec: ALDBRecord):
+        """Add an in use record to the index."""
+        self._remove_record(address, rec.mem_addr)
+        if not rec.is_in_use:
+            return
+        key = (address, rec.target, rec.group, rec.is_controller)
+        self._links[key] += 1
+        self._records.setdefault(address, {})[rec.mem_addr] = (key, rec)
+
+    def _remove_record(self, address: Address, mem_addr: int):
+        """Remove the record at a memory address from the index."""
+        key, _ = self._records.get(address, {}).pop(mem_addr, (None, None))
+        if key is None:
+            return
+        self._links[key] -= 1
+        if not self._links[key]:
+            del self._links[key]
+
+    def _link_changed(self, record: ALDBRecord, sender: Address, deleted: bool):
+        """Update the index when a record changes."""
+        sender = Address(sender)
+        if deleted:
+            self._remove_record(sender, record.mem_addr)
+        else:
+            self._add_record(sender, record)
@@ -1,10 +1,20 @@
-"""Manage saving and restoring devices from JSON file."""
+"""Manage saving and restoring devices from JSON file.
+
+The devices are saved to the `insteon_devices.json` file. A save of only the
+devices that changed appends the changed devices to the
+`insteon_devices.journal` file, one JSON entry per line, and a full save
+replaces the device file and removes the journal. The first line of the journal
+holds the SHA-256 hash of the device file the journal applies to so a journal
+left from an earlier device file is ignored.
+"""
+import hashlib
 import json
 import logging
-from os import path
-from typing import Dict
+from os import fsync, path
+from typing import Dict, Iterable, Tuple, Union
 
 import aiofiles
+import aiofiles.os
 
 from ..address import Address
 from ..aldb.aldb_record import ALDBRecord
@@ -15,8 +25,12 @@ from .device_id_manager import DeviceId
 from .utils import create_device
 
 DEVICE_INFO_FILE = "insteon_devices.json"
+DEVICE_JOURNAL_FILE = "insteon_devices.journal"
 OLD_DEVICE_INFO_FILE = "insteon_plm_device_info.dat"
 _LOGGER = logging.getLogger(__name__)
+_async_fsync = aiofiles.os.wrap(fsync)
+# Hash of each device file keyed by path with the size and modification time
+_device_file_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
 
 
 def aldb_rec_to_dict(rec):
@@ -69,6 +83,55 @@ def _dict_to_device(device_dict):
     return device
 
 
+class SavedDevice:
+    """A device in the saved device file that has not been created yet.
+
+    Holds the device ID and the saved device data, including the ALDB
+    records, so the device and its handlers are only created when the device
+    is used.
+    """
+
+    def __init__(self, device_dict):
+        """Init the SavedDevice class."""
+        self._device_dict = device_dict
+        self._device_id = DeviceId(
+            Address(device_dict.get("address")),
+            device_dict.get("cat"),
+            device_dict.get("subcat"),
+            device_dict.get("firmware"),
+        )
+
+    @property
+    def address(self) -> Address:
+        """Return the device address."""
+        return self._device_id.address
+
+    @property
+    def device_id(self) -> DeviceId:
+        """Return the device ID."""
+        return self._device_id
+
+    @property
+    def device_dict(self):
+        """Return the saved device data."""
+        return self._device_dict
+
+    @property
+    def aldb_records(self) -> Dict[int, ALDBRecord]:
+        """Return the saved ALDB records by memory address."""
+        return dict_to_aldb_record(self._device_dict.get("aldb", {}))
+
+    def create_device(self) -> Device:
+        """Create the device from the saved device data."""
+        return _dict_to_device(self._device_dict)
+
+
+def _unknown_engine_version(device_dict):
+    """Return if the engine version of a saved device needs to be read."""
+    engine_version = device_dict.get("engine_version", 0xFF)
+    return engine_version in (0x03, 0xFF) and device_dict.get("cat") != 0x03
+
+
 def _device_to_dict(device_list):
     """Convert a device to a dictionary."""
     device_dict = []
@@ -109,6 +172,31 @@ def _device_to_dict(device_list):
     return device_dict
 
 
+def _journal_entry(address, device_list, saved_devices):
+    """Return the journal entry of a device or None if the device is not saved."""
+    if address in device_list:
+        device_dict = _device_to_dict({address: device_list[address]})
+        return device_dict[0] if device_dict else None
+    if saved_devices and address in saved_devices:
+        return saved_devices[address].device_dict
+    return {"address": address.id, "removed": True}
+
+
+def _file_hash(content):
+    """Return the SHA-256 hash of the content of a file or None if not found."""
+    if content is None:
+        return None
+    return hashlib.sha256(content).hexdigest()
+
+
+def _journal_header(line):
+    """Return the hash of the device file the journal applies to."""
+    try:
+        return json.loads(line).get("device_file_hash")
+    except (json.decoder.JSONDecodeError, AttributeError):
+        return None
+
+
 def dict_to_aldb_record(aldb_dict):
     """Convert a dictionary to an ALDB record."""
     records = {}
@@ -225,18 +313,62 @@ class SavedDeviceManager:
         self._workdir = workdir
         self._modem = modem
 
-    async def async_save(self, device_list: dict):
-        """Save all devices to the `insteon_devices.json` file for faster loading."""
-        device_dict = _device_to_dict(device_list)
-        await self._write_saved_devices(device_dict)
+    async def async_save(
+        self,
+        device_list: dict,
+        saved_devices: dict = None,
+        changed: Iterable[Address] = None,
+    ) -> bool:
+        """Save all devices to the `insteon_devices.json` file for faster loading.
+
+        `saved_devices` are the `SavedDevice` entries that were not created and
+        are saved unchanged.
+
+        If `changed` is given, only the devices with these addresses are
+        appended to the journal file, unless the journal is larger than the
+        device file or there is no device file, then all devices are saved.
+
+        Returns True if the devices were saved.
+        """
+        if changed is not None and self._workdir:
+            device_file_size, device_file_hash = await self._async_device_file_hash()
+            journal_size = await self._async_journal_size(device_file_hash)
+            if device_file_size and (journal_size or 0) < device_file_size:
+                entries = [
+                    _journal_entry(address, device_list, saved_devices)
+                    for address in changed
+                ]
+                entries = [entry for entry in entries if entry is not None]
+                if not entries:
+                    return True
+                return await self._write_journal(
+                    entries, device_file_hash if journal_size is None else None
+                )
 
-    async def async_load(self) -> Dict[Address, Device]:
-        """Load devices from the saved device file."""
+        device_dict = _device_to_dict(device_list)
+        if saved_devices:
+            device_dict.extend(
+                saved_device.device_dict for saved_device in saved_devices.values()
+            )
+        return await self._write_saved_devices(device_dict)
+
+    async def async_load(
+        self, lazy: bool = False
+    ) -> Dict[Address, Union[Device, SavedDevice]]:
+        """Load devices from the saved device file.
+
+        If `lazy` is True, the devices are returned as `SavedDevice` entries
+        except for the devices with an unknown engine version, which are
+        created to read the engine version.
+        """
         saved_devices = await self._read_saved_devices()
         device_list = {}
         for saved_device in saved_devices:
             address = Address(saved_device.get("address"))
             if address != self._modem.address:
+                if lazy and not _unknown_engine_version(saved_device):
+                    device_list[address] = SavedDevice(saved_device)
+                    continue
                 device = _dict_to_device(saved_device)
                 if device:
                     device_list[address] = device
@@ -271,31 +403,174 @@ class SavedDeviceManager:
             _LOGGER.debug("Really Loading saved device info.")
             return saved_devices
 
+        json_file = await self._async_read_file(DEVICE_INFO_FILE)
+        if json_file is None:
+            _LOGGER.debug("Saved device file not found")
+            return await self._read_old_device_file()
         try:
-            device_file = path.join(self._workdir, DEVICE_INFO_FILE)
-            async with aiofiles.open(device_file, "r") as afp:
-                json_file = ""
-                json_file = await afp.read()
+            saved_devices = json.loads(json_file)
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError):
+            _LOGGER.debug("Loading saved device file failed")
+        else:
+            device_file_hash = await self._async_cache_device_file_hash(json_file)
+            saved_devices = await self._read_journal(saved_devices, device_file_hash)
+        return saved_devices
+
+    async def _read_journal(self, saved_devices, device_file_hash):
+        """Apply the changed devices in the journal file to the saved devices."""
+        journal_file = path.join(self._workdir, DEVICE_JOURNAL_FILE)
+        try:
+            async with aiofiles.open(journal_file, "r") as afp:
+                lines = await afp.readlines()
+        except FileNotFoundError:
+            return saved_devices
+
+        if not lines or _journal_header(lines[0]) != device_file_hash:
+            _LOGGER.debug("Journal file does not apply to the saved device file")
+            return saved_devices
+
+        devices = {Address(device["address"]): device for device in saved_devices}
+        for line in lines[1:]:
             try:
-                saved_devices = json.loads(json_file)
+                entry = json.loads(line)
             except json.decoder.JSONDecodeError:
-                _LOGGER.debug("Loading saved device file failed")
+                _LOGGER.debug("Skipping incomplete journal entry")
+                continue
+            address = Address(entry["address"])
+            if entry.get("removed"):
+                devices.pop(address, None)
+            else:
+                devices[address] = entry
+        _LOGGER.debug("Applied %d journal entries", len(lines) - 1)
+        return list(devices.values())
+
+    async def _async_file_size(self, file_name):
+        """Return the size of a file in the work directory or None if not found."""
+        try:
+            return await aiofiles.os.path.getsize(path.join(self._workdir, file_name))
         except FileNotFoundError:
-            _LOGGER.debug("Saved device file not found")
-            saved_devices = await self._read_old_device_file()
-        return saved_devices
+            return None
+
+    async def _async_read_file(self, file_name):
+        """Return the content of a file in the work directory or None if not found."""
+        try:
+            async with aiofiles.open(path.join(self._workdir, file_name), "rb") as afp:
+                return await afp.read()
+        except FileNotFoundError:
+            return None
+
+    async def _async_device_file_hash(self):
+        """Return the size and hash of the device file or (0, None) if not found.
+
+        The device file is only read when its size or modification time
+        changed since its hash was cached.
+        """
+        device_file = path.join(self._workdir, DEVICE_INFO_FILE)
+        try:
+            stat = await aiofiles.os.stat(device_file)
+        except FileNotFoundError:
+            return 0, None
+        key, device_file_hash = _device_file_hashes.get(device_file, (None, None))
+        if key == (stat.st_size, stat.st_mtime_ns):
+            return stat.st_size, device_file_hash
+        content = await self._async_read_file(DEVICE_INFO_FILE)
+        if content is None:
+            return 0, None
+        return len(content), await self._async_cache_device_file_hash(content)
+
+    async def _async_cache_device_file_hash(self, content):
+        """Cache and return the hash of the content of the device file."""
+        device_file = path.join(self._workdir, DEVICE_INFO_FILE)
+        device_file_hash = _file_hash(content)
+        try:
+            stat = await aiofiles.os.stat(device_file)
+        except FileNotFoundError:
+            _device_file_hashes.pop(device_file, None)
+            return device_file_hash
+        if stat.st_size == len(content):
+            key = (stat.st_size, stat.st_mtime_ns)
+            _device_file_hashes[device_file] = (key, device_file_hash)
+        return device_file_hash
+
+    async def _async_journal_ends_with_newline(self):
+        """Return if the journal file is empty or ends with a complete line."""
+        journal_file = path.join(self._workdir, DEVICE_JOURNAL_FILE)
+        try:
+            async with aiofiles.open(journal_file, "rb") as afp:
+                if await afp.seek(0, 2) == 0:
+                    return True
+                await afp.seek(-1, 2)
+                return await afp.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    async def _async_journal_size(self, device_file_hash):
+        """Return the size of the journal of the device file or None if not found."""
+        journal_file = path.join(self._workdir, DEVICE_JOURNAL_FILE)
+        try:
+            async with aiofiles.open(journal_file, "r") as afp:
+                header = await afp.readline()
+        except FileNotFoundError:
+            return None
+        if _journal_header(header) != device_file_hash:
+            return None
+        return await self._async_file_size(DEVICE_JOURNAL_FILE)
 
-    async def _write_saved_devices(self, device_list):
+    async def _write_saved_devices(self, device_list) -> bool:
+        """Replace the device file and remove the journal file.
+
+        The devices are written to a temporary file that replaces the device
+        file so the device file is complete even if the write is interrupted.
+        """
         _LOGGER.debug("Writing %d devices to save file", len(device_list))
         device_file = path.join(self._workdir, DEVICE_INFO_FILE)
+        temp_file = f"{device_file}.tmp"
+        out_json = json.dumps(device_list, indent=2)
         try:
-            async with aiofiles.open(device_file, "w") as afp:
-                out_json = json.dumps(device_list, indent=2)
+            async with aiofiles.open(temp_file, "w") as afp:
                 await afp.write(out_json)
                 await afp.flush()
+                await _async_fsync(afp.fileno())
+            await aiofiles.os.replace(temp_file, device_file)
         except FileNotFoundError as ex:
             _LOGGER.error("Cannot write to file %s", device_file)
             _LOGGER.error("Exception: %s", str(ex))
+            return False
+        await self._async_cache_device_file_hash(out_json.encode())
+
+        try:
+            await aiofiles.os.remove(path.join(self._workdir, DEVICE_JOURNAL_FILE))
+        except FileNotFoundError:
+            pass
+        return True
+
+    async def _write_journal(self, entries, device_file_hash=None) -> bool:
+        """Append changed devices to the journal file.
+
+        If `device_file_hash` is given, a new journal file is started for the
+        device file with that hash.
+        """
+        _LOGGER.debug("Writing %d devices to journal file", len(entries))
+        journal_file = path.join(self._workdir, DEVICE_JOURNAL_FILE)
+        lines = [json.dumps(entry) for entry in entries]
+        if device_file_hash is not None:
+            lines.insert(0, json.dumps({"device_file_hash": device_file_hash}))
+        elif not await self._async_journal_ends_with_newline():
+            # Complete the last entry of an interrupted write so the new
+            # entries start on their own line
+            lines.insert(0, "")
+        try:
+            async with aiofiles.open(
+                journal_file, "a" if device_file_hash is None else "w"
+            ) as afp:
+                await afp.write("".join(f"{line}\n" for line in lines))
+                await afp.flush()
+                await _async_fsync(afp.fileno())
+        except FileNotFoundError as ex:
+            _LOGGER.error("Cannot write to file %s", journal_file)
+            _LOGGER.error("Exception: %s", str(ex))
+            return False
+        return True
 
     async def _read_old_device_file(self):
         """Load device information from the insteonplm device info file."""
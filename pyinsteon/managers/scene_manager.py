@@ -1,19 +1,22 @@
 """Manage Insteon Scenes."""
 import asyncio
+from collections import Counter
 import json
 import logging
 from os import path
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
 import aiofiles
 import voluptuous as vol
 
 from .. import devices
 from ..address import Address
-from ..constants import ResponseStatus
+from ..aldb.aldb_record import ALDBRecord
+from ..constants import DeviceAction, ResponseStatus
 from ..handlers.send_all_link_off import SendAllLinkOffCommandHandler
 from ..handlers.send_all_link_on import SendAllLinkOnCommandHandler
-from ..utils import multiple_status
+from ..topics import ALDB_LINK_CHANGED
+from ..utils import multiple_status, subscribe_topic
 from .device_link_manager import LinkInfo
 
 SCENE_FILE = "insteon_scenes.json"
@@ -42,6 +45,150 @@ def _json_key_to_int(key):
     return key
 
 
+class SceneIndex:
+    """Index the modem scenes from the ALDB records of all devices.
+
+    A scene is a modem controller group. The index holds the device responder
+    records that target the modem and the responders of the modem controller
+    records by group. It is built on first use, updated from the ALDB link
+    changed events of each device and rebuilt when the modem changes.
+    """
+
+    def __init__(self, devices_mgr):
+        """Init the SceneIndex class."""
+        self._devices = devices_mgr
+        self._modem = None
+        self._subscribed = set()
+        # Responder records of group -> responder -> memory address
+        self._responders: Dict[
+            Group, Dict[ResponderAddress, Dict[int, ALDBRecord]]
+        ] = {}
+        # Responders of the modem controller records of each group
+        self._controllers: Dict[Group, Counter[ResponderAddress]] = {}
+        # Index entries of the records of each device keyed by memory address
+        self._records: Dict[
+            Address, Dict[int, Tuple[Group, ResponderAddress, bool]]
+        ] = {}
+        self._devices.subscribe(self._device_added_or_removed)
+
+    def get_scenes(self) -> Dict[Group, Dict[ResponderAddress, List[LinkInfo]]]:
+        """Return the device links of each scene."""
+        self._check_modem()
+        return {group: self.get_scene(group) for group in sorted(self._responders)}
+
+    def get_scene(self, group: int) -> Dict[ResponderAddress, List[LinkInfo]]:
+        """Return the device links of a scene."""
+        self._check_modem()
+        controllers = self._controllers.get(group, {})
+        links = {}
+        for responder, records in self._responders.get(group, {}).items():
+            has_controller = responder in controllers
+            links[responder] = [
+                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
+                for _, rec in sorted(records.items(), reverse=True)
+            ]
+        return links
+
+    def rebuild(self):
+        """Rebuild the scene index from the ALDB of all devices."""
+        self._modem = self._devices.modem
+        self._responders = {}
+        self._controllers = {}
+        self._records = {}
+        for address in list(self._devices):
+            self._index_device(address)
+
+    def _check_modem(self):
+        """Rebuild the index if the modem changed since it was built."""
+        if self._modem is None or self._modem is not self._devices.modem:
+            self.rebuild()
+
+    def _index_device(self, address: Address):
+        """Replace the index entries of a device with its in use records."""
+        self._unindex_device(address)
+        if address not in self._subscribed:
+            subscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+            self._subscribed.add(address)
+        for rec in self._devices.get_aldb_records(address).values():
+            self._index_record(address, rec)
+
+    def _unindex_device(self, address: Address):
+        """Remove all records of a device from the index."""
+        for mem_addr in list(self._records.get(address, {})):
+            self._unindex_record(address, mem_addr)
+        self._records.pop(address, None)
+
+    def _index_record(self, sender: Address, rec: ALDBRecord):
+        """Add a scene record to the index."""
+        self._unindex_record(sender, rec.mem_addr)
+        if not rec.is_in_use or self._modem is None:
+            return
+        modem_address = self._modem.address
+        if sender == modem_address:
+            if not rec.is_controller:
+                return
+            responder = Address(rec.target)
+            self._controllers.setdefault(rec.group, Counter())[responder] += 1
+        elif rec.is_controller or rec.group == 0 or rec.target != modem_address:
+            return
+        else:
+            responder = sender
+            responders = self._responders.setdefault(rec.group, {})
+            responders.setdefault(responder, {})[rec.mem_addr] = rec
+        entry = (rec.group, responder, rec.is_controller)
+        self._records.setdefault(sender, {})[rec.mem_addr] = entry
+
+    def _unindex_record(self, sender: Address, mem_addr: int):
+        """Remove a record from the index."""
+        entry = self._records.get(sender, {}).pop(mem_addr, None)
+        if entry is None:
+            return
+        group, responder, is_controller = entry
+        if is_controller:
+            controllers = self._controllers[group]
+            controllers[responder] -= 1
+            if not controllers[responder]:
+                controllers.pop(responder)
+            if not controllers:
+                self._controllers.pop(group)
+            return
+        responders = self._responders[group]
+        records = responders[responder]
+        records.pop(mem_addr)
+        # Remove empty branches so the index only holds existing scenes
+        if not records:
+            responders.pop(responder)
+        if not responders:
+            self._responders.pop(group)
+
+    def _link_changed(self, record: ALDBRecord, sender: Address, deleted: bool):
+        """Update the index when a record changes."""
+        if self._modem is None or self._modem is not self._devices.modem:
+            return
+        sender = Address(sender)
+        if deleted:
+            self._unindex_record(sender, record.mem_addr)
+        else:
+            self._index_record(sender, record)
+
+    def _device_added_or_removed(self, address: str, action: DeviceAction):
+        """Update the index when a device is added or removed."""
+        if self._modem is None:
+            return
+        try:
+            address = Address(address)
+        except ValueError:
+            # X10 devices do not have an All-Link Database
+            return
+        if action == DeviceAction.REMOVED:
+            self._unindex_device(address)
+        elif action == DeviceAction.ADDED:
+            self._index_device(address)
+
+
+_scene_index = SceneIndex(devices)
+
+
 async def _get_scene_device_status(group: int):
     """Get the status of the devices in a scene."""
     scene = await async_get_scene(group)
@@ -67,72 +214,30 @@ async def async_trigger_scene_off(group):
 
 async def async_get_scenes(work_dir=None):
     """Return a list of scenes."""
-    scenes: Dict[Group, Dict[str, Union[Dict[ResponderAddress, LinkInfo], str]]] = {}
     if work_dir:
         await async_load_scene_names(work_dir=work_dir)
-    for addr in devices:
-        device = devices[addr]
-        if device == devices.modem:
-            continue
-        for rec in device.aldb.find(
-            target=devices.modem.address, is_controller=False, in_use=True
-        ):
-            if rec.group == 0:
-                continue
-            if not scenes.get(rec.group):
-                scenes[rec.group] = {}
-                scenes[rec.group]["name"] = _scene_names.get(
-                    rec.group, f"Insteon Scene {rec.group}"
-                )
-                scenes[rec.group]["group"] = rec.group
-                scenes[rec.group]["devices"] = {}
-            scene = scenes.get(rec.group)
-            if not scene["devices"].get(device.address):
-                scene["devices"][device.address] = []
-            has_controller = False
-            for _ in devices.modem.aldb.find(
-                target=device.address, group=rec.group, is_controller=True, in_use=True
-            ):
-                has_controller = True
-                break
-            scene["devices"][device.address].append(
-                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
-            )
-    return scenes
+    return {
+        group: _scene(group, links)
+        for group, links in _scene_index.get_scenes().items()
+    }
 
 
 async def async_get_scene(scene_num: int, work_dir: str = None):
     """Return a scenes."""
-    scene: Dict[str, Union[Dict[ResponderAddress, LinkInfo], str]] = {}
     if work_dir:
         await async_load_scene_names(work_dir=work_dir)
-    scene["name"] = _scene_names.get(scene_num, f"Insteon Scene {scene_num}")
-    scene["group"] = scene_num
-    scene["devices"] = {}
-    for addr in devices:
-        device = devices[addr]
-        if device == devices.modem:
-            continue
-        for rec in device.aldb.find(
-            target=devices.modem.address,
-            is_controller=False,
-            in_use=True,
-            group=scene_num,
-        ):
-            if rec.group == 0:
-                continue
-            if not scene["devices"].get(device.address):
-                scene["devices"][device.address] = []
-            has_controller = False
-            for _ in devices.modem.aldb.find(
-                target=device.address, group=rec.group, is_controller=True, in_use=True
-            ):
-                has_controller = True
-                break
-            scene["devices"][device.address].append(
-                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
-            )
-    return scene
+    return _scene(scene_num, _scene_index.get_scene(scene_num))
+
+
+def _scene(
+    group: int, links: Dict[ResponderAddress, List[LinkInfo]]
+) -> Dict[str, Union[Dict[ResponderAddress, List[LinkInfo]], str]]:
+    """Return the scene data of a group."""
+    return {
+        "name": _scene_names.get(group, f"Insteon Scene {group}"),
+        "group": group,
+        "devices": links,
+    }
 
 
 def set_scene_name(scene_num: int, name: str):
@@ -7,10 +7,7 @@ from ..constants import ResponseStatus
 from ..handlers.get_im_info import GetImInfoHandler
 from ..managers.device_id_manager import DeviceId
 from ..managers.utils import create_device
-from .http_transport import async_connect_http
-from .mock.mock_transport import async_connect_mock
 from .protocol import Protocol
-from .serial_transport import async_connect_serial, async_connect_socket
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,19 +57,30 @@ async def async_modem_connect(
     if not device and not host:
         raise ValueError("Must specify either a device or a host")
 
+    # The transports are imported when used to avoid importing aiohttp and
+    # pyserial unless needed
+    # pylint: disable=import-outside-toplevel
     if device:
+        from .serial_transport import async_connect_serial
+
         connect_method = partial(async_connect_serial, **{"device": device})
 
     elif mock:
+        from .mock.mock_transport import async_connect_mock
+
         connect_method = partial(async_connect_mock, **{"host": host, "port": port})
 
     elif hub_version == 2:
+        from .http_transport import async_connect_http
+
         connect_method = partial(
             async_connect_http,
             **{"host": host, "username": username, "password": password, "port": port},
         )
 
     else:
+        from .serial_transport import async_connect_socket
+
         connect_method = partial(async_connect_socket, **{"host": host, "port": port})
 
     protocol = Protocol(connect_method=connect_method)
@@ -1,15 +1,19 @@
 """Read and write to the Hub."""
 import asyncio
 import logging
+from time import monotonic
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.client_exceptions import ClientError
 
 from .hub_connection_exception import HubConnectionException
 
 _LOGGER = logging.getLogger(__name__)
 SESSION_TIMEOUT = ClientTimeout(total=300)
-PRIOR_CONN_CLOSE_PAUSE = 0.1
+CONNECTION_LIMIT = 1
+KEEPALIVE_TIMEOUT = 15
+BUFFER_SIZE = 200  # Hex characters in the Hub buffer
+EMPTY_BUFFER = "0" * BUFFER_SIZE
 
 
 def _log_error(status):
@@ -27,32 +31,109 @@ def _log_error(status):
         _LOGGER.error("Check the configuration and restart the Hub and the application")
 
 
+def _is_overrun(last_buffer, hub_buffer, last_stop, this_stop):
+    """Return True if the Hub wrote past the last read position.
+
+    Data outside the range from the last read position to the current write
+    position only changes if the Hub wrapped around the whole buffer. A range
+    of zeros means the Hub cleared the buffer instead.
+    """
+    if this_stop < last_stop:
+        outside = hub_buffer[this_stop:last_stop]
+        last_outside = last_buffer[this_stop:last_stop]
+    else:
+        outside = hub_buffer[this_stop:] + hub_buffer[:last_stop]
+        last_outside = last_buffer[this_stop:] + last_buffer[:last_stop]
+    return outside not in (last_outside, "0" * len(outside))
+
+
+# pylint: disable=too-many-instance-attributes,not-async-context-manager
 class HttpReaderWriter:
-    """HTTP reader and writer."""
+    """HTTP reader and writer.
 
-    def __init__(self, auth):
+    All requests share one client session with a keep-alive connector so the
+    Hub connection is reused between polls. The session is closed and created
+    again after a client or timeout error.
+    """
+
+    def __init__(
+        self, auth, limit=CONNECTION_LIMIT, keepalive_timeout=KEEPALIVE_TIMEOUT
+    ):
         """Init the HttpReaderWriter class."""
         self._auth = auth
-        self._last_read = asyncio.Queue()
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._last_stop = 0
+        self._last_buffer = None
+        self._syncing = False
         self._read_write_lock = asyncio.Lock()
+        self._session = None
+        self._sessions = 0
+        self._requests = 0
+        self._errors = 0
+        self._last_latency = 0.0
+        self._total_latency = 0.0
+        self._bytes_read = 0
+        self._overruns = 0
+        self._lost_bytes = 0
+
+    @property
+    def stats(self):
+        """Return the request statistics of the HTTP session.
+
+        Latency values are in seconds. `lost_bytes` counts the bytes of
+        messages partly overwritten in the Hub buffer between two reads, which
+        is a lower bound when the buffer wraps more than once.
+        """
+        requests = self._requests
+        return {
+            "requests": requests,
+            "errors": self._errors,
+            "reconnects": max(self._sessions - 1, 0),
+            "last_latency": self._last_latency,
+            "average_latency": self._total_latency / requests if requests else 0.0,
+            "bytes_read": self._bytes_read,
+            "overruns": self._overruns,
+            "lost_bytes": self._lost_bytes,
+        }
+
+    def reset_stats(self):
+        """Reset the request statistics."""
+        self._sessions = 1 if self._session is not None else 0
+        self._requests = 0
+        self._errors = 0
+        self._last_latency = 0.0
+        self._total_latency = 0.0
+        self._bytes_read = 0
+        self._overruns = 0
+        self._lost_bytes = 0
+
+    async def async_close(self):
+        """Close the HTTP session."""
+        session = self._session
+        self._session = None
+        if session is not None:
+            await session.close()
 
     async def async_test_connection(self, url):
         """Test the connection to the hub."""
         try:
             async with self._read_write_lock:
-                await asyncio.sleep(PRIOR_CONN_CLOSE_PAUSE)
-                async with ClientSession(
-                    auth=self._auth, timeout=SESSION_TIMEOUT
-                ) as session:
-                    async with session.get(url) as response:
-                        if response:
-                            _LOGGER.debug("Test connection status: %d", response.status)
-                            if response.status == 200:
-                                return True
-                            _log_error(response.status)
+                session = self._get_session()
+                start = self._start_request()
+                async with session.get(url) as response:
+                    if response:
+                        await response.read()
+                        self._end_request(start)
+                        _LOGGER.debug("Test connection status: %d", response.status)
+                        if response.status == 200:
+                            return True
+                        _log_error(response.status)
         except asyncio.TimeoutError:
+            await self._async_request_failed()
             _LOGGER.error("An aiohttp timeout error occurred during test connection.")
         except ClientError as exc:
+            await self._async_request_failed()
             _LOGGER.error("An client error occurred: %s", str(exc))
         return False
 
@@ -60,20 +141,19 @@ class HttpReaderWriter:
         """Read from the url."""
         try:
             async with self._read_write_lock:
-                await asyncio.sleep(PRIOR_CONN_CLOSE_PAUSE)
-                async with ClientSession(
-                    auth=self._auth, timeout=SESSION_TIMEOUT
-                ) as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                        else:
-                            _log_error(response.status)
-                            raise HubConnectionException(
-                                f"Connection status error: {response.status}"
-                            )
+                session = self._get_session()
+                start = self._start_request()
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        html = await response.text()
+                        self._end_request(start)
+                    else:
+                        _log_error(response.status)
+                        raise HubConnectionException(
+                            f"Connection status error: {response.status}"
+                        )
         except (asyncio.TimeoutError, ClientError) as ex:
-            await session.close()
+            await self._async_request_failed()
             _LOGGER.error("Client error: (%s) %s", type(ex), str(ex))
             raise HubConnectionException(str(ex)) from ex
         except asyncio.CancelledError as cancel_error:
@@ -90,62 +170,141 @@ class HttpReaderWriter:
         _LOGGER.debug("Writing message: %s", url)
         try:
             async with self._read_write_lock:
-                async with ClientSession(
-                    auth=self._auth, timeout=SESSION_TIMEOUT
-                ) as session:
-                    async with session.post(url) as response:
-                        return_status = response.status
-                        _LOGGER.debug("Post status: %s", response.status)
-                        if response.status == 200:
-                            await self.reset_reader()
-                        else:
-                            _log_error(response.status)
+                session = self._get_session()
+                start = self._start_request()
+                async with session.post(url) as response:
+                    await response.read()
+                    self._end_request(start)
+                    return_status = response.status
+                    _LOGGER.debug("Post status: %s", response.status)
+                    if response.status == 200:
+                        await self.reset_reader()
+                    else:
+                        _log_error(response.status)
         except ClientError:
+            await self._async_request_failed()
             _LOGGER.error("Hub write failure (ClientError)")
         except asyncio.TimeoutError:
+            await self._async_request_failed()
             _LOGGER.error("Hub write failure (TimeoutError)")
 
         return return_status
 
     async def reset_reader(self):
-        """Reset the reader to default position."""
-        await self._set_last_read(0)
+        """Reset the reader to default position.
+
+        The Hub clears its buffer after a command is written.
+        """
+        self._last_stop = 0
+        self._last_buffer = None
+
+    async def sync_reader(self):
+        """Start the next read at the current Hub write position.
+
+        Data already in the Hub buffer is skipped rather than cleared with an
+        extra request to the Hub.
+        """
+        await self.reset_reader()
+        self._syncing = True
+
+    def _get_session(self):
+        """Return the HTTP session, creating it if needed."""
+        session = self._session
+        if session is None or session.closed:
+            connector = TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            session = ClientSession(
+                auth=self._auth, timeout=SESSION_TIMEOUT, connector=connector
+            )
+            self._session = session
+            self._sessions += 1
+            if self._sessions > 1:
+                _LOGGER.debug("Reconnected the Hub session")
+        return session
+
+    def _start_request(self):
+        """Count a request and return its start time."""
+        self._requests += 1
+        return monotonic()
+
+    def _end_request(self, start):
+        """Record the latency of a request."""
+        self._last_latency = monotonic() - start
+        self._total_latency += self._last_latency
+
+    async def _async_request_failed(self):
+        """Close the session after an error so the next request reconnects."""
+        self._errors += 1
+        await self.async_close()
 
     async def _parse_buffer(self, html):
-        last_stop = 0
-        if not self._last_read.empty():
-            last_stop = self._last_read.get_nowait()
-        buffer = ""
-        raw_text = html.replace("<response><BS>", "")
-        raw_text = raw_text.replace("</BS></response>", "")
-        raw_text = raw_text.strip()
-        odd_length = len(raw_text) % 2
-        if odd_length:
+        """Return the hex data added to the Hub buffer since the last read.
+
+        The Hub buffer is a circular buffer of 200 hex characters followed by
+        the write position as 2 hex characters.
+        """
+        start = html.find("<BS>")
+        end = html.find("</BS>")
+        if start != -1 and end != -1:
+            raw_text = html[start + 4 : end].strip()
+        else:
+            raw_text = html.strip()
+        if len(raw_text) % 2 or len(raw_text) < BUFFER_SIZE + 2:
             return None
-        if raw_text[:200] == "0" * 200:
+        hub_buffer = raw_text[:BUFFER_SIZE]
+        if hub_buffer == EMPTY_BUFFER:
             # Likely the buffer was cleared
             await self.reset_reader()
             return None
         this_stop = int(raw_text[-2:], 16)
+        last_stop = self._last_stop
+        last_buffer = self._last_buffer
+        self._last_stop = this_stop
+        self._last_buffer = hub_buffer
+        if self._syncing:
+            self._syncing = False
+            return None
+
+        if last_buffer is not None and _is_overrun(
+            last_buffer, hub_buffer, last_stop, this_stop
+        ):
+            return self._resync(hub_buffer, this_stop)
+
         if this_stop > last_stop:
             _LOGGER.debug("Raw buffer: %s", raw_text)
             _LOGGER.debug("Buffer from %d to %d", last_stop, this_stop)
-            buffer = raw_text[last_stop:this_stop]
+            buffer = hub_buffer[last_stop:this_stop]
         elif this_stop < last_stop:
             _LOGGER.debug("Raw buffer: %s", raw_text)
             _LOGGER.debug("Buffer from %d to 200 and 0 to %d", last_stop, this_stop)
-            buffer_hi = raw_text[last_stop:200]
+            buffer_hi = hub_buffer[last_stop:]
             if buffer_hi == "0" * len(buffer_hi):
                 # The buffer was probably reset since the last read
                 buffer_hi = ""
-            buffer_low = raw_text[0:this_stop]
-            buffer = f"{buffer_hi}{buffer_low}"
+            buffer = f"{buffer_hi}{hub_buffer[:this_stop]}"
         else:
-            buffer = None
-        await self._set_last_read(this_stop)
+            return None
+        self._bytes_read += len(buffer) // 2
         return buffer
 
-    async def _set_last_read(self, val):
-        while not self._last_read.empty():
-            await self._last_read.get()
-        await self._last_read.put(val)
+    def _resync(self, hub_buffer, this_stop):
+        """Return the Hub buffer after it wrapped past the last read position.
+
+        Everything in the buffer is newer than the last read, so the whole
+        buffer is returned from the oldest to the newest byte, less the tail
+        of the message that was partly overwritten.
+        """
+        buffer = f"{hub_buffer[this_stop:]}{hub_buffer[:this_stop]}"
+        start = buffer.find("02")
+        while start != -1 and start % 2:
+            start = buffer.find("02", start + 1)
+        if start == -1:
+            start = len(buffer)
+        self._overruns += 1
+        self._lost_bytes += start // 2
+        self._bytes_read += (len(buffer) - start) // 2
+        _LOGGER.warning("Hub buffer overrun, at least %d bytes were lost", start // 2)
+        return buffer[start:] or None
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from binascii import Error, Incomplete, unhexlify
+from time import monotonic
 
 import aiohttp
 
@@ -11,6 +12,9 @@ from .msg_to_url import convert_to_url
 
 _LOGGER = logging.getLogger(__name__)
 READ_WAIT = 0.5
+MIN_READ_WAIT = 0.1
+MAX_READ_WAIT = 1.0
+READ_WAIT_BACKOFF = 1.5
 SESSION_RETRIES = 30
 RECONNECT_WAIT = 7
 
@@ -63,6 +67,14 @@ class HttpTransport(asyncio.Transport):
         self._last_read = asyncio.Queue()
         self._last_msg = None
         self._reader_task = None
+        self._min_read_wait = MIN_READ_WAIT
+        self._max_read_wait = MAX_READ_WAIT
+        self._read_wait = MIN_READ_WAIT
+        self._poll_now = asyncio.Event()
+        self._last_poll = None
+        self._deliveries = 0
+        self._last_delivery_latency = 0.0
+        self._total_delivery_latency = 0.0
 
     @property
     def write_wait(self):
@@ -85,10 +97,63 @@ class HttpTransport(asyncio.Transport):
         """
         return self._closing
 
+    @property
+    def min_read_wait(self):
+        """Return the shortest time between reads of the Hub buffer."""
+        return self._min_read_wait
+
+    @min_read_wait.setter
+    def min_read_wait(self, value: float):
+        """Set the shortest time between reads of the Hub buffer."""
+        if value <= 0 or value > self._max_read_wait:
+            raise ValueError("Minimum read wait must be between 0 and the maximum")
+        self._min_read_wait = value
+        self._read_wait = min(max(self._read_wait, value), self._max_read_wait)
+
+    @property
+    def max_read_wait(self):
+        """Return the longest time between reads of the Hub buffer."""
+        return self._max_read_wait
+
+    @max_read_wait.setter
+    def max_read_wait(self, value: float):
+        """Set the longest time between reads of the Hub buffer."""
+        if value < self._min_read_wait:
+            raise ValueError("Maximum read wait must not be less than the minimum")
+        self._max_read_wait = value
+        self._read_wait = min(self._read_wait, value)
+
+    @property
+    def read_wait(self):
+        """Return the current time between reads of the Hub buffer."""
+        return self._read_wait
+
+    @property
+    def stats(self):
+        """Return the request and polling statistics of the Hub session.
+
+        `delivery_latency` is the time from the previous read to the delivery
+        of new data, the longest a message can have waited in the Hub buffer.
+        Times are in seconds.
+        """
+        deliveries = self._deliveries
+        return {
+            **self._reader_writer.stats,
+            "read_wait": self._read_wait,
+            "deliveries": deliveries,
+            "delivery_latency": self._last_delivery_latency,
+            "average_delivery_latency": (
+                self._total_delivery_latency / deliveries if deliveries else 0.0
+            ),
+        }
+
     def close(self):
         """Close the transport."""
         _LOGGER.debug("Closing Hub session")
         self._closing = True
+        if not self._reader_lock.locked():
+            # The reader closes the session when it stops
+            asyncio.ensure_future(self._reader_writer.async_close())
 
     def get_write_buffer_size(self):
         """Rreturn 0 (i.e. none) always."""
@@ -136,6 +201,9 @@ class HttpTransport(asyncio.Transport):
                     await asyncio.sleep(READ_WAIT)
                 else:
                     self._last_msg = msg
+                    # Read the response to the message sooner
+                    self._read_wait = self._min_read_wait
+                    self._poll_now.set()
 
     async def async_test_connection(self):
         """Test the connection to the hub."""
@@ -153,16 +221,10 @@ class HttpTransport(asyncio.Transport):
         """Not implemented."""
         raise NotImplementedError("HTTP connections do not support writelines")
 
-    async def _clear_buffer(self):
-        _LOGGER.debug("..................Clearing the buffer..............")
-        url = f"http://{self._host}:{self._port}/1?XB=M=1"
-        await self._async_write_url(url)
-
     # pylint: disable=broad-except
     async def _ensure_reader(self):
         _LOGGER.info("Insteon Hub reader started")
-        await self._clear_buffer()
-        await self._reader_writer.reset_reader()
+        await self._reader_writer.sync_reader()
         url = f"http://{self._host}:{self._port}/buffstatus.xml"
         retry = 0
         async with self._reader_lock:
@@ -170,6 +232,8 @@ class HttpTransport(asyncio.Transport):
                 buffer = None
                 async with self._read_write_lock:
                     try:
+                        last_poll = self._last_poll
+                        self._last_poll = monotonic()
                         buffer = await self._reader_writer.async_read(url)
                     except HubConnectionException:
                         retry += 1
@@ -197,10 +261,42 @@ class HttpTransport(asyncio.Transport):
                                 _LOGGER.warning("Invalid buffer: %s", buffer)
                             else:
                                 self._protocol.data_received(bin_buffer)
+                                self._record_delivery(last_poll)
+                        self._update_read_wait(bool(buffer))
                 if not self._closing:
-                    await asyncio.sleep(READ_WAIT)
+                    await self._async_wait_to_read()
+            await self._reader_writer.async_close()
         _LOGGER.info("Insteon Hub reader stopped")
 
+    def _update_read_wait(self, received: bool):
+        """Read faster after data is received and back off when idle."""
+        if received:
+            self._read_wait = self._min_read_wait
+        else:
+            self._read_wait = min(
+                self._read_wait * READ_WAIT_BACKOFF, self._max_read_wait
+            )
+
+    def _record_delivery(self, last_poll):
+        """Record the time since the previous read for delivered data."""
+        if last_poll is None:
+            return
+        self._last_delivery_latency = monotonic() - last_poll
+        self._total_delivery_latency += self._last_delivery_latency
+        self._deliveries += 1
+
+    async def _async_wait_to_read(self):
+        """Wait for the next read or until a message is written.
+
+        The event is cleared after the wait so a message written during the
+        previous read is read without waiting.
+        """
+        try:
+            await asyncio.wait_for(self._poll_now.wait(), self._read_wait)
+        except asyncio.TimeoutError:
+            pass
+        self._poll_now.clear()
+
     def _reader_closed_callback(self, exc):
         """Call when the reader closes."""
         self._closing = True
@@ -1,15 +1,44 @@
 """Insteon inbound message data structure defintion."""
 from binascii import hexlify
 import logging
-from typing import Tuple
+import struct
+from typing import Callable, Generator, Tuple
 
 from . import MessageBase
-from ...constants import AckNak, MessageId
+from ...constants import MESSAGE_START_CODE, AckNak, MessageId
 from ...data_types.message_flags import MessageFlags
 from .message_definition import MessageDefinition
 from .message_definitions import FLD_EXT_SEND_ACK, INBOUND_MSG_DEF, MessageField
 
 _LOGGER = logging.getLogger(__name__)
+_START_CODE = 0x02
+_FLAGS_BYTE = 5
+_EXTENDED_FLAG = 0x10
+
+
+def _build_definition_table():
+    """Build the message definition lookup table.
+
+    The table is keyed by the message ID byte and the extended flag bit. Only
+    the Send Standard or Extended message (0x62) has an extended variant.
+    """
+    table = {}
+    for msg_id, msg_def in INBOUND_MSG_DEF.items():
+        table[(int(msg_id), False)] = msg_def
+    table[(int(MessageId.SEND_EXTENDED), True)] = MessageDefinition(
+        MessageId.SEND_EXTENDED, FLD_EXT_SEND_ACK
+    )
+    return table
+
+
+INBOUND_DEF_TABLE = _build_definition_table()
+MESSAGE_LENGTHS = {key: len(msg_def) for key, msg_def in INBOUND_DEF_TABLE.items()}
+_MESSAGE_IDS = frozenset(int(msg_id) for msg_id in MessageId)
+# The modem can respond to these commands with only a NAK byte
+_NAK_ONLY_DEF = {
+    int(msg_id): MessageDefinition(msg_id, [MessageField("ack", 1, AckNak)])
+    for msg_id in (MessageId.GET_IM_CONFIGURATION, MessageId.GET_IM_INFO)
+}
 
 
 def trim_data(raw_data: bytearray):
@@ -21,27 +50,62 @@ def trim_data(raw_data: bytearray):
 
 
 class Inbound(MessageBase):
-    """Insteon inbound message data definition."""
+    """Insteon inbound message data definition.
+
+    The message fields are unpacked from the raw data in a single step. Field
+    types other than `int` and enums, such as `Address` and `UserData`, are
+    created the first time the field is accessed.
+    """
 
+    # pylint: disable=super-init-not-called
     def __init__(self, msg_def: MessageDefinition, raw_data: bytearray):
         """Init the Inbound message class."""
+        self._start_code = MESSAGE_START_CODE
+        self._message_id = msg_def.message_id
         self._fields = msg_def.fields
         self._len = len(msg_def)
-        field_vals = self._slice_data(msg_def.slices, raw_data)
-        super().__init__(msg_def, **field_vals)
+        self._lazy_fields = {}
+        try:
+            values = msg_def.decoder.unpack_from(raw_data)
+        except struct.error as ex:
+            raise ValueError(f"Invalid message data: {raw_data.hex()}") from ex
+        for (name, field_type, lazy), value in zip(msg_def.field_types, values):
+            if lazy:
+                self._lazy_fields[name] = (field_type, value)
+            elif field_type is int:
+                setattr(self, name, value)
+            else:
+                setattr(self, name, field_type(value))
+
+    def __getattr__(self, name):
+        """Create a lazy field value on first access."""
+        try:
+            field_type, value = self.__dict__["_lazy_fields"].pop(name)
+        except KeyError as ex:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from ex
+        val = field_type(value)
+        setattr(self, name, val)
+        return val
 
     def __len__(self):
         """Emit the length of the message."""
         return self._len
 
-    def _slice_data(self, slices, raw_data):
-        curr_slice = 2
-        field_vals = {}
-        for field in self._fields:
-            val = field.type(raw_data[slices[curr_slice]])
-            field_vals[field.name] = val
-            curr_slice += 1
-        return field_vals
+    def raw_field(self, name):
+        """Return the unpacked value of a field without creating the field type.
+
+        Single byte fields are returned as `int` and multi-byte fields as `bytes`.
+        """
+        lazy_field = self._lazy_fields.get(name)
+        if lazy_field is not None:
+            return lazy_field[1]
+        val = getattr(self, name)
+        if isinstance(val, int):
+            return int(val)
+        raw = bytes(val)
+        return raw[0] if len(raw) == 1 else raw
 
     def __str__(self):
         """Emit the message in hex."""
@@ -111,3 +175,114 @@ def create(raw_data: bytearray) -> Tuple[Inbound, bytearray]:
         return msg, bytearray(remaining_data)
 
     return None, trim_data(data_bytes[1:])
+
+
+class InboundDecoder:
+    """Streaming decoder of inbound modem messages.
+
+    Data received from the transport is appended to a single buffer and read
+    from an offset so that remaining data is never copied between messages.
+    Consumed data is released from the front of the buffer once all complete
+    messages are decoded.
+    """
+
+    def __init__(self, nak_callback: Callable = None):
+        """Init the InboundDecoder class.
+
+        `nak_callback` is called when a NAK (0x15) byte is received outside of
+        a message, which happens when the modem responds to a write with only
+        a NAK rather than echoing the original message.
+        """
+        self._buffer = bytearray()
+        self._offset = 0
+        self._nak_callback = nak_callback
+
+    def __len__(self):
+        """Return the number of bytes waiting for a complete message."""
+        return len(self._buffer) - self._offset
+
+    @property
+    def buffer(self) -> bytes:
+        """Return the data waiting for a complete message."""
+        return bytes(self._buffer[self._offset :])
+
+    def clear(self):
+        """Clear the buffer."""
+        self._buffer.clear()
+        self._offset = 0
+
+    def decode(self, data: bytes) -> Generator[Inbound, None, None]:
+        """Add data to the buffer and yield each complete message."""
+        self._buffer.extend(data)
+        try:
+            with memoryview(self._buffer) as view:
+                yield from self._decode(view)
+        finally:
+            # The memoryview is released so the buffer can be resized
+            del self._buffer[: self._offset]
+            self._offset = 0
+
+    def _decode(self, view: memoryview):
+        """Decode the messages in the buffer view."""
+        buffer = self._buffer
+        buffer_len = len(buffer)
+        while self._offset < buffer_len:
+            pos = self._skip_to_start(buffer, buffer_len)
+            available = buffer_len - pos
+            if available < 2:
+                return
+
+            msg_id = buffer[pos + 1]
+            if msg_id not in _MESSAGE_IDS:
+                _LOGGER.debug("Invalid message ID: 0x%02x", msg_id)
+                self._offset = pos + (1 if msg_id == _START_CODE else 2)
+                continue
+
+            if (
+                msg_id in _NAK_ONLY_DEF
+                and available >= 3
+                and buffer[pos + 2] == AckNak.NAK
+            ):
+                msg_def = _NAK_ONLY_DEF[msg_id]
+                msg_len = len(msg_def)
+            else:
+                if msg_id == MessageId.SEND_STANDARD:
+                    if available <= _FLAGS_BYTE:
+                        return
+                    key = (msg_id, bool(buffer[pos + _FLAGS_BYTE] & _EXTENDED_FLAG))
+                else:
+                    key = (msg_id, False)
+                msg_len = MESSAGE_LENGTHS.get(key)
+                if msg_len is None:
+                    _LOGGER.debug("No inbound message for ID: 0x%02x", msg_id)
+                    self._offset = pos + 1
+                    continue
+                msg_def = INBOUND_DEF_TABLE[key]
+
+            if available < msg_len:
+                _LOGGER.debug("Full message not received")
+                return
+
+            try:
+                msg = Inbound(msg_def, bytes(view[pos : pos + msg_len]))
+            except (ValueError, IndexError) as ex:
+                _LOGGER.debug("Invalid message data: %s", view[pos:].hex())
+                _LOGGER.debug("%s: %s", type(ex), str(ex))
+                self._offset = pos + 1
+                continue
+            self._offset = pos + msg_len
+            yield msg
+
+    def _skip_to_start(self, buffer, buffer_len):
+        """Move the offset to the next start code and return the position."""
+        offset = self._offset
+        if buffer[offset] == _START_CODE:
+            return offset
+        pos = buffer.find(_START_CODE, offset)
+        if pos == -1:
+            pos = buffer_len
+        _LOGGER.debug("Skipping invalid data: %s", buffer[offset:pos].hex())
+        if buffer[pos - 1] == AckNak.NAK and self._nak_callback:
+            self._nak_callback()
+        self._offset = pos
+        return pos
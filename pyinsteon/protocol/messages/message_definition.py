@@ -1,4 +1,5 @@
 """Class to define the message definitions."""
+import struct
 
 
 def _calc_length(fields):
@@ -26,6 +27,29 @@ def _create_slices(fields):
     return slices
 
 
+def _create_decoder(fields):
+    """Create the struct to unpack the message fields after the message ID.
+
+    Single byte fields unpack to `int` and multi-byte fields unpack to `bytes`.
+    """
+    fmt = ">xx"
+    for field in fields:
+        fmt += "B" if field.length == 1 else f"{field.length}s"
+    return struct.Struct(fmt)
+
+
+def _create_field_types(fields):
+    """Return the field name, type and lazy flag for each field.
+
+    Fields of type `int`, including enums, are cheap to create and validate the
+    field value so they are created when the message is decoded. All other
+    field types are created on first access.
+    """
+    return tuple(
+        (field.name, field.type, not issubclass(field.type, int)) for field in fields
+    )
+
+
 class MessageDefinition:
     """Insteon message defintion."""
 
@@ -35,6 +59,8 @@ class MessageDefinition:
         self._fields = message_fields
         self._length = _calc_length(message_fields)
         self._slices = _create_slices(self.fields)
+        self._decoder = _create_decoder(self.fields)
+        self._field_types = _create_field_types(self.fields)
 
     def __len__(self):
         """Emit the message length."""
@@ -54,3 +80,13 @@ class MessageDefinition:
     def slices(self):
         """Emit the message slices."""
         return self._slices
+
+    @property
+    def decoder(self) -> struct.Struct:
+        """Emit the struct that unpacks the message fields."""
+        return self._decoder
+
+    @property
+    def field_types(self):
+        """Emit the field name, type and lazy flag of each field."""
+        return self._field_types
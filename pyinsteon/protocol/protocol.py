@@ -4,20 +4,39 @@ import asyncio
 from enum import Enum
 import logging
 from queue import SimpleQueue
+from time import monotonic
 from typing import Union
 
 from ..address import Address
-from ..constants import AckNak
+from ..constants import AckNak, MessageFlagType, MessageId
 from ..utils import log_error, publish_topic
 from .command_to_msg import register_command_handlers
-from .messages.inbound import create
+from .messages.inbound import InboundDecoder, create
 from .messages.outbound import outbound_write_manager, register_outbound_handlers
 from .msg_to_topic import convert_to_topic
+from .topic_dispatcher import DISPATCH_MESSAGE_IDS, topic_dispatcher
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_PYINSTEON = logging.getLogger("pyinsteon")
 _LOGGER_MSG = logging.getLogger("pyinsteon.messages")
 MAX_RECONNECT_WAIT_TIME = 300
+MAX_IN_FLIGHT = 4
+DEVICE_RESPONSE_TIMEOUT = 3
+_DEVICE_RESPONSE_TYPES = (MessageFlagType.DIRECT_ACK, MessageFlagType.DIRECT_NAK)
+# The modem sends cleanup messages after an All-Link command so it is given
+# the full write wait
+_FULL_WAIT_MESSAGE_IDS = (MessageId.SEND_ALL_LINK_COMMAND,)
+
+
+def _get_direct_target(msg_bytes: bytes):
+    """Return the address of a direct message to a device or None."""
+    if (
+        len(msg_bytes) > 5
+        and msg_bytes[1] == MessageId.SEND_STANDARD
+        and msg_bytes[5] >> 5 == MessageFlagType.DIRECT
+    ):
+        return msg_bytes[2:5]
+    return None
 
 
 def _get_addresses_in_msg(msg):
@@ -48,6 +67,9 @@ async def _publish_message(msg):
     topic = None
     kwargs = {}
     try:
+        if topic_dispatcher.enabled and msg.message_id in DISPATCH_MESSAGE_IDS:
+            topic_dispatcher.publish(msg)
+            return
         for topic, kwargs in convert_to_topic(msg):
             publish_topic(topic, **kwargs)
     except ValueError:
@@ -75,11 +97,23 @@ class Protocol(asyncio.Protocol):
         self._transport = None
         self._message_queue = asyncio.PriorityQueue()
         self._last_message = SimpleQueue()
-        self._buffer = bytearray()
+        self._decoder = InboundDecoder(nak_callback=self._nak_received)
         self._should_reconnect = True
         self._connect_method = connect_method
         self._writer_task = None
         self._writer_lock = asyncio.Lock()
+        self._pipeline = False
+        self._max_in_flight = MAX_IN_FLIGHT
+        self._sent_bytes = None
+        self._ack_received = asyncio.Event()
+        self._in_flight = {}
+        self._in_flight_changed = asyncio.Event()
+        self._messages_written = 0
+        self._acks = 0
+        self._naks = 0
+        self._ack_timeouts = 0
+        self._total_wait = 0.0
+        self._total_write_time = 0.0
         outbound_write_manager.protocol_write = self.write
         register_outbound_handlers()
         register_command_handlers()
@@ -99,6 +133,56 @@ class Protocol(asyncio.Protocol):
         """Return the transport."""
         return self._transport
 
+    @property
+    def pipeline(self) -> bool:
+        """Return if the writer releases messages on the modem ACK."""
+        return self._pipeline
+
+    @pipeline.setter
+    def pipeline(self, value: bool):
+        """Set the writer to release messages on the modem ACK.
+
+        When set, the next message is written as soon as the modem ACKs the
+        previous one, with the transport write wait as a fallback, and up to
+        `max_in_flight` direct commands to different devices can be waiting
+        for a device response.
+        """
+        self._pipeline = bool(value)
+        self._in_flight.clear()
+
+    @property
+    def max_in_flight(self) -> int:
+        """Return the maximum number of direct commands awaiting a response."""
+        return self._max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int):
+        """Set the maximum number of direct commands awaiting a response."""
+        if value < 1:
+            raise ValueError("Maximum in flight must be at least 1")
+        self._max_in_flight = value
+
+    @property
+    def stats(self):
+        """Return the writer statistics.
+
+        `average_wait` is the time in seconds a message waited in the queue and
+        `messages_per_second` is the rate achieved while the writer was busy.
+        """
+        written = self._messages_written
+        return {
+            "queue_depth": self._message_queue.qsize(),
+            "messages_written": written,
+            "in_flight": len(self._in_flight),
+            "acks": self._acks,
+            "naks": self._naks,
+            "ack_timeouts": self._ack_timeouts,
+            "average_wait": self._total_wait / written if written else 0.0,
+            "messages_per_second": (
+                written / self._total_write_time if self._total_write_time else 0.0
+            ),
+        }
+
     def connection_made(self, transport):
         """Run when a connection to the transport has been made."""
         self._transport = transport
@@ -106,37 +190,44 @@ class Protocol(asyncio.Protocol):
 
     def data_received(self, data):
         """Receive data from the serial transport."""
-        self._buffer.extend(data)
-        while True:
-            last_buffer = self._buffer
-            try:
-                msg, self._buffer = create(self._buffer)
-                if isinstance(self._buffer, bytes):
-                    _LOGGER.warning("Buffer became bytes: %s", data.hex())
-                    self._buffer = bytearray(self._buffer)
-            except (ValueError, IndexError) as ex:
-                _LOGGER.debug("Invalid message data: %s", self._buffer.hex())
-                _LOGGER.debug("%s: %s", type(ex), str(ex))
-                self._buffer = self._buffer[1:]
-                msg = None
-
-            # Sometimes the modem only responds with NAK and not the original message
-            if (
-                not msg
-                and last_buffer
-                and last_buffer[-1] == AckNak.NAK
-                and not self._last_message.empty()
-            ):
-                last_msg = self._last_message.get()
-                last_msg_nak = bytearray(bytes(last_msg))
-                last_msg_nak.extend(bytes([0x15]))
-                msg, _ = create(last_msg_nak)
-            if msg:
-                asyncio.create_task(_publish_message(msg))
-                msg = None
+        for msg in self._decoder.decode(data):
+            if self._pipeline:
+                self._check_write_response(msg)
+            asyncio.create_task(_publish_message(msg))
+
+    def _check_write_response(self, msg):
+        """Release the writer on the modem ACK or a device response."""
+        msg_id = msg.message_id
+        if msg_id in (MessageId.STANDARD_RECEIVED, MessageId.EXTENDED_RECEIVED):
+            if msg.raw_field("flags") >> 5 in _DEVICE_RESPONSE_TYPES:
+                if self._in_flight.pop(msg.raw_field("address"), None) is not None:
+                    self._in_flight_changed.set()
+            return
+        sent_bytes = self._sent_bytes
+        if sent_bytes is None or msg_id != sent_bytes[1]:
+            return
+        msg_bytes = bytes(msg)
+        if not msg_bytes.startswith(sent_bytes):
+            return
+        if msg_bytes[-1] == AckNak.ACK:
+            self._acks += 1
+            self._ack_received.set()
+        else:
+            self._naks += 1
 
-            if not self._buffer or last_buffer == self._buffer:
-                break
+    def _nak_received(self):
+        """Publish a NAK for the last message sent.
+
+        Sometimes the modem only responds with NAK and not the original message.
+        """
+        if self._last_message.empty():
+            return
+        last_msg = self._last_message.get()
+        last_msg_nak = bytearray(bytes(last_msg))
+        last_msg_nak.append(AckNak.NAK)
+        msg, _ = create(last_msg_nak)
+        if msg:
+            asyncio.create_task(_publish_message(msg))
 
     def connection_lost(self, exc: Union[asyncio.Task, Exception]):
         """Notify listeners that the serial connection is lost."""
@@ -202,7 +293,7 @@ class Protocol(asyncio.Protocol):
         """Stop the writer task."""
         if self._writer_task:
             self._writer_task.remove_done_callback(self._start_writer)
-        await self._message_queue.put((0, None))
+        await self._message_queue.put((0, 0, None))
 
     def write(self, msg, priority=5):
         """Prepare data for writing to the transport.
@@ -212,7 +303,7 @@ class Protocol(asyncio.Protocol):
         to be lower priority such as 'Load ALDB' versus higher priority such as
         'Set Light Level'.
         """
-        self._message_queue.put_nowait((priority, msg))
+        self._message_queue.put_nowait((priority, monotonic(), msg))
 
     async def _write_messages(self):
         """Write data to the transport."""
@@ -225,9 +316,11 @@ class Protocol(asyncio.Protocol):
             _LOGGER.debug("Modem writer started.")
             try:
                 while self._transport and not self._transport.is_closing():
-                    _, msg = await self._message_queue.get()
+                    _, queued, msg = await self._message_queue.get()
                     if msg is None:
                         return
+                    start = monotonic()
+                    self._total_wait += start - queued
                     _LOGGER_MSG.debug("TX: %s", repr(msg))
                     if (
                         _LOGGER_MSG.level == 0 or _LOGGER_MSG.level > logging.DEBUG
@@ -241,10 +334,62 @@ class Protocol(asyncio.Protocol):
                     while not self._last_message.empty():
                         self._last_message.get()
                     self._last_message.put(msg)
-                    await self._transport.async_write(msg)
-                    await asyncio.sleep(self._transport.write_wait)
+                    if self._pipeline:
+                        await self._async_write_pipelined(msg)
+                    else:
+                        await self._transport.async_write(msg)
+                        await asyncio.sleep(self._transport.write_wait)
+                    self._messages_written += 1
+                    self._total_write_time += monotonic() - start
             except RuntimeError as error:
                 _LOGGER.warning(
                     "Modem writer stopped due to a runtime error: %s", str(error)
                 )
         _LOGGER.debug("Modem writer stopped.")
+
+    async def _async_write_pipelined(self, msg):
+        """Write a message and wait for the modem ACK or the write wait."""
+        msg_bytes = bytes(msg)
+        target = _get_direct_target(msg_bytes)
+        if target is not None:
+            await self._async_wait_for_device(target)
+        self._sent_bytes = msg_bytes
+        self._ack_received.clear()
+        await self._transport.async_write(msg)
+        write_wait = self._transport.write_wait
+        if msg_bytes[1] in _FULL_WAIT_MESSAGE_IDS:
+            self._sent_bytes = None
+            await asyncio.sleep(write_wait)
+            return
+        try:
+            await asyncio.wait_for(self._ack_received.wait(), write_wait)
+        except asyncio.TimeoutError:
+            self._ack_timeouts += 1
+            return
+        finally:
+            self._sent_bytes = None
+        if target is not None:
+            self._in_flight[target] = monotonic()
+
+    async def _async_wait_for_device(self, target):
+        """Wait until a direct command can be sent to the target device.
+
+        A device can only have one direct command waiting for a response and
+        the number of commands waiting for a response is limited.
+        """
+        while True:
+            now = monotonic()
+            for address, sent in list(self._in_flight.items()):
+                if now - sent >= DEVICE_RESPONSE_TIMEOUT:
+                    self._in_flight.pop(address)
+            if (
+                target not in self._in_flight
+                and len(self._in_flight) < self._max_in_flight
+            ):
+                return
+            timeout = DEVICE_RESPONSE_TIMEOUT - (now - min(self._in_flight.values()))
+            self._in_flight_changed.clear()
+            try:
+                await asyncio.wait_for(self._in_flight_changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,151 @@
+"""Fast path dispatch of received standard and extended messages.
+
+Converting a received message to a topic builds several topic strings for
+every message. The dispatcher converts a message once and stores the topic
+names and the names of their arguments in a table keyed by the message values
+that determine the topics:
+
+    (message ID, address, message type, cmd1, cmd2, group, user data)
+
+Later messages with the same key are published to the stored topics with
+`publish_topic`. The topics only depend on the key so the table does not
+change when listeners subscribe or unsubscribe.
+"""
+import logging
+
+from ..commands import commands
+from ..constants import MessageFlagType, MessageId
+from ..utils import publish_topic
+from .messages.inbound import Inbound
+from .msg_to_topic import convert_to_topic
+
+_LOGGER = logging.getLogger(__name__)
+MAX_ENTRIES = 4096
+DISPATCH_MESSAGE_IDS = (MessageId.STANDARD_RECEIVED, MessageId.EXTENDED_RECEIVED)
+_BROADCAST_TYPES = (MessageFlagType.BROADCAST, MessageFlagType.ALL_LINK_BROADCAST)
+
+
+def _message_key(msg: Inbound):
+    """Return the values of a message that determine the message topics."""
+    flags = msg.raw_field("flags")
+    cmd1 = msg.cmd1
+    message_type = flags >> 5
+    group = msg.raw_field("target")[2] if message_type in _BROADCAST_TYPES else None
+    user_data = None
+    if msg.message_id == MessageId.EXTENDED_RECEIVED:
+        raw_user_data = msg.raw_field("user_data")
+        # Group is d1 for direct messages
+        user_data = (raw_user_data[0],) + tuple(
+            raw_user_data[int(field[1:]) - 1]
+            for field in commands.userdata_fields(cmd1)
+        )
+    return (
+        msg.message_id,
+        msg.raw_field("address"),
+        message_type,
+        cmd1,
+        msg.cmd2,
+        group,
+        user_data,
+    )
+
+
+def _message_kwargs(msg: Inbound):
+    """Return the topic arguments of a message."""
+    extended = msg.message_id == MessageId.EXTENDED_RECEIVED
+    return {
+        "cmd1": msg.cmd1,
+        "cmd2": msg.cmd2,
+        "target": msg.target,
+        "user_data": msg.user_data if extended else None,
+        "hops_left": msg.flags.hops_left,
+    }
+
+
+def _topic_entry(topic_name, kwargs, msg_kwargs):
+    """Return the topic name and argument names of a topic of a message.
+
+    Returns None if an argument of the topic is not taken from the message
+    arguments unchanged.
+    """
+    for arg, value in kwargs.items():
+        # Compare with == as UserData.__ne__ does not return
+        if arg in msg_kwargs and msg_kwargs[arg] == value:
+            continue
+        return None
+    return topic_name, tuple(kwargs)
+
+
+class TopicDispatcher:
+    """Publish received messages to their topics through a lookup table."""
+
+    def __init__(self):
+        """Init the TopicDispatcher class."""
+        self._enabled = False
+        self._table = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the dispatcher is enabled."""
+        return self._enabled
+
+    @property
+    def hits(self) -> int:
+        """Return the number of messages dispatched from the table."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of messages converted to their topics."""
+        return self._misses
+
+    def __len__(self):
+        """Return the number of entries in the table."""
+        return len(self._table)
+
+    def enable(self):
+        """Enable the dispatcher."""
+        self.invalidate()
+        self._enabled = True
+
+    def disable(self):
+        """Disable the dispatcher."""
+        self._enabled = False
+        self.invalidate()
+
+    def invalidate(self):
+        """Clear the dispatch table."""
+        self._table.clear()
+
+    def publish(self, msg: Inbound):
+        """Publish the topics of a received standard or extended message."""
+        key = _message_key(msg)
+        entry = self._table.get(key)
+        if entry is None:
+            self._misses += 1
+            self._publish_and_resolve(key, msg)
+            return
+
+        self._hits += 1
+        msg_kwargs = _message_kwargs(msg)
+        for topic_name, args in entry:
+            publish_topic(topic_name, **{arg: msg_kwargs[arg] for arg in args})
+
+    def _publish_and_resolve(self, key, msg):
+        """Publish the message topics and add them to the table."""
+        msg_kwargs = _message_kwargs(msg)
+        entry = []
+        for topic_name, kwargs in convert_to_topic(msg):
+            publish_topic(topic_name, **kwargs)
+            entry.append(_topic_entry(topic_name, kwargs, msg_kwargs))
+
+        if None in entry or not self._enabled:
+            return
+        if len(self._table) >= MAX_ENTRIES:
+            self._table.clear()
+        self._table[key] = tuple(entry)
+
+
+topic_dispatcher = TopicDispatcher()
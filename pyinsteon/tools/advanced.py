@@ -189,23 +189,22 @@ class AdvancedTools(ToolsAldb):
         log_stdout(
             "-------- -------- --------- ----- ---- ----------------------------------------"
         )
-        for address, broken_link, _ in broken_links:
-            for mem_addr, rec, status in broken_link:
-                if status == LinkStatus.MISSING_CONTROLLER:
-                    status_txt = "Missing controller"
-                elif status == LinkStatus.MISSING_RESPONDER:
-                    status_txt = "Missing responder"
-                elif status == LinkStatus.MISSING_TARGET:
-                    status_txt = "Target device not found"
-                elif status == LinkStatus.TARGET_DB_NOT_LOADED:
-                    status_txt = "Cannot verify - Target ALDB not loaded"
-                if rec.is_controller:
-                    link_mode = "C"
-                else:
-                    link_mode = "R"
-                log_stdout(
-                    f"{str(address)}     {mem_addr:04x} {str(rec.target)} {rec.group:5d}   {link_mode:s} {status_txt:.40s}"
-                )
+        for address, rec, status in broken_links:
+            if status == LinkStatus.MISSING_CONTROLLER:
+                status_txt = "Missing controller"
+            elif status == LinkStatus.MISSING_RESPONDER:
+                status_txt = "Missing responder"
+            elif status == LinkStatus.MISSING_TARGET:
+                status_txt = "Target device not found"
+            elif status == LinkStatus.TARGET_DB_NOT_LOADED:
+                status_txt = "Cannot verify - Target ALDB not loaded"
+            if rec.is_controller:
+                link_mode = "C"
+            else:
+                link_mode = "R"
+            log_stdout(
+                f"{str(address)}     {rec.mem_addr:04x} {str(rec.target)} {rec.group:5d}   {link_mode:s} {status_txt:.40s}"
+            )
 
     async def do_change_link(
         self, address, mem_addr, log_stdout=None, background=False, **kwargs
@@ -1,7 +1,7 @@
 """Command line tools to interact with the Insteon devices."""
 
 from .. import devices
-from ..constants import ALDBStatus, DeviceCategory
+from ..constants import DeviceCategory
 from ..managers.link_manager import async_link_devices
 from ..utils import seconds_to_ramp_rate
 from .tools_base import ToolsBase
@@ -48,34 +48,26 @@ class ToolsAldb(ToolsBase):
             log_stdout("An invalid value for `clear` was received")
             return
 
-        battery_devices = []
-        for device_address in addresses:
-            if devices[device_address].is_battery:
-                battery_devices.append(device_address)
-            # Only load the modem ALDB if explicitly asked
-            if devices[device_address] == devices.modem and len(addresses) == 1:
-                await devices.modem.aldb.async_load()
-            elif devices[device_address].cat == 0x03:
-                pass
-            else:
-                # tasks.append(devices[device_address].aldb.async_load(refresh=refresh))
-                await devices[device_address].aldb.async_load(refresh=refresh)
+        # Only load the modem ALDB if explicitly asked
+        if len(addresses) == 1 and devices[addresses[0]] == devices.modem:
+            await devices.modem.aldb.async_load()
+            return
 
+        # Devices that do not load the first time are tried once more with refresh
+        async for _ in devices.async_load_all(addresses=addresses, refresh=refresh):
+            pass
+
+        battery_devices = [
+            device_address
+            for device_address in addresses
+            if devices[device_address].is_battery
+        ]
         if battery_devices:
             log_stdout("The following devices are battery operated.")
             log_stdout("They will load in the background when they wake up.")
         for device_address in battery_devices:
             log_stdout(f"    - {device_address}")
 
-        # if the device did not load the first time, try one more time with refresh
-        for device_address in addresses:
-            if (
-                devices[device_address] != devices.modem
-                and devices[device_address].aldb.status != ALDBStatus.LOADED
-                and not devices[device_address].is_battery
-            ):
-                await devices[device_address].aldb.async_load(refresh=True)
-
     async def do_print_aldb(
         self, address, unused=None, log_stdout=None, background=False
     ):
@@ -17,6 +17,7 @@ from typing import List
 from .. import devices
 from ..address import Address
 from ..constants import RelayMode, ThermostatMode, ToggleMode
+from ..topic_logger import topic_logger
 from ..x10_address import X10Address
 from .log_filter import NoStdoutFilter, StdoutFilter, StripPrefixFilter
 from .utils import patch_stdin_stdout, set_loop, stdio
@@ -471,16 +472,17 @@ class ToolsBase(Cmd):
             root_logger.setLevel(logging.INFO)
             message_logger = logging.getLogger("pyinsteon.messages")
             message_logger.setLevel(logging.ERROR)
-            topic_logger = logging.getLogger("pyinsteon.topics")
-            topic_logger.setLevel(logging.ERROR)
+            topics_logger = logging.getLogger("pyinsteon.topics")
+            topics_logger.setLevel(logging.ERROR)
         elif level == "v":
             root_logger.setLevel(logging.DEBUG)
         elif level == "m":
             message_logger = logging.getLogger("pyinsteon.messages")
             message_logger.setLevel(logging.DEBUG)
         elif level == "t":
-            topic_logger = logging.getLogger("pyinsteon.topics")
-            topic_logger.setLevel(logging.DEBUG)
+            topics_logger = logging.getLogger("pyinsteon.topics")
+            topics_logger.setLevel(logging.DEBUG)
+        topic_logger.update()
 
     async def do_debug_device(self, address, logging_mode=True):
         """Place a device into debug mode to log all topics for the device.
@@ -517,6 +519,7 @@ class ToolsBase(Cmd):
         logger = logging.getLogger(f"pyinsteon.{address.id}")
         log_level = logging.DEBUG if logging_mode else logging.INFO
         logger.setLevel(log_level)
+        topic_logger.update()
 
     async def do_status(self, address, reload, log_stdout=None, background=False):
         """Display the status of a device.
@@ -710,6 +713,7 @@ class ToolsBase(Cmd):
         console_handler.set_name(STDOUT_LOG_HANDLER)
         root_logger.addHandler(console_handler)
         root_logger.setLevel(level)
+        topic_logger.update()
 
     async def _call_next_menu(self, menu, name=None):
         """Start the next menu."""
@@ -0,0 +1,122 @@
+"""Log the topics published by pyinsteon.
+
+All topics are logged to the `pyinsteon.topics` logger at debug level. When
+that logger is set above debug, the topics of a device are logged to the
+`pyinsteon.<address id>` logger of the device instead.
+
+The topic logger only listens to the topics while one of these loggers is
+enabled for debug so the topics published while topic logging is off have no
+logging cost. The log levels are checked again when a topic is published after
+the level of any logger changed.
+"""
+import logging
+import re
+
+from pubsub import pub
+
+from .address import Address
+
+_LOGGER_TOPICS = logging.getLogger("pyinsteon.topics")
+_LOGGER_PYINSTEON = logging.getLogger("pyinsteon")
+_DEVICE_LOGGER_NAME = re.compile(r"^pyinsteon\.[0-9a-f]{6}$")
+_PREFIXES = ("ack", "nak", "handler")
+
+
+def _get_device_in_topic(topic: pub.Topic, **kwargs):
+    """Return a list of devices referenced in a topic."""
+    addresses = []
+    topic_tuple = topic.getNameTuple()
+    try:
+        if topic_tuple[0] == "send":
+            pass
+        elif topic_tuple[0] in _PREFIXES:
+            addresses.append(Address(topic_tuple[1]))
+        else:
+            addresses.append(Address(topic_tuple[0]))
+    except (ValueError, IndexError):
+        pass
+
+    for key, value in kwargs.items():
+        if key in ["address", "target"]:
+            try:
+                addr = Address(value)
+            except ValueError:
+                continue
+            else:
+                if addr not in addresses and not str(addr).startswith("000"):
+                    addresses.append(addr)
+
+    return addresses
+
+
+def _device_logging_enabled() -> bool:
+    """Return if the topics of any device may be logged."""
+    if _LOGGER_TOPICS.level <= logging.DEBUG:
+        return False
+    if _LOGGER_PYINSTEON.isEnabledFor(logging.DEBUG):
+        return True
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if (
+            isinstance(logger, logging.Logger)
+            and _DEVICE_LOGGER_NAME.match(name)
+            and logger.isEnabledFor(logging.DEBUG)
+        ):
+            return True
+    return False
+
+
+class TopicLogger:
+    """Log the published topics while topic or device logging is enabled."""
+
+    def __init__(self):
+        """Init the TopicLogger class."""
+        self._subscribed = False
+        self._device_loggers = {}
+
+    @property
+    def subscribed(self) -> bool:
+        """Return if the topic logger listens to the published topics."""
+        return self._subscribed
+
+    def check(self):
+        """Update the topic logger if a log level changed since the last update.
+
+        Setting the level of any logger clears the level cache of every logger
+        and `update` fills the cache of the topics logger again. A disabled
+        logger does not cache its level so it is not checked.
+        """
+        # pylint: disable=protected-access
+        if not _LOGGER_TOPICS._cache and not _LOGGER_TOPICS.disabled:
+            self.update()
+
+    def update(self):
+        """Attach or detach the topic logger based on the current log levels."""
+        enabled = _LOGGER_TOPICS.isEnabledFor(logging.DEBUG)
+        if not enabled:
+            enabled = _device_logging_enabled()
+        if enabled and not self._subscribed:
+            pub.subscribe(self._log_topic, pub.ALL_TOPICS)
+            self._subscribed = True
+        elif not enabled and self._subscribed:
+            pub.unsubscribe(self._log_topic, pub.ALL_TOPICS)
+            self._subscribed = False
+
+    def _get_device_logger(self, address: Address) -> logging.Logger:
+        """Return the logger of a device."""
+        logger = self._device_loggers.get(address)
+        if logger is None:
+            logger = logging.getLogger(f"pyinsteon.{address.id}")
+            self._device_loggers[address] = logger
+        return logger
+
+    def _log_topic(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Log a topic to the topic logger or the loggers of its devices."""
+        _LOGGER_TOPICS.debug("Topic: %s data: %s", topic.name, kwargs)
+        if _LOGGER_TOPICS.level > logging.DEBUG:
+            for addr in _get_device_in_topic(topic, **kwargs):
+                logger = self._get_device_logger(addr)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Topic: %s data: %s", topic.name, kwargs)
+
+
+topic_logger = TopicLogger()
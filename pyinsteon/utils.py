@@ -1,11 +1,13 @@
 """Utility methods."""
 
 import asyncio
+from collections import deque
 from collections.abc import Iterable
 from enum import Enum, IntEnum
 from functools import partial, wraps
 from inspect import isawaitable, iscoroutinefunction
 import logging
+from time import monotonic
 import traceback
 
 from . import pub
@@ -23,6 +25,7 @@ from .constants import (
     ThermostatMode,
     X10Commands,
 )
+from .topic_logger import topic_logger
 from .topics import STATUS_REQUEST
 
 _LOGGER = logging.getLogger(__name__)
@@ -307,18 +310,76 @@ def calc_thermostat_mode(thermostat_mode_byte, sys_mode_map=None, sys_low=True):
     return sys_mode, fan_mode
 
 
+class TopicCache:
+    """Cache the pubsub topic objects by topic name.
+
+    Pubsub looks up the topic object of every message it sends. The topic
+    objects stay the same until a topic is deleted from the topic tree so
+    they are cached and the cache is cleared when a topic is deleted.
+    """
+
+    def __init__(self):
+        """Init the TopicCache class."""
+        self._topics = {}
+        self._registered = False
+
+    def __len__(self):
+        """Return the number of cached topics."""
+        return len(self._topics)
+
+    def get(self, topic_name):
+        """Return the topic object of a topic name and create it if needed."""
+        topic = self._topics.get(topic_name)
+        if topic is None:
+            if not self._registered:
+                pub.addNotificationHandler(self)
+                pub.setNotificationFlags(delTopic=True)
+                self._registered = True
+            topic = pub.getDefaultTopicMgr().getOrCreateTopic(topic_name)
+            self._topics[topic_name] = topic
+        return topic
+
+    def clear(self):
+        """Clear the cache."""
+        self._topics.clear()
+
+    # Notification handler methods called by pubsub
+    # pylint: disable=invalid-name
+    def notifyDelTopic(self, topicName):
+        """Clear the cache when a topic is deleted."""
+        self.clear()
+
+    def notifySubscribe(self, pubListener, topicObj, newSub):
+        """Ignore subscribe notifications."""
+
+    def notifyUnsubscribe(self, pubListener, topicObj):
+        """Ignore unsubscribe notifications."""
+
+    def notifyDeadListener(self, pubListener, topicObj):
+        """Ignore dead listener notifications."""
+
+    def notifySend(self, stage, topicObj, pubListener=None):
+        """Ignore message sending notifications."""
+
+    def notifyNewTopic(self, topicObj, description, required, argsDocs):
+        """Ignore new topic notifications."""
+
+
+topic_cache = TopicCache()
+
+
 def publish_topic(topic, logger=None, **kwargs):
-    """Publish a topic and log errors."""
+    """Publish a topic and log errors.
+
+    Listeners are held by weak reference and pubsub unsubscribes a listener
+    when it is garbage collected so dead listeners are not checked here.
+    """
     # Send log message as caller not utils.
     if logger is None:
-        logger = logging.getLogger(__name__)
+        logger = _LOGGER
+    topic_logger.check()
     try:
-        pub_topic = pub.getDefaultTopicMgr().getTopic(topic, okIfNone=True)
-        if pub_topic:
-            for listener in pub_topic.listeners:
-                if listener.isDead():
-                    pub_topic.unsubscribe(listener)
-        pub.sendMessage(topic, **kwargs)
+        topic_cache.get(topic).publish(**kwargs)
     except pub.ExcHandlerError as exc:
         logger.error("pubsub ExcHandlerError")
         logger.error("Error processing topic: %s", topic)
@@ -338,14 +399,124 @@ def publish_topic(topic, logger=None, **kwargs):
 async_listeners = {}
 
 
+def _message_device(kwargs):
+    """Return the device a message refers to or None.
+
+    The device is the `address` or `device_id` argument of the message or the
+    first part of the topic name when the listener receives the topic.
+    """
+    address = kwargs.get("address")
+    if address is None:
+        address = getattr(kwargs.get("device_id"), "address", None)
+    if address is not None:
+        return address.id if isinstance(address, Address) else str(address)
+    topic = kwargs.get("topic")
+    if isinstance(topic, pub.Topic):
+        return topic.getNameTuple()[0]
+    return None
+
+
+class AsyncListener:
+    """Run the messages of a coroutine listener from a queue for each device.
+
+    The messages of a device are handled one at a time, in the order they
+    were published, by a consumer task for the device. The messages of
+    different devices are handled at the same time. A consumer task is
+    started when a message is queued and ends when its queue is empty.
+    Messages that do not refer to a device share one queue.
+    """
+
+    def __init__(self, listener):
+        """Init the AsyncListener class."""
+        self._listener = listener
+        self._queues = {}
+        self._tasks = {}
+        self._queued = 0
+        self._processed = 0
+        self._max_queued = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def name(self):
+        """Return the name of the listener."""
+        return getattr(self._listener, "__qualname__", repr(self._listener))
+
+    @property
+    def queued(self):
+        """Return the number of messages waiting to be handled."""
+        return self._queued
+
+    @property
+    def stats(self):
+        """Return the queue depth and latency of the listener.
+
+        The latency of a message is the time from when it was queued until the
+        listener returned, in seconds.
+        """
+        return {
+            "queued": self._queued,
+            "max_queued": self._max_queued,
+            "processed": self._processed,
+            "total_latency": self._total_latency,
+            "max_latency": self._max_latency,
+        }
+
+    def put(self, *args, **kwargs):
+        """Queue a message and start a consumer task if needed."""
+        device = _message_device(kwargs)
+        queue = self._queues.get(device)
+        if queue is None:
+            queue = self._queues[device] = deque()
+        queue.append((monotonic(), args, kwargs))
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(device)
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._tasks[device] = loop.create_task(self._async_consume(device, queue))
+
+    async def _async_consume(self, device, queue):
+        """Handle the messages of a device until its queue is empty."""
+        try:
+            while queue:
+                queued_at, args, kwargs = queue.popleft()
+                self._queued -= 1
+                try:
+                    await self._listener(*args, **kwargs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    asyncio.get_running_loop().call_exception_handler(
+                        {
+                            "message": f"Error in async listener {self.name}",
+                            "exception": exc,
+                        }
+                    )
+                latency = monotonic() - queued_at
+                self._processed += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+        finally:
+            if self._tasks.get(device) is asyncio.current_task():
+                del self._tasks[device]
+                if not queue:
+                    del self._queues[device]
+
+
 def get_async_listener(listener):
-    """Get the async version of a listener."""
+    """Get the async version of a listener.
+
+    The published messages are queued and handled by an `AsyncListener` which
+    is available as the `async_listener` attribute of the returned function.
+    """
 
     def setup_async_listener(listener):
+        async_listener = AsyncListener(listener)
+
         @wraps(listener)
         def _wrapper(*args, **kwargs):
-            return asyncio.create_task(listener(*args, **kwargs))
+            async_listener.put(*args, **kwargs)
 
+        _wrapper.async_listener = async_listener
         return _wrapper
 
     async_listener = async_listeners.get(listener)
@@ -361,6 +532,26 @@ def remove_async_listener(listener):
     async_listeners.pop(listener)
 
 
+def async_listener_stats():
+    """Return the queue depth and latency of the async listeners by name.
+
+    The stats of the listeners of all instances of a class are combined.
+    """
+    stats = {}
+    for wrapper in list(async_listeners.values()):
+        listener_stats = wrapper.async_listener.stats
+        totals = stats.get(wrapper.async_listener.name)
+        if totals is None:
+            stats[wrapper.async_listener.name] = listener_stats
+            continue
+        for key, value in listener_stats.items():
+            if key.startswith("max_"):
+                totals[key] = max(totals[key], value)
+            else:
+                totals[key] += value
+    return stats
+
+
 def subscribe_topic(listener, topic_name, logger=None):
     """Subscribe a listener to a topic and log errors."""
 
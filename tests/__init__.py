@@ -9,6 +9,7 @@ import pyinsteon
 from pyinsteon import pub
 from pyinsteon.device_types.hub import Hub
 from pyinsteon.managers.device_manager import DeviceManager
+from pyinsteon.topic_logger import topic_logger
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_PYINSTEON = logging.getLogger("pyinsteon")
@@ -60,6 +61,7 @@ def set_log_levels(
     _setup_logger(_LOGGER_PYINSTEON, logger_pyinsteon)
     _setup_logger(_LOGGER_MESSAGES, logger_messages)
     _LOGGER_TOPICS.setLevel(logging.DEBUG if logger_topics else logging.CRITICAL)
+    topic_logger.update()
 
 
 async def load_devices(devices_mgr: DeviceManager):
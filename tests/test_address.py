@@ -1,4 +1,6 @@
 """Test the Address class."""
+import copy
+import pickle
 import unittest
 from binascii import unhexlify
 
@@ -49,6 +51,31 @@ class TestAddress(unittest.TestCase):
         """Test create from byte array."""
         assert self.address == self.address_bytes
 
+    def test_interned(self):
+        """Test each address is a single object."""
+        assert Address("01.02.03") is self.address
+        assert Address(unhexlify(self.hex)) is self.address
+        assert Address(self.address) is self.address
+        assert self.address_bytes is self.address
+        assert copy.deepcopy(self.address) is self.address
+        assert pickle.loads(pickle.dumps(self.address)) is self.address
+
+    def test_hash_and_str(self):
+        """Test the hash, id and display string."""
+        assert str(self.address) == "01.02.03"
+        assert self.address.id == self.hex
+        assert hash(self.address) == hash("01.02.03")
+        assert {self.address: 1}[Address("010203")] == 1
+
+    def test_immutable(self):
+        """Test the address cannot be changed."""
+        with self.assertRaises(AttributeError):
+            self.address._addr = b"\x01\x02\x04"  # pylint: disable=protected-access
+        with self.assertRaises(ValueError):
+            Address("01020")
+        with self.assertRaises(ValueError):
+            Address(None)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+"""Test the device ALDB class."""
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyinsteon.aldb.aldb import ALDB
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
+
+from ..utils import async_case, random_address
+
+FIRST_MEM_ADDR = 0x0FFF
+
+
+def _create_records(count, target):
+    """Create in use records followed by a high water mark record."""
+    records = {}
+    for index in range(count):
+        mem_addr = FIRST_MEM_ADDR - index * 8
+        records[mem_addr] = ALDBRecord(
+            mem_addr,
+            controller=False,
+            group=index,
+            target=target,
+            data1=255,
+            data2=28,
+            data3=1,
+        )
+    hwm_mem_addr = FIRST_MEM_ADDR - count * 8
+    records[hwm_mem_addr] = ALDBRecord(
+        hwm_mem_addr,
+        controller=False,
+        group=0,
+        target="000000",
+        data1=0,
+        data2=0,
+        data3=0,
+        in_use=False,
+        high_water_mark=True,
+    )
+    return records
+
+
+class MockReadManager:
+    """Mock the ALDB read manager with the records in the device."""
+
+    def __init__(self, device_records):
+        """Init the MockReadManager class."""
+        self.device_records = device_records
+        self.reads = []
+
+    async def async_read(self, mem_addr, num_recs, read_write_mode):
+        """Return the record at a memory address."""
+        self.reads.append(mem_addr)
+        record = self.device_records.get(mem_addr)
+        if record is not None:
+            yield record
+
+    async def async_stop(self):
+        """Stop reading."""
+
+
+class TestAldb(TestCase):
+    """Test the device ALDB class."""
+
+    def _setup_aldb(self, count):
+        """Create a loaded ALDB and a device with the same records."""
+        target = random_address()
+        aldb = ALDB(random_address())
+        aldb.load_saved_records(ALDBStatus.LOADED, _create_records(count, target))
+        read_manager = MockReadManager(_create_records(count, target))
+        # pylint: disable=protected-access
+        aldb._read_manager = read_manager
+        return aldb, read_manager, target
+
+    @async_case
+    async def test_load_delta_unchanged(self):
+        """Test only the samples and the high water mark are read."""
+        aldb, read_manager, _ = self._setup_aldb(40)
+        reads = await aldb.async_load_delta(samples=8)
+        assert reads == 9
+        assert read_manager.reads[0] == FIRST_MEM_ADDR - 40 * 8
+        assert aldb.is_loaded
+        assert len(aldb) == 41
+
+    @async_case
+    async def test_load_delta_new_records(self):
+        """Test the records added at the high water mark are read."""
+        aldb, read_manager, target = self._setup_aldb(40)
+        read_manager.device_records = _create_records(42, target)
+        reads = await aldb.async_load_delta(samples=8)
+        assert reads == 11
+        assert len(aldb) == 43
+        assert aldb.high_water_mark_mem_addr == FIRST_MEM_ADDR - 42 * 8
+        assert aldb.is_loaded
+
+    @async_case
+    async def test_load_delta_changed_record(self):
+        """Test the records after a changed sample are read."""
+        aldb, read_manager, target = self._setup_aldb(40)
+        changed = {}
+        for index in (5, 6):
+            mem_addr = FIRST_MEM_ADDR - index * 8
+            changed[index] = ALDBRecord(
+                mem_addr,
+                controller=True,
+                group=index,
+                target=target,
+                data1=0,
+                data2=0,
+                data3=0,
+            )
+
+        # The samples are every fifth record so a change to record 6 is not seen
+        read_manager.device_records[changed[6].mem_addr] = changed[6]
+        reads = await aldb.async_load_delta(samples=8)
+        assert reads == 9
+        assert not aldb[changed[6].mem_addr].is_exact_match(changed[6])
+
+        # A change to sample 5 reads records 6 to 9
+        read_manager.device_records[changed[5].mem_addr] = changed[5]
+        reads = await aldb.async_load_delta(samples=8)
+        assert reads == 13
+        assert aldb[changed[5].mem_addr].is_exact_match(changed[5])
+        assert aldb[changed[6].mem_addr].is_exact_match(changed[6])
+        assert aldb.is_loaded
+
+    @async_case
+    async def test_load_delta_status(self):
+        """Test the load status is only reviewed when every record is read."""
+        aldb, _, _ = self._setup_aldb(40)
+        with patch.object(aldb, "set_load_status") as set_load_status:
+            await aldb.async_load_delta(samples=8)
+            set_load_status.assert_not_called()
+
+            reads = await aldb.async_load_delta(samples=40)
+            assert reads == 41
+            set_load_status.assert_called_once()
+        assert aldb.is_loaded
+
+    @async_case
+    async def test_load_delta_failed_read(self):
+        """Test the status is partial when a sample is not read."""
+        aldb, read_manager, _ = self._setup_aldb(40)
+        read_manager.device_records.pop(FIRST_MEM_ADDR - 5 * 8)
+        reads = await aldb.async_load_delta(samples=8)
+        assert reads == 13
+        assert aldb.status == ALDBStatus.PARTIAL
+        assert not aldb.is_loaded
+        assert len(aldb) == 41
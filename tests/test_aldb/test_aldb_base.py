@@ -393,6 +393,42 @@ class TestAldbBase(TestCase):
         except ValueError:
             assert True
 
+    @async_case
+    async def test_find_indexes(self):
+        """Test the find indexes are updated when records change."""
+        aldb = ALDB(random_address())
+        self.setup_aldb(aldb, records)
+        assert [rec.mem_addr for rec in aldb.find(target=modem_address)] == [
+            0x0FF7,
+            0x0FEF,
+        ]
+        assert [rec.mem_addr for rec in aldb.find(in_use=False)] == [0x0FE7]
+
+        # Replace a record with a record for a different target and group
+        new_rec = ALDBRecord(
+            0x0FF7,
+            controller=True,
+            group=3,
+            target=rec_0fff.target,
+            data1=0,
+            data2=0,
+            data3=0,
+        )
+        # pylint: disable=protected-access
+        aldb._add_record(new_rec)
+        assert [rec.mem_addr for rec in aldb.find(target=modem_address)] == [0x0FEF]
+        assert [rec.mem_addr for rec in aldb.find(target=rec_0fff.target)] == [
+            0x0FFF,
+            0x0FF7,
+        ]
+        assert list(aldb.find(group=3, is_controller=True)) == [new_rec]
+        assert not list(aldb.find(group=1))
+        assert list(aldb.get_responders(3)) == [rec_0fff.target]
+
+        aldb.clear()
+        assert not list(aldb.find(in_use=True))
+        assert not list(aldb.find(target=rec_0fff.target))
+
     @async_case
     async def test_async_write(self):
         """Test the async_write method."""
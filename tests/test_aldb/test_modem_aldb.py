@@ -1,9 +1,13 @@
 """Test the modem ALDB."""
 
 from unittest import TestCase
+from unittest.mock import MagicMock
 from pyinsteon import pub
 from pyinsteon.aldb import modem_aldb
-from pyinsteon.topics import ALL_LINK_RECORD_RESPONSE
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
+from pyinsteon.topics import ALDB_LINK_CHANGED, ALL_LINK_RECORD_RESPONSE
+from pyinsteon.utils import subscribe_topic, unsubscribe_topic
 
 from pyinsteon.aldb.modem_aldb import ModemALDB
 
@@ -42,4 +46,34 @@ class TestModemALDB(TestCase):
         listeners = topic.getListeners()
         assert len(listeners) == 1
         
-        
\ No newline at end of file
+        
+
+    @async_case
+    async def test_standard_load_deletes(self):
+        """Test records removed by a load are published as deleted."""
+        address = random_address()
+        target = random_address()
+        aldb = ModemALDB(address)
+        records = {}
+        for index in range(3):
+            mem_addr = 0x0FFF - index * 8
+            records[mem_addr] = ALDBRecord(mem_addr, True, index, target, 0, 0, 0)
+        aldb.load_saved_records(ALDBStatus.LOADED, records)
+
+        async def async_load_standard():
+            yield ALDBRecord(0, True, 0, target, 0, 0, 0)
+
+        # pylint: disable=protected-access
+        aldb._read_manager = MagicMock()
+        aldb._read_manager.async_load_standard = async_load_standard
+        changes = []
+
+        def link_changed(record, sender, deleted):
+            changes.append((record.group, deleted))
+
+        topic = f"{address.id}.{ALDB_LINK_CHANGED}"
+        subscribe_topic(link_changed, topic)
+        await aldb._async_load_standard()
+        unsubscribe_topic(link_changed, topic)
+        assert changes == [(0, True), (1, True), (2, True), (0, False)]
+        assert len(aldb) == 1
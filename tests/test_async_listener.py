@@ -0,0 +1,96 @@
+"""Test the async listener dispatch."""
+import asyncio
+import unittest
+
+from pyinsteon.address import Address
+from pyinsteon.utils import (
+    async_listener_stats,
+    publish_topic,
+    subscribe_topic,
+    unsubscribe_topic,
+)
+
+from .utils import async_case
+
+TOPIC = "test_async_listener.status"
+
+
+class Listener:
+    """Async topic listener."""
+
+    def __init__(self, fail_on=None):
+        """Init the Listener class."""
+        self.running = 0
+        self.max_running = 0
+        self.values = []
+        self._fail_on = fail_on
+
+    async def async_on_status(self, address, value):
+        """Save the value received after yielding to the event loop."""
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if value == self._fail_on:
+            raise ValueError("Listener error")
+        self.values.append((address, value))
+
+
+class TestAsyncListener(unittest.TestCase):
+    """Test the async listener dispatch."""
+
+    @async_case
+    async def test_device_order(self):
+        """Test the messages of a device are handled in order."""
+        listener = Listener()
+        subscribe_topic(listener.async_on_status, TOPIC)
+        try:
+            for value in range(5):
+                publish_topic(TOPIC, address="1a2b3c", value=value)
+            await asyncio.sleep(0.2)
+        finally:
+            unsubscribe_topic(listener.async_on_status, TOPIC)
+        assert listener.values == [("1a2b3c", value) for value in range(5)]
+        assert listener.max_running == 1
+
+    @async_case
+    async def test_devices_concurrent(self):
+        """Test the messages of different devices are handled concurrently."""
+        listener = Listener()
+        addresses = [Address(f"1a2b{index:02x}") for index in range(20)]
+        subscribe_topic(listener.async_on_status, TOPIC)
+        try:
+            for address in addresses:
+                publish_topic(TOPIC, address=address, value=1)
+            await asyncio.sleep(0.5)
+        finally:
+            unsubscribe_topic(listener.async_on_status, TOPIC)
+        assert len(listener.values) == 20
+        assert listener.max_running == 20
+
+    @async_case
+    async def test_error_and_stats(self):
+        """Test a listener error is reported and the stats are collected."""
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        listener = Listener(fail_on=1)
+        subscribe_topic(listener.async_on_status, TOPIC)
+        try:
+            for value in range(3):
+                publish_topic(TOPIC, address="4d5e6f", value=value)
+            stats = async_listener_stats()["Listener.async_on_status"]
+            assert stats["queued"] >= 3
+            await asyncio.sleep(0.2)
+        finally:
+            unsubscribe_topic(listener.async_on_status, TOPIC)
+            loop.set_exception_handler(None)
+
+        assert listener.values == [("4d5e6f", 0), ("4d5e6f", 2)]
+        assert len(errors) == 1
+        assert isinstance(errors[0]["exception"], ValueError)
+        stats = async_listener_stats()["Listener.async_on_status"]
+        assert stats["queued"] == 0
+        assert stats["max_queued"] >= 3
+        assert stats["processed"] >= 3
+        assert stats["max_latency"] >= 0.01
@@ -2,11 +2,29 @@
 import traceback
 import unittest
 
-from pyinsteon.device_types.ipdb import IPDB
+from pyinsteon.device_types.ipdb import IPDB, Product
+from pyinsteon.device_types.unknown_device import UnknownDevice
 from tests import _LOGGER
 from tests.utils import async_case, random_address
 
 
+def _scan_products(cat, subcat):
+    """Find a product by scanning the product list."""
+    device_product = None
+    for product in IPDB():
+        if cat == product.cat and subcat == product.subcat:
+            device_product = product
+    if not device_product:
+        for product in IPDB():
+            if cat == product.cat and product.subcat is None:
+                return product
+    if not device_product:
+        device_product = Product(
+            cat, subcat, None, "", "", "unknown_device.UnknownDevice"
+        )
+    return device_product
+
+
 class TestCreateDevices(unittest.TestCase):
     """Test creation of all devices."""
 
@@ -37,3 +55,15 @@ class TestCreateDevices(unittest.TestCase):
 
         if failed:
             assert False
+
+    def test_product_lookup(self):
+        """Test the product lookup matches a scan of the product list."""
+        ipdb = IPDB()
+        cats = {prod.cat for prod in ipdb} | {0x20}
+        for cat in cats:
+            for subcat in [None, *range(256)]:
+                assert ipdb[[cat, subcat]] == _scan_products(cat, subcat)
+
+        assert ipdb[[0x20, 0x01]].deviceclass is UnknownDevice
+        assert ipdb.x10("Dimmable").feature == "dimmable"
+        assert ipdb.x10("unknown").deviceclass is None
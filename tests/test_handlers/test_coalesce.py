@@ -0,0 +1,134 @@
+"""Test coalescing pending sends of a direct command."""
+
+import asyncio
+import gc
+import unittest
+from unittest.mock import AsyncMock
+
+import async_timeout
+
+from pyinsteon import pub
+from pyinsteon.address import Address
+from pyinsteon.constants import ResponseStatus
+from pyinsteon.handlers.to_device.direct_command import DirectCommandHandlerBase
+from pyinsteon.handlers.to_device.on_level import OnLevelCommand
+
+from tests.utils import TopicItem, async_case, send_topics
+
+
+class TestCoalesce(unittest.TestCase):
+    """Test coalescing pending sends of a direct command."""
+
+    @async_case
+    async def test_newer_level_replaces_pending(self):
+        """Test a newer on level replaces one waiting to be sent."""
+        address = Address("1a2b3c")
+        handler = OnLevelCommand(address, group=1)
+        sent = []
+
+        def send_received(address, on_level, group):
+            sent.append(on_level)
+            topics = [
+                TopicItem(
+                    f"ack.{address.id}.1.on.direct",
+                    {"cmd1": 0x11, "cmd2": on_level, "user_data": None},
+                    0.05,
+                ),
+                TopicItem(
+                    f"{address.id}.on.direct_ack",
+                    {
+                        "cmd1": 0x11,
+                        "cmd2": on_level,
+                        "target": "4d5e6f",
+                        "user_data": None,
+                        "hops_left": 3,
+                    },
+                    0.05,
+                ),
+            ]
+            send_topics(topics)
+
+        pub.subscribe(send_received, "send.on.direct")
+        coalesced = DirectCommandHandlerBase.coalesced
+        try:
+            first = asyncio.ensure_future(handler.async_send(on_level=0x10))
+            await asyncio.sleep(0.01)
+            pending = [
+                asyncio.ensure_future(handler.async_send(on_level=level))
+                for level in (0x20, 0x30, 0x40)
+            ]
+            results = await asyncio.gather(first, *pending)
+        finally:
+            pub.unsubscribe(send_received, "send.on.direct")
+
+        assert sent == [0x10, 0x40]
+        assert results == [ResponseStatus.SUCCESS] * 4
+        assert DirectCommandHandlerBase.coalesced == coalesced + 2
+
+    @async_case
+    async def test_cancelled_pending_send(self):
+        """Test a waiting caller sends if the caller making the send is cancelled."""
+        address = Address("1a2b3c")
+        handler = OnLevelCommand(address, group=1)
+        sent = []
+
+        def send_received(address, on_level, group):
+            sent.append(on_level)
+            topics = [
+                TopicItem(
+                    f"ack.{address.id}.1.on.direct",
+                    {"cmd1": 0x11, "cmd2": on_level, "user_data": None},
+                    0.05,
+                ),
+                TopicItem(
+                    f"{address.id}.on.direct_ack",
+                    {
+                        "cmd1": 0x11,
+                        "cmd2": on_level,
+                        "target": "4d5e6f",
+                        "user_data": None,
+                        "hops_left": 3,
+                    },
+                    0.05,
+                ),
+            ]
+            send_topics(topics)
+
+        pub.subscribe(send_received, "send.on.direct")
+        try:
+            first = asyncio.ensure_future(handler.async_send(on_level=0x10))
+            await asyncio.sleep(0.01)
+            owner = asyncio.ensure_future(handler.async_send(on_level=0x20))
+            await asyncio.sleep(0.01)
+            coalesced = asyncio.ensure_future(handler.async_send(on_level=0x30))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            async with async_timeout.timeout(5):
+                results = await asyncio.gather(first, coalesced)
+        finally:
+            pub.unsubscribe(send_received, "send.on.direct")
+
+        assert owner.cancelled()
+        assert sent == [0x10, 0x30]
+        assert results == [ResponseStatus.SUCCESS] * 2
+
+    @async_case
+    async def test_failed_send_without_waiters(self):
+        """Test a failed send with no waiting callers logs no future error."""
+        handler = OnLevelCommand(Address("1a2b3c"), group=1)
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        # pylint: disable=protected-access
+        handler._async_send_direct = AsyncMock(side_effect=ValueError)
+        try:
+            async with handler._send_lock:
+                owner = asyncio.ensure_future(handler.async_send(on_level=0x10))
+                await asyncio.sleep(0.01)
+            with self.assertRaises(ValueError):
+                await owner
+            del owner
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert not errors
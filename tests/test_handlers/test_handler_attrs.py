@@ -0,0 +1,68 @@
+"""Test the handler methods found once per handler class."""
+
+import unittest
+
+from pyinsteon.address import Address
+from pyinsteon.handlers import direct_nak_handler
+from pyinsteon.handlers.to_device.on_level import OnLevelCommand
+from pyinsteon.handlers.to_device.status_request import StatusRequestCommand
+
+
+def _dir_handler_attrs(handler):
+    """Return the handler methods of a handler found with a `dir` search."""
+    handler_attrs = []
+    for attr_str in dir(handler):
+        attr = getattr(handler, attr_str)
+        is_handler = hasattr(attr, "register_handler")
+        is_status = hasattr(attr, "register_status")
+        if is_handler or is_status:
+            handler_attrs.append((attr_str, is_handler, is_status))
+    return tuple(handler_attrs)
+
+
+class MockStatusRequestCommand(StatusRequestCommand):
+    """Status request command with overridden handlers."""
+
+    # pylint: disable=useless-parent-delegation
+    async def async_handle_ack(self, cmd1, cmd2, user_data):
+        """Override the ACK handler without the handler decorator."""
+        await super().async_handle_ack(cmd1=cmd1, cmd2=cmd2, user_data=user_data)
+
+    @direct_nak_handler
+    async def async_handle_direct_nak(self, cmd1, cmd2, target, user_data, hops_left):
+        """Override the direct NAK handler."""
+        await super().async_handle_direct_nak(
+            cmd1=cmd1,
+            cmd2=cmd2,
+            target=target,
+            user_data=user_data,
+            hops_left=hops_left,
+        )
+
+
+class TestHandlerAttrs(unittest.TestCase):
+    """Test the handler methods found once per handler class."""
+
+    def test_handler_attrs(self):
+        """Test the handler methods of a class match a search of an instance."""
+        address = Address("1a2b3c")
+        for handler in (
+            OnLevelCommand(address, group=1),
+            StatusRequestCommand(address),
+            MockStatusRequestCommand(address, status_type=1),
+        ):
+            # pylint: disable=protected-access
+            assert handler._handler_attrs == _dir_handler_attrs(handler)
+
+    def test_overridden_handlers(self):
+        """Test inherited and overridden handlers of a subclass."""
+        handler = MockStatusRequestCommand(Address("1a2b3c"), status_type=1)
+        # pylint: disable=protected-access
+        handler_attrs = {attr[0]: attr[1:] for attr in handler._handler_attrs}
+        # Inherited from StatusRequestCommand
+        assert handler_attrs["async_handle_direct_ack"] == (False, True)
+        # Inherited from DirectCommandHandlerBase
+        assert handler_attrs["async_handle_nak"] == (True, False)
+        # Overridden with and without the handler decorator
+        assert handler_attrs["async_handle_direct_nak"] == (True, False)
+        assert "async_handle_ack" not in handler_attrs
@@ -0,0 +1,51 @@
+"""Test the import time of the package."""
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time budget of the package in microseconds. Importing the
+# package took 1.75s when every device type was imported and is under 0.1s
+# with the device types imported when first used.
+IMPORT_TIME_BUDGET = 600_000
+
+
+def _import_times(module):
+    """Return the cumulative import time of each module imported by a module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+class TestImportTime(unittest.TestCase):
+    """Test the import time of the package."""
+
+    def test_import_time(self):
+        """Test importing the package stays within the import time budget."""
+        import_time = min(_import_times("pyinsteon")["pyinsteon"] for _ in range(3))
+        assert import_time < IMPORT_TIME_BUDGET, f"Import took {import_time}us"
+
+    def test_lazy_imports(self):
+        """Test the device types and transports are not imported."""
+        import_times = _import_times("pyinsteon")
+        for name in import_times:
+            assert not name.startswith("pyinsteon.device_types"), name
+            assert not name.startswith("pyinsteon.managers"), name
+            assert not name.startswith("pyinsteon.protocol"), name
+            assert not name.startswith("aiohttp"), name
+
+    def test_lazy_device_classes(self):
+        """Test only the device types used by a product are imported."""
+        import_times = _import_times("pyinsteon.device_types.ipdb")
+        assert "pyinsteon.device_types.ipdb" in import_times
+        assert "pyinsteon.device_types.x10" not in import_times
+        assert "pyinsteon.device_types.climate_control" not in import_times
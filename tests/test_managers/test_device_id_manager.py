@@ -1,8 +1,12 @@
 """Test the device manager."""
 import asyncio
 import unittest
+from unittest.mock import patch
 
 from pyinsteon.address import Address
+from pyinsteon.constants import ResponseStatus
+from pyinsteon.handlers.to_device.id_request import IdRequestCommand
+import pyinsteon.managers.device_id_manager
 from pyinsteon.managers.device_id_manager import DeviceIdManager
 from pyinsteon.topics import ASSIGN_TO_ALL_LINK_GROUP, ID_REQUEST, OFF
 from tests.utils import TopicItem, async_case, cmd_kwargs, send_topics
@@ -95,6 +99,49 @@ class TestDeviceIdManager(unittest.TestCase):
         device_id = await self._id_mgr.async_id_device(address)
         assert device_id.cat == self._cat
 
+    @async_case
+    async def test_id_devices_concurrent(self):
+        """Test unresponsive devices do not hold up identifying other devices."""
+        self._id_mgr = DeviceIdManager()
+        dead = [Address("050501"), Address("050502")]
+        alive = [Address("050503"), Address("050504"), Address("050505")]
+        sent = []
+
+        async def async_send(handler):
+            """Respond to the ID request for devices that are not dead."""
+            # pylint: disable=protected-access
+            sent.append(handler._address)
+            if handler._address in dead:
+                return ResponseStatus.DEVICE_UNRESPONSIVE
+            _, _, _, response = self._set_topics(handler._address)
+            send_topics(
+                [TopicItem(response, cmd_kwargs(0x10, 0x12, None, self._target), 0.05)]
+            )
+            return ResponseStatus.SUCCESS
+
+        for address in dead + alive:
+            self._id_mgr.append(address)
+        with patch.object(
+            pyinsteon.managers.device_id_manager, "RETRY_PAUSE", 0.2
+        ), patch.object(IdRequestCommand, "async_send", async_send):
+            await self._id_mgr.async_id_devices(max_concurrent=2)
+
+        for address in alive:
+            assert self._id_mgr[address].cat == self._cat
+            # Each responsive device was identified on the first attempt
+            assert sent.count(address) == 1
+        for address in dead:
+            assert sent.count(address) == 5
+        # Responsive devices were not queued behind the retries
+        assert set(sent[:5]) == set(dead + alive)
+        progress = self._id_mgr.id_progress
+        assert progress["total"] == 5
+        assert progress["identified"] == 3
+        assert progress["failed"] == 2
+        assert progress["pending"] == 0
+        assert set(progress["latency"]) == set(alive)
+        self._id_mgr.close()
+
 
 if __name__ == "__main__":
     unittest.main()
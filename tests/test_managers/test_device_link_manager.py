@@ -1,20 +1,30 @@
 """Test the device_link_manager class."""
 import asyncio
 from datetime import timedelta
+import gc
+import os
 from random import randint
+import shutil
+import tempfile
 import unittest
 from unittest.mock import AsyncMock, Mock, patch
 
 from pyinsteon import devices, link_manager
+from pyinsteon.address import Address
 from pyinsteon.aldb.aldb_record import ALDBRecord
 from pyinsteon.constants import ResponseStatus
 from pyinsteon.device_types.hub import Hub
 from pyinsteon.managers import device_link_manager
+from pyinsteon.managers.device_link_manager import DeviceLinkManager
+from pyinsteon.managers.device_manager import DeviceManager
 
 from tests import load_devices, set_log_levels
 from tests.utils import TopicItem, async_case, cmd_kwargs, send_topics
 
 test_lock = asyncio.Lock()
+FIXTURE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "devices_fixture.json"
+)
 
 
 def _reset_devices(addresses):
@@ -53,6 +63,9 @@ async def _load_devices(lock):
             pass
         modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
         devices.modem = modem
+        # Collect devices replaced by an earlier load so their listeners are
+        # not garbage collected while the new devices publish their records
+        gc.collect()
         await load_devices(devices)
         await asyncio.sleep(0.3)
         _reset_devices(list(devices))
@@ -113,6 +126,31 @@ class TestDeviceLinkManager(unittest.TestCase):
         await asyncio.sleep(1)
         assert devices["3c3c3c"].async_status.call_count == 1
 
+    @async_case
+    async def test_device_links_dedup_slow_status(self):
+        """Test the cleanup is a duplicate while the status request waits."""
+        await _load_devices(test_lock)
+
+        async def async_status():
+            await asyncio.sleep(0.5)
+            return ResponseStatus.SUCCESS
+
+        topic_broadcast = "1a1a1a.1.off_fast.all_link_broadcast"
+        topic_broadcast_item = TopicItem(
+            topic_broadcast, cmd_kwargs(0x13, 0x00, None, "00.00.01"), 0
+        )
+        topic_cleanup = "1a1a1a.1.off_fast.all_link_cleanup"
+        topic_cleanup_item = TopicItem(
+            topic_cleanup, cmd_kwargs(0x13, 0x00, None, "11.11.11"), 0.1
+        )
+        devices["3c3c3c"].async_status.side_effect = async_status
+        with patch.object(
+            device_link_manager, "TIMEOUT_DUPLICATE", timedelta(milliseconds=300)
+        ):
+            send_topics([topic_broadcast_item, topic_cleanup_item])
+            await asyncio.sleep(1)
+        assert devices["3c3c3c"].async_status.call_count == 1
+
     @async_case
     async def test_adding_removing_links(self):
         """Test adding or removing links."""
@@ -255,3 +293,117 @@ class TestDeviceLinkManager(unittest.TestCase):
         send_topics([topic_item])
         await asyncio.sleep(0.2)
         assert devices["3c3c3c"].async_status.call_count == 5
+
+    @async_case
+    async def test_get_responders(self):
+        """Test the responders of a controller group come from the link index."""
+        await _load_devices(test_lock)
+        controller = devices["1a1a1a"].address
+        responder = devices["3c3c3c"].address
+
+        responders = link_manager.get_responders(controller, 1)
+        assert list(responders) == [responder]
+        assert responders[responder][0].data1 == 255
+        assert not link_manager.get_responders(controller, 255)
+        assert not link_manager.get_responders(devices.modem.address, 1)
+
+        links = link_manager.links
+        link_manager.rebuild()
+        rebuilt_links = link_manager.links
+        assert set(rebuilt_links) == set(links)
+        for addr, groups in links.items():
+            for group, group_responders in groups.items():
+                assert set(rebuilt_links[addr][group]) == set(group_responders)
+
+    @async_case
+    async def test_device_links_broadcast_data3_not_group(self):
+        """Test a responder record with a data3 value that is not a group."""
+        await _load_devices(test_lock)
+        controller = devices["1a1a1a"].address
+        responder = devices["3c3c3c"].address
+        assert 0x55 not in devices[responder].groups
+
+        rec = ALDBRecord(
+            memory=0,
+            controller=False,
+            group=2,
+            target=controller,
+            data1=255,
+            data2=28,
+            data3=0x55,
+            in_use=True,
+        )
+        _add_rec_to_aldb(devices[responder], rec)
+        await asyncio.sleep(0.1)
+        assert link_manager.get_responders(controller, 2)
+
+        topic = "1a1a1a.2.on.all_link_broadcast"
+        topic_item = TopicItem(topic, cmd_kwargs(0x11, 0xFF, None, "00.00.02"), 0)
+        devices["3c3c3c"].async_status.call_count = 0
+        send_topics([topic_item])
+        await asyncio.sleep(0.2)
+        assert devices["3c3c3c"].async_status.call_count == 1
+
+    @async_case
+    async def test_device_links_empty_target(self):
+        """Test a record rewritten to an empty target is removed from the index."""
+        await _load_devices(test_lock)
+        controller = devices["1a1a1a"].address
+        responder = devices["3c3c3c"].address
+        assert link_manager.get_responders(controller, 1)
+
+        for device, target in (
+            (devices[responder], controller),
+            (devices[controller], responder),
+        ):
+            for mem_addr, rec in list(device.aldb.items()):
+                if rec.target != target:
+                    continue
+                empty_rec = ALDBRecord(
+                    memory=mem_addr,
+                    controller=rec.is_controller,
+                    group=rec.group,
+                    target="000000",
+                    data1=rec.data1,
+                    data2=rec.data2,
+                    data3=rec.data3,
+                    in_use=True,
+                )
+                _add_rec_to_aldb(device, empty_rec)
+        await asyncio.sleep(0.1)
+        assert not link_manager.get_responders(controller, 1)
+
+    @async_case
+    async def test_saved_device_links(self):
+        """Test the links of saved devices are indexed before they are created."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        lazy_link_manager = DeviceLinkManager(device_manager)
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(FIXTURE_FILE, os.path.join(workdir, "insteon_devices.json"))
+            await device_manager.async_load(workdir, 0, 0, lazy=True)
+        await asyncio.sleep(0.3)
+
+        controller = Address("1a1a1a")
+        responder = Address("3c3c3c")
+        assert len(device_manager.saved_devices) == 7
+        assert len(lazy_link_manager.links) == 2
+        responders = lazy_link_manager.get_responders(controller, 1)
+        assert list(responders) == [responder]
+        assert responders[responder][0].data1 == 255
+
+        lazy_link_manager.rebuild()
+        assert len(lazy_link_manager.links) == 2
+        assert len(device_manager.saved_devices) == 7
+
+        # A link manager created after the devices are loaded indexes them
+        loaded_link_manager = DeviceLinkManager(device_manager)
+        assert len(loaded_link_manager.links) == 2
+        assert list(loaded_link_manager.get_responders(controller, 1)) == [responder]
+        assert len(device_manager.saved_devices) == 7
+
+        # Creating the device keeps its links
+        assert device_manager[responder].address == responder
+        await asyncio.sleep(0.3)
+        assert list(lazy_link_manager.get_responders(controller, 1)) == [responder]
+        await device_manager.async_close()
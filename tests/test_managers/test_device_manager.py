@@ -0,0 +1,282 @@
+"""Test the device manager."""
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyinsteon import pub
+from pyinsteon.address import Address
+from pyinsteon.constants import ALDBStatus
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers import saved_devices_manager
+from pyinsteon.managers.device_id_manager import DeviceId
+from pyinsteon.managers.device_manager import DeviceManager
+from pyinsteon.managers.utils import create_device
+from tests.utils import async_case, cmd_kwargs
+
+FIXTURE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "devices_fixture.json"
+)
+
+
+class TestDeviceManager(unittest.TestCase):
+    """Test the device manager."""
+
+    @async_case
+    async def test_inspect_devices(self):
+        """Test the modem ALDB is loaded once for a batch of devices."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        device_manager.modem.aldb.async_load = AsyncMock()
+        calls = []
+
+        devices = []
+        for index in range(5):
+            device_id = DeviceId(Address(f"7a7a{index:02x}"), 0x01, 0x20, 0x45)
+            device = create_device(device_id)
+            device.async_read_config = AsyncMock(
+                side_effect=lambda address=device.address: calls.append(address)
+            )
+            device.async_add_default_links = AsyncMock()
+            devices.append(device)
+
+        await device_manager.async_inspect_devices(devices)
+        assert calls == [device.address for device in devices]
+        assert device_manager.modem.aldb.async_load.call_count == 1
+        for device in devices:
+            assert device.async_add_default_links.call_count == 1
+        assert device_manager.inspection_stats["devices"] == 5
+        assert device_manager.inspection_stats["seconds"] >= 0
+        await device_manager.async_close()
+
+    @async_case
+    async def test_load_all(self):
+        """Test loading the ALDB of several devices at the same time."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        device_manager.modem.aldb.async_load = AsyncMock()
+        loading = set()
+        max_loading = 0
+        calls = []
+
+        def _mock_load(device, fail):
+            async def _async_load(refresh):
+                nonlocal max_loading
+                calls.append((device.address, refresh))
+                loading.add(device.address)
+                max_loading = max(max_loading, len(loading))
+                await asyncio.sleep(0.05)
+                loading.remove(device.address)
+                # pylint: disable=protected-access
+                device.aldb._status = ALDBStatus.PARTIAL if fail else ALDBStatus.LOADED
+
+            return _async_load
+
+        devices = []
+        for index in range(6):
+            device_id = DeviceId(Address(f"7b7b{index:02x}"), 0x01, 0x20, 0x45)
+            device = create_device(device_id)
+            device.aldb.async_load = _mock_load(device, fail=index == 0)
+            devices.append(device)
+            # pylint: disable=protected-access
+            device_manager._devices[device.address] = device
+
+        results = [
+            result
+            async for result in device_manager.async_load_all(
+                addresses=[device.address for device in devices], max_concurrent=2
+            )
+        ]
+        assert max_loading == 2
+        assert len(results) == 7
+        # The failed device is retried with refresh after the other devices
+        assert calls[0] == (devices[0].address, False)
+        assert calls[-1] == (devices[0].address, True)
+        assert results[-1] == (devices[0].address, ALDBStatus.PARTIAL)
+        assert device_manager.modem.aldb.async_load.call_count == 0
+        assert device_manager.aldb_load_progress == {
+            "total": 6,
+            "loaded": 5,
+            "failed": 1,
+            "deferred": 0,
+        }
+        await device_manager.async_close()
+
+    @async_case
+    async def test_lazy_load(self):
+        """Test saved devices are created when first used."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(FIXTURE_FILE, os.path.join(workdir, "insteon_devices.json"))
+            await device_manager.async_load(workdir, 0, 0, lazy=True)
+
+        assert len(device_manager) == 8
+        assert len(device_manager.saved_devices) == 7
+        assert device_manager.load_stats["deferred"] == 7
+        assert device_manager.id_manager["1a1a1a"].cat == 0x01
+
+        # Created when accessed
+        device = device_manager["1a1a1a"]
+        assert device.address == Address("1a1a1a")
+        assert len(device.aldb) > 0
+        assert Address("1a1a1a") not in device_manager.saved_devices
+
+        # Created by its first message which is sent to the new device
+        pub.sendMessage(
+            "3c3c3c.1.on.all_link_broadcast",
+            **cmd_kwargs(0x11, 0xFF, None, "000001"),
+        )
+        assert Address("3c3c3c") not in device_manager.saved_devices
+        assert device_manager["3c3c3c"].groups[1].value == 0xFF
+        assert device_manager.load_stats["created"]["devices"] == 2
+        assert {device.address for device in device_manager.created_devices} == {
+            Address("111111"),
+            Address("1a1a1a"),
+            Address("3c3c3c"),
+        }
+        assert len(device_manager.saved_devices) == 5
+
+        # Saved devices that are not created are saved unchanged
+        with tempfile.TemporaryDirectory() as workdir:
+            await device_manager.async_save(workdir)
+            saved = DeviceManager()
+            saved.modem = device_manager.modem
+            await saved.async_load(workdir, 0, 0)
+        assert len(saved) == 8
+        assert not saved.saved_devices
+        for address in device_manager:
+            assert saved[address].aldb.status == device_manager[address].aldb.status
+        await device_manager.async_close()
+        await saved.async_close()
+
+    @async_case
+    async def test_incremental_save(self):
+        """Test only the changed devices are saved to the journal file."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with tempfile.TemporaryDirectory() as workdir:
+            device_file = os.path.join(workdir, "insteon_devices.json")
+            journal_file = os.path.join(workdir, "insteon_devices.journal")
+            shutil.copy(FIXTURE_FILE, device_file)
+            await device_manager.async_load(workdir, 0, 0, lazy=True)
+            assert not device_manager.changed_devices
+
+            device = device_manager["1a1a1a"]
+            assert not device_manager.changed_devices
+            prop = next(iter(device.properties.values()))
+            prop.set_value(not prop.value)
+            device_manager[Address("3c3c3c")] = None
+            assert set(device_manager.changed_devices) == {
+                Address("1a1a1a"),
+                Address("3c3c3c"),
+            }
+
+            with open(device_file, encoding="utf-8") as file:
+                device_json = file.read()
+            await device_manager.async_save(workdir)
+            assert not device_manager.changed_devices
+            with open(device_file, encoding="utf-8") as file:
+                assert file.read() == device_json
+            with open(journal_file, encoding="utf-8") as file:
+                assert len(file.readlines()) == 3
+
+            saved = DeviceManager()
+            saved.modem = device_manager.modem
+            await saved.async_load(workdir, 0, 0)
+            assert len(saved) == 7
+            assert saved["3c3c3c"] is None
+            assert saved["1a1a1a"].properties[prop.name].value == prop.value
+
+            # A journal of an earlier device file is ignored
+            await device_manager.async_save(workdir, compact=True)
+            assert not os.path.exists(journal_file)
+            with open(journal_file, "w", encoding="utf-8") as file:
+                file.write('{"device_file_hash": "0"}\n{"address": "1a1a1a"}\n')
+            await saved.async_load(workdir, 0, 0)
+            assert saved["1a1a1a"].cat == 0x01
+
+            # A journal of a device file of the same size is ignored
+            await device_manager.async_save(workdir, compact=True)
+            device_manager[Address("1a1a1a")] = None
+            await device_manager.async_save(workdir)
+            with open(journal_file, encoding="utf-8") as file:
+                assert len(file.readlines()) == 2
+            with open(device_file, encoding="utf-8") as file:
+                device_json = file.read()
+            with open(device_file, "w", encoding="utf-8") as file:
+                file.write(device_json.replace("2b2b2b", "2b2b2c"))
+            reloaded = DeviceManager()
+            reloaded.modem = device_manager.modem
+            await reloaded.async_load(workdir, 0, 0)
+            assert reloaded["1a1a1a"].cat == 0x01
+
+        await device_manager.async_close()
+        await saved.async_close()
+        await reloaded.async_close()
+
+    @async_case
+    async def test_journal_append(self):
+        """Test appending to the journal after an interrupted write."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with tempfile.TemporaryDirectory() as workdir:
+            journal_file = os.path.join(workdir, "insteon_devices.journal")
+            shutil.copy(FIXTURE_FILE, os.path.join(workdir, "insteon_devices.json"))
+            await device_manager.async_load(workdir, 0, 0, lazy=True)
+
+            # The hash of the device file is cached when it is loaded
+            # pylint: disable=protected-access
+            with patch.object(
+                saved_devices_manager,
+                "_file_hash",
+                wraps=saved_devices_manager._file_hash,
+            ) as file_hash:
+                device_manager[Address("3c3c3c")] = None
+                await device_manager.async_save(workdir)
+                file_hash.assert_not_called()
+
+            with open(journal_file, "a", encoding="utf-8") as file:
+                file.write('{"address": "1a1a1a", "ca')
+            device_manager[Address("2b2b2b")] = None
+            await device_manager.async_save(workdir)
+            with open(journal_file, encoding="utf-8") as file:
+                assert len(file.readlines()) == 4
+
+            saved = DeviceManager()
+            saved.modem = device_manager.modem
+            await saved.async_load(workdir, 0, 0)
+            assert saved["3c3c3c"] is None
+            assert saved["2b2b2b"] is None
+            assert saved["1a1a1a"].cat == 0x01
+
+        await device_manager.async_close()
+        await saved.async_close()
+
+    @async_case
+    async def test_autosave(self):
+        """Test the changed devices are saved once the changes stop."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with tempfile.TemporaryDirectory() as workdir:
+            device_file = os.path.join(workdir, "insteon_devices.json")
+            device_manager.start_autosave(workdir, delay=0.2, max_delay=1)
+            await asyncio.sleep(0.1)
+            device = create_device(DeviceId(Address("7b7b01"), 0x01, 0x20, 0x45))
+            device_manager[device.address] = device
+            await asyncio.sleep(0.1)
+            prop = next(iter(device.properties.values()))
+            prop.set_value(not prop.value)
+            await asyncio.sleep(0.1)
+            assert not os.path.exists(device_file)
+
+            await asyncio.sleep(0.3)
+            assert os.path.exists(device_file)
+            assert not device_manager.changed_devices
+
+            # Changes waiting for autosave are saved on close
+            prop.set_value(not prop.value)
+            await device_manager.async_close()
+            assert os.path.exists(os.path.join(workdir, "insteon_devices.journal"))
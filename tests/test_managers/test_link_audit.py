@@ -0,0 +1,154 @@
+"""Test the link audit."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyinsteon.address import Address
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus, LinkStatus
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_id_manager import DeviceId
+from pyinsteon.managers.device_manager import DeviceManager
+from pyinsteon.managers.link_manager import get_broken_links
+from pyinsteon.managers.link_manager.link_audit import LinkAudit
+from pyinsteon.managers.utils import create_device
+
+from tests.utils import async_case
+
+FIXTURE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "devices_fixture.json"
+)
+
+
+def _record(mem_addr, controller, group, target, in_use=True):
+    """Create an ALDB record."""
+    return ALDBRecord(
+        mem_addr,
+        controller=controller,
+        group=group,
+        target=target,
+        data1=255,
+        data2=28,
+        data3=1,
+        in_use=in_use,
+        high_water_mark=False,
+    )
+
+
+def _hwm(mem_addr):
+    """Create a high water mark record."""
+    return ALDBRecord(
+        mem_addr,
+        controller=False,
+        group=0,
+        target="000000",
+        data1=0,
+        data2=0,
+        data3=0,
+        in_use=False,
+        high_water_mark=True,
+    )
+
+
+def _load_records(device, records):
+    """Load the records and a high water mark in the device ALDB."""
+    records = {rec.mem_addr: rec for rec in records}
+    hwm_mem_addr = min(records) - 8 if records else 0x0FFF
+    records[hwm_mem_addr] = _hwm(hwm_mem_addr)
+    device.aldb.load_saved_records(ALDBStatus.LOADED, records)
+
+
+class TestLinkAudit(unittest.TestCase):
+    """Test the link audit."""
+
+    def _setup_devices(self):
+        """Set up the devices."""
+        self.devices = {}
+        for address in ("6a0001", "6a0002", "6a0003"):
+            device = create_device(DeviceId(Address(address), 0x01, 0x20, 0x45))
+            self.devices[device.address] = device
+        self.addr_1, self.addr_2, self.addr_3 = list(self.devices)
+        missing = Address("6a0009")
+
+        _load_records(
+            self.devices[self.addr_1],
+            [
+                _record(0x0FFF, True, 1, self.addr_2),
+                _record(0x0FF7, True, 2, self.addr_2),
+                _record(0x0FEF, True, 1, missing),
+                # Unused records are ignored
+                _record(0x0FE7, True, 3, self.addr_2, in_use=False),
+            ],
+        )
+        _load_records(
+            self.devices[self.addr_2],
+            [
+                _record(0x0FFF, False, 1, self.addr_1),
+                _record(0x0FF7, False, 3, self.addr_1),
+                _record(0x0FEF, False, 1, self.addr_3),
+            ],
+        )
+        self.devices[self.addr_3].aldb.load_saved_records(ALDBStatus.EMPTY, {})
+
+    @async_case
+    async def test_get_broken_links(self):
+        """Test finding broken links."""
+        self._setup_devices()
+        broken = {
+            (address, rec.mem_addr): status
+            for address, rec, status in get_broken_links(self.devices)
+        }
+        assert broken == {
+            (self.addr_1, 0x0FF7): LinkStatus.MISSING_RESPONDER,
+            (self.addr_1, 0x0FEF): LinkStatus.MISSING_TARGET,
+            (self.addr_2, 0x0FF7): LinkStatus.MISSING_CONTROLLER,
+            (self.addr_2, 0x0FEF): LinkStatus.TARGET_DB_NOT_LOADED,
+        }
+
+    @async_case
+    async def test_record_changes(self):
+        """Test the index is updated when records change."""
+        self._setup_devices()
+        link_audit = LinkAudit(self.devices)
+        link_audit.subscribe()
+        try:
+            assert len(link_audit.get_broken_links()) == 4
+
+            # Add the missing responder record for group 2
+            responder_records = [
+                _record(0x0FFF, False, 1, self.addr_1),
+                _record(0x0FF7, False, 3, self.addr_1),
+                _record(0x0FEF, False, 1, self.addr_3),
+                _record(0x0FE7, False, 2, self.addr_1),
+            ]
+            _load_records(self.devices[self.addr_2], responder_records)
+            assert len(link_audit.get_broken_links()) == 3
+
+            # Remove the responder record for group 1
+            responder_records[0] = _record(0x0FFF, False, 1, self.addr_1, False)
+            _load_records(self.devices[self.addr_2], responder_records)
+            broken = link_audit.get_broken_links()
+            assert len(broken) == 4
+            assert (
+                self.addr_1,
+                self.devices[self.addr_1].aldb[0x0FFF],
+                LinkStatus.MISSING_RESPONDER,
+            ) in broken
+        finally:
+            link_audit.unsubscribe()
+
+    @async_case
+    async def test_saved_devices(self):
+        """Test the records of saved devices are indexed without creating them."""
+        device_manager = DeviceManager()
+        device_manager.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(FIXTURE_FILE, os.path.join(workdir, "insteon_devices.json"))
+            await device_manager.async_load(workdir, 0, 0, lazy=True)
+
+        link_audit = LinkAudit(device_manager)
+        # pylint: disable=protected-access
+        assert link_audit._records[Address("1a1a1a")]
+        assert len(device_manager.saved_devices) == 7
+        await device_manager.async_close()
@@ -3,6 +3,7 @@
 import asyncio
 import os
 from random import randint
+import tempfile
 import unittest
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,11 +11,15 @@ import pytest
 
 import pyinsteon
 from pyinsteon import devices
+from pyinsteon.address import Address
 from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus
 from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_id_manager import DeviceId
 from pyinsteon.managers.device_manager import DeviceManager
 from pyinsteon.managers.scene_manager import (
     DeviceLinkSchema,
+    SceneIndex,
     async_add_or_update_scene,
     async_delete_scene,
     async_get_scene,
@@ -23,11 +28,11 @@ from pyinsteon.managers.scene_manager import (
     async_save_scene_names,
     set_scene_name,
 )
+from pyinsteon.managers.utils import create_device
 
 from tests import load_devices, set_log_levels
 from tests.utils import async_case
 
-PWD = os.path.dirname(__file__)
 TEST_LOCK = asyncio.Lock()
 
 
@@ -61,6 +66,20 @@ def _add_rec_to_aldb(device, record):
     device.aldb.load_saved_records(device.aldb.status, records)
 
 
+def _scene_rec(mem_addr, controller, group, target, in_use=True):
+    """Create a scene ALDB record."""
+    return ALDBRecord(
+        memory=mem_addr,
+        controller=controller,
+        group=group,
+        target=target,
+        data1=255,
+        data2=28,
+        data3=1,
+        in_use=in_use,
+    )
+
+
 class TestDeviceLinkManager(unittest.TestCase):
     """Test the DeviceLinkManager class."""
 
@@ -85,12 +104,13 @@ class TestDeviceLinkManager(unittest.TestCase):
             device.async_status = AsyncMock()
 
         set_scene_name(20, "My scene number 20")
-        await async_save_scene_names(PWD)
-        scene_file = os.path.join(PWD, "insteon_scenes.json")
-        assert os.path.exists(scene_file)
+        with tempfile.TemporaryDirectory() as workdir:
+            await async_save_scene_names(workdir)
+            scene_file = os.path.join(workdir, "insteon_scenes.json")
+            assert os.path.exists(scene_file)
 
-        await load_devices(devices)
-        await async_load_scene_names(PWD)
+            await load_devices(devices)
+            await async_load_scene_names(workdir)
         scene_20 = await async_get_scene(20)
         assert scene_20["name"] == "My scene number 20"
 
@@ -368,7 +388,8 @@ class TestDeviceLinkManager(unittest.TestCase):
         assert len(scene["devices"]) == 2
 
         # Delete the scene
-        await async_delete_scene(scene_num, PWD)
+        with tempfile.TemporaryDirectory() as workdir:
+            await async_delete_scene(scene_num, workdir)
         assert len(devices.modem.aldb.pending_changes) == 2
         assert devices.modem.aldb.async_write.call_count == 1
 
@@ -377,3 +398,54 @@ class TestDeviceLinkManager(unittest.TestCase):
 
         assert len(devices[responder_2].aldb.pending_changes) == 1
         assert devices[responder_2].aldb.async_write.call_count == 1
+
+    @async_case
+    async def test_scene_index(self):
+        """Test the scene index is updated when records change."""
+        devices_mgr = DeviceManager()
+        # pylint: disable=protected-access
+        async with devices_mgr._loading_saved_lock:
+            devices_mgr.modem = Hub("1b1b1b", 0x03, 51, 165, "Insteon modem")
+            for address in ("6b0001", "6b0002"):
+                device_id = DeviceId(Address(address), 0x01, 0x20, 0x45)
+                devices_mgr[device_id.address] = create_device(device_id)
+        modem = devices_mgr.modem
+        addr_1, addr_2 = Address("6b0001"), Address("6b0002")
+        scene_index = SceneIndex(devices_mgr)
+
+        modem.aldb.load_saved_records(
+            ALDBStatus.LOADED, {0x1FFF: _scene_rec(0x1FFF, True, 30, addr_1)}
+        )
+        devices_mgr[addr_1].aldb.load_saved_records(
+            ALDBStatus.LOADED, {0x0FFF: _scene_rec(0x0FFF, False, 30, modem.address)}
+        )
+        responder_records = {
+            0x0FFF: _scene_rec(0x0FFF, False, 30, modem.address),
+            0x0FF7: _scene_rec(0x0FF7, False, 0, modem.address),
+        }
+        devices_mgr[addr_2].aldb.load_saved_records(
+            ALDBStatus.LOADED, responder_records
+        )
+
+        scenes = scene_index.get_scenes()
+        assert list(scenes) == [30]
+        assert scenes[30][addr_1][0].has_controller
+        assert not scenes[30][addr_2][0].has_controller
+
+        # Add the modem controller record of the second device
+        modem.aldb.load_saved_records(
+            ALDBStatus.LOADED,
+            {
+                0x1FFF: _scene_rec(0x1FFF, True, 30, addr_1),
+                0x1FF7: _scene_rec(0x1FF7, True, 30, addr_2),
+            },
+        )
+        assert scene_index.get_scene(30)[addr_2][0].has_controller
+
+        # Remove the responder record of the first device
+        devices_mgr[addr_1].aldb.load_saved_records(
+            ALDBStatus.LOADED,
+            {0x0FFF: _scene_rec(0x0FFF, False, 30, modem.address, in_use=False)},
+        )
+        assert list(scene_index.get_scene(30)) == [addr_2]
+        assert not scene_index.get_scene(31)
@@ -0,0 +1,113 @@
+"""Test the streaming inbound message decoder."""
+
+from binascii import unhexlify
+from unittest import TestCase
+
+from pyinsteon.constants import MessageId
+from pyinsteon.protocol.messages.inbound import InboundDecoder, create
+
+
+class TestInboundDecoder(TestCase):
+    """Test the streaming inbound message decoder."""
+
+    def test_one_byte(self):
+        """Test a single byte message."""
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(unhexlify("02")))
+        assert decoder.buffer == unhexlify("02")
+
+    def test_partial_message(self):
+        """Test a message received in parts."""
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(unhexlify("02500304050607")))
+        msgs = list(decoder.decode(unhexlify("0809130b")))
+        assert len(msgs) == 1
+        assert msgs[0].message_id == MessageId.STANDARD_RECEIVED
+        assert msgs[0].cmd1 == 0x13
+        assert not decoder
+
+    def test_partial_flags(self):
+        """Test a send message received before the flags byte."""
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(unhexlify("0262030405")))
+        msgs = list(decoder.decode(unhexlify("0911ff06")))
+        assert len(msgs) == 1
+        assert msgs[0].cmd2 == 0xFF
+
+    def test_partial_extended_message(self):
+        """Test an extended send message received in parts."""
+        data = unhexlify("0262030405191122" + "00" * 14 + "06")
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(data[:10]))
+        msgs = list(decoder.decode(data[10:]))
+        assert len(msgs) == 1
+        assert bytes(msgs[0]) == data
+
+    def test_invalid_msg_id_message(self):
+        """Test an invalid message ID is skipped."""
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(unhexlify("02980304050253")))
+        assert decoder.buffer == unhexlify("0253")
+
+    def test_invalid_msg_def_message(self):
+        """Test a message ID with no inbound definition is skipped."""
+        decoder = InboundDecoder()
+        assert not list(decoder.decode(unhexlify("02990304050253")))
+        assert decoder.buffer == unhexlify("0253")
+
+    def test_invalid_initial_data(self):
+        """Test invalid data received before a message."""
+        decoder = InboundDecoder()
+        msgs = list(decoder.decode(unhexlify("9903040502520380")))
+        assert len(msgs) == 1
+        assert msgs[0].message_id == 0x52
+        assert not decoder
+
+    def test_multiple_messages(self):
+        """Test multiple messages in one read."""
+        decoder = InboundDecoder()
+        msgs = list(decoder.decode(unhexlify("0252038002540302550252")))
+        assert [msg.message_id for msg in msgs] == [0x52, 0x54, 0x55]
+        assert decoder.buffer == unhexlify("0252")
+
+    def test_nak_only(self):
+        """Test a NAK received outside of a message."""
+        naks = []
+        decoder = InboundDecoder(nak_callback=lambda: naks.append(True))
+        assert not list(decoder.decode(unhexlify("15")))
+        assert naks == [True]
+        assert not decoder
+
+    def test_im_info_nak(self):
+        """Test the short NAK response to Get IM Info."""
+        decoder = InboundDecoder()
+        msgs = list(decoder.decode(unhexlify("026015")))
+        assert len(msgs) == 1
+        assert msgs[0].message_id == MessageId.GET_IM_INFO
+        assert len(msgs[0]) == 3
+
+    def test_matches_create(self):
+        """Test the decoder returns the same messages as create."""
+        stream = unhexlify(
+            "99025003040506070809110b"
+            "025103040506070809990ba1a2a3a4a5a6a7a8a9aaabacadae"
+            "02620304050f110b06"
+            "02570304050607080901"
+            "0261010203"
+            "06"
+        )
+        expected = []
+        buffer = bytearray(stream)
+        while buffer:
+            last_buffer = buffer
+            msg, buffer = create(buffer)
+            if msg:
+                expected.append(bytes(msg))
+            if last_buffer == buffer:
+                break
+
+        decoder = InboundDecoder()
+        msgs = []
+        for index in range(0, len(stream), 7):
+            msgs.extend(bytes(msg) for msg in decoder.decode(stream[index : index + 7]))
+        assert msgs == expected
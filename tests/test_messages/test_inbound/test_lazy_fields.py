@@ -0,0 +1,48 @@
+"""Test the lazy creation of inbound message fields."""
+
+from binascii import unhexlify
+from unittest import TestCase
+
+from pyinsteon.address import Address
+from pyinsteon.constants import AckNak
+from pyinsteon.data_types.message_flags import MessageFlags
+from pyinsteon.data_types.user_data import UserData
+from pyinsteon.protocol.messages.inbound import create
+
+
+class TestLazyFields(TestCase):
+    """Test the lazy creation of inbound message fields."""
+
+    def test_lazy_address(self):
+        """Test the address fields are created on first access."""
+        msg, _ = create(bytearray(unhexlify("0250010203040506070809")))
+        assert "address" not in vars(msg)
+        assert msg.cmd1 == 0x08
+        assert msg.address == Address("010203")
+        assert "address" in vars(msg)
+        assert msg.address is msg.address
+        assert msg.target == Address("040506")
+        assert msg.flags == MessageFlags(0x07)
+
+    def test_lazy_user_data(self):
+        """Test the user data field is created on first access."""
+        msg, _ = create(
+            bytearray(
+                unhexlify("0262010203191122" + "0102030405060708090a0b0c0d0e" + "06")
+            )
+        )
+        assert msg.ack == AckNak.ACK
+        assert isinstance(msg.user_data, UserData)
+        assert msg.user_data["d14"] == 0x0E
+
+    def test_missing_attribute(self):
+        """Test an attribute that is not a field raises AttributeError."""
+        msg, _ = create(bytearray(unhexlify("0250010203040506070809")))
+        with self.assertRaises(AttributeError):
+            msg.not_a_field  # pylint: disable=pointless-statement
+        assert getattr(msg, "user_data", None) is None
+
+    def test_invalid_enum(self):
+        """Test an invalid ACK byte is rejected when decoded."""
+        with self.assertRaises(ValueError):
+            create(bytearray(unhexlify("02620102030f110b99")))
@@ -6,7 +6,9 @@ from unittest import TestCase
 from unittest.mock import patch
 
 import aiofiles
+from aiohttp import BasicAuth, web
 from aiohttp.client_exceptions import ClientError
+from aiohttp.test_utils import TestServer
 
 import pyinsteon
 from pyinsteon.protocol.http_reader_writer import (
@@ -229,3 +231,153 @@ class TestHttpReaderWriter(TestCase):
             http_reader_writer = HttpReaderWriter(None)
             result = await http_reader_writer.async_write("some_url")
             assert result == 500
+
+
+def _create_hub_app(connections, buffer):
+    """Create a web application that serves the Hub buffer."""
+
+    async def buffstatus(request):
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.Response(text=f"<response><BS>{buffer}</BS></response>")
+
+    async def command(request):
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/buffstatus.xml", buffstatus)
+    app.router.add_post("/3", command)
+    return app
+
+
+class TestHttpSession(TestCase):
+    """Test the persistent HTTP session against a local server."""
+
+    @async_case
+    async def test_session_reused(self):
+        """Test requests to the Hub share one connection."""
+        connections = set()
+        buffer = "0250010203040506072b00" + "0" * 178 + "16"
+        server = TestServer(_create_hub_app(connections, buffer))
+        await server.start_server()
+        http_reader_writer = HttpReaderWriter(BasicAuth("username", "password"))
+        try:
+            assert await http_reader_writer.async_test_connection(
+                str(server.make_url("/buffstatus.xml"))
+            )
+            for _ in range(5):
+                await http_reader_writer.async_read(
+                    str(server.make_url("/buffstatus.xml"))
+                )
+            status = await http_reader_writer.async_write(str(server.make_url("/3")))
+            assert status == 200
+            assert len(connections) == 1
+            stats = http_reader_writer.stats
+            assert stats["requests"] == 7
+            assert stats["errors"] == 0
+            assert stats["reconnects"] == 0
+            assert stats["average_latency"] > 0
+        finally:
+            await http_reader_writer.async_close()
+            await server.close()
+
+    @async_case
+    async def test_session_reconnect(self):
+        """Test the session is created again after a client error."""
+        connections = set()
+        server = TestServer(_create_hub_app(connections, "0" * 202))
+        await server.start_server()
+        url = str(server.make_url("/buffstatus.xml"))
+        http_reader_writer = HttpReaderWriter(BasicAuth("username", "password"))
+        try:
+            await http_reader_writer.async_read(url)
+            with patch.object(
+                pyinsteon.protocol.http_reader_writer.ClientSession,
+                "get",
+                side_effect=ClientError,
+            ):
+                try:
+                    await http_reader_writer.async_read(url)
+                    assert False
+                except HubConnectionException:
+                    assert True
+            await http_reader_writer.async_read(url)
+            stats = http_reader_writer.stats
+            assert stats["requests"] == 3
+            assert stats["errors"] == 1
+            assert stats["reconnects"] == 1
+            assert len(connections) == 2
+        finally:
+            await http_reader_writer.async_close()
+            await server.close()
+
+
+def _hub_html(hub_buffer, stop):
+    """Return the Hub buffer page for a buffer and write position."""
+    return f"<response><BS>{hub_buffer}{stop:02X}</BS></response>"
+
+
+class TestHubBuffer(TestCase):
+    """Test reading the Hub circular buffer."""
+
+    @async_case
+    async def test_sync_reader(self):
+        """Test data in the buffer when the reader starts is skipped."""
+        with patch.object(
+            pyinsteon.protocol.http_reader_writer,
+            "ClientSession",
+            create_mock_http_client,
+        ):
+            http_reader_writer = HttpReaderWriter(None)
+            hub_buffer = "0250010203040506072b1100" + "0" * 176
+            await http_reader_writer.sync_reader()
+            MockHttpResponse.buffer = _hub_html(hub_buffer, 22)
+            assert await http_reader_writer.async_read("some_url") is None
+
+            hub_buffer = hub_buffer[:22] + "0262010203" + hub_buffer[32:]
+            MockHttpResponse.buffer = _hub_html(hub_buffer, 32)
+            assert await http_reader_writer.async_read("some_url") == "0262010203"
+            assert http_reader_writer.stats["bytes_read"] == 5
+
+    @async_case
+    async def test_overrun(self):
+        """Test the Hub writing past the last read position."""
+        with patch.object(
+            pyinsteon.protocol.http_reader_writer,
+            "ClientSession",
+            create_mock_http_client,
+        ):
+            http_reader_writer = HttpReaderWriter(None)
+            msg = "0250010203040506072b1100"
+            hub_buffer = msg + "0" * 176
+            MockHttpResponse.buffer = _hub_html(hub_buffer, 22)
+            assert await http_reader_writer.async_read("some_url") == msg[:22]
+
+            # The Hub wrote 9 messages and wrapped past the last read position
+            stream = (msg[:22] + "06") * 9
+            hub_buffer = (hub_buffer[:22] + stream)[-200:]
+            stop = (22 + len(stream)) % 200
+            hub_buffer = hub_buffer[-stop:] + hub_buffer[:-stop]
+            MockHttpResponse.buffer = _hub_html(hub_buffer, stop)
+            buffer = await http_reader_writer.async_read("some_url")
+            assert buffer == stream[-192:]
+            stats = http_reader_writer.stats
+            assert stats["overruns"] == 1
+            assert stats["lost_bytes"] == 4
+
+    @async_case
+    async def test_cleared_buffer_not_overrun(self):
+        """Test a buffer cleared by the Hub is not reported as an overrun."""
+        with patch.object(
+            pyinsteon.protocol.http_reader_writer,
+            "ClientSession",
+            create_mock_http_client,
+        ):
+            http_reader_writer = HttpReaderWriter(None)
+            msg = "0250010203040506072b1100"
+            MockHttpResponse.buffer = _hub_html(msg + "0" * 176, 24)
+            assert await http_reader_writer.async_read("some_url") == msg
+
+            MockHttpResponse.buffer = _hub_html("0262010203" + "0" * 190, 10)
+            assert await http_reader_writer.async_read("some_url") == "0262010203"
+            assert http_reader_writer.stats["overruns"] == 0
@@ -5,6 +5,8 @@ from binascii import unhexlify
 from unittest import TestCase
 from unittest.mock import patch
 
+import async_timeout
+
 import pyinsteon
 from pyinsteon.protocol.http_transport import HttpTransport, async_connect_http
 from pyinsteon.protocol.hub_connection_exception import HubConnectionException
@@ -54,10 +56,21 @@ class MockHttpReaderWriter:
     async def reset_reader(self):
         """Mock the reset reader method."""
 
+    async def sync_reader(self):
+        """Mock the sync reader method."""
+
     async def async_test_connection(self, url):
         """Mock the test_connection method."""
         return self.test_connection
 
+    async def async_close(self):
+        """Mock the async_close method."""
+
+    @property
+    def stats(self):
+        """Mock the stats property."""
+        return {}
+
 
 class MockHttpTransport(HttpTransport):
     """Mock HTTP Transport for testing."""
@@ -88,6 +101,8 @@ class TestHttpTransport(TestCase):
         """Set up the tests."""
         self.msg = None
         pyinsteon.protocol.http_transport.READ_WAIT = 0.05
+        pyinsteon.protocol.http_transport.MIN_READ_WAIT = 0.05
+        pyinsteon.protocol.http_transport.MAX_READ_WAIT = 0.2
         pyinsteon.protocol.http_transport.SESSION_RETRIES = 3
         pyinsteon.protocol.http_transport.RECONNECT_WAIT = 0.07
         MockHttpReaderWriter.buffer = "0" * 202
@@ -406,3 +421,63 @@ class TestHttpTransport(TestCase):
             MockHttpReaderWriter.status = 200
             await asyncio.sleep(0.3)
             assert transport.last_msg == unhexlify(msg_hex)
+
+    @async_case
+    async def test_adaptive_read_wait(self):
+        """Test the reader backs off when idle and reads faster after a write."""
+        mock_protocol = MockProtocol()
+        with patch.object(
+            pyinsteon.protocol.http_transport,
+            "HttpReaderWriter",
+            MockHttpReaderWriter,
+        ):
+            transport = await mock_async_connect_http(
+                host="host",
+                username="username",
+                password="password",
+                protocol=mock_protocol,
+            )
+            mock_protocol.data_received = self.data_received
+            MockHttpReaderWriter.buffer = None
+            await asyncio.sleep(0.5)
+            assert transport.read_wait == transport.max_read_wait
+
+            transport.write(unhexlify("0203040506"))
+            await asyncio.sleep(0.01)
+            assert transport.read_wait < transport.max_read_wait
+
+            MockHttpReaderWriter.buffer = "0203040506"
+            await asyncio.sleep(0.3)
+            assert self.msg == unhexlify("0203040506")
+            assert transport.read_wait == transport.min_read_wait
+            stats = transport.stats
+            assert stats["deliveries"] > 0
+            assert 0 < stats["delivery_latency"] < 0.3
+            transport.close()
+
+    @async_case
+    async def test_write_during_read(self):
+        """Test a message written during a read is read without waiting."""
+        transport = HttpTransport(
+            protocol=None, host="host", username="username", password="password"
+        )
+        transport.max_read_wait = 5
+        # pylint: disable=protected-access
+        transport._read_wait = 5
+        transport._poll_now.set()
+        async with async_timeout.timeout(1):
+            await transport._async_wait_to_read()
+        assert not transport._poll_now.is_set()
+
+    def test_read_wait_limits(self):
+        """Test setting the read wait limits."""
+        transport = HttpTransport(
+            protocol=None, host="host", username="username", password="password"
+        )
+        transport.max_read_wait = 2
+        transport.min_read_wait = 0.5
+        assert transport.read_wait == 0.5
+        with self.assertRaises(ValueError):
+            transport.min_read_wait = 3
+        with self.assertRaises(ValueError):
+            transport.max_read_wait = 0.1
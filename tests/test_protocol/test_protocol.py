@@ -209,3 +209,60 @@ class TestProtocol(unittest.TestCase):
             protocol.resume_writing()
             await asyncio.sleep(0.1)
             assert protocol.message_queue.empty()
+
+    @async_case
+    async def test_pipelined_writer(self):
+        """Test the writer releases messages on the modem ACK."""
+        async with async_protocol_manager() as protocol:
+            await asyncio.sleep(0.1)
+            protocol.transport.write_wait = 1
+            protocol.pipeline = True
+            for address in ["0a0b01", "0a0b02", "0a0b03"]:
+                protocol.write(unhexlify(f"0262{address}0f1900"))
+            await asyncio.sleep(0.2)
+            stats = protocol.stats
+            assert stats["messages_written"] == 3
+            assert stats["acks"] == 3
+            assert stats["in_flight"] == 3
+            assert stats["queue_depth"] == 0
+
+            # A second command to the same device waits for its response
+            protocol.write(unhexlify("02620a0b010f1900"))
+            await asyncio.sleep(0.1)
+            assert protocol.stats["messages_written"] == 3
+            protocol.data_received(unhexlify("02500a0b011111112b1900"))
+            await asyncio.sleep(0.1)
+            assert protocol.stats["messages_written"] == 4
+            protocol.pipeline = False
+
+    @async_case
+    async def test_pipelined_writer_max_in_flight(self):
+        """Test the number of commands awaiting a device response is limited."""
+        async with async_protocol_manager() as protocol:
+            await asyncio.sleep(0.1)
+            protocol.transport.write_wait = 1
+            protocol.pipeline = True
+            protocol.max_in_flight = 2
+            for address in ["0a0c01", "0a0c02", "0a0c03"]:
+                protocol.write(unhexlify(f"0262{address}0f1900"))
+            await asyncio.sleep(0.2)
+            assert protocol.stats["messages_written"] == 2
+            protocol.data_received(unhexlify("02500a0c011111112b1900"))
+            await asyncio.sleep(0.1)
+            assert protocol.stats["messages_written"] == 3
+            assert protocol.stats["messages_per_second"] > 0
+            protocol.pipeline = False
+
+    @async_case
+    async def test_identical_messages_sent(self):
+        """Test identical messages waiting to be sent are all sent."""
+        async with async_protocol_manager(auto_ack=False) as protocol:
+            await asyncio.sleep(0.1)
+            protocol.pause_writing()
+            await asyncio.sleep(0.1)
+            protocol.write(unhexlify("02620a0d0c0f1500"))
+            protocol.write(unhexlify("02620a0d0c0f1500"))
+            assert protocol.stats["queue_depth"] == 2
+            protocol.resume_writing()
+            await asyncio.sleep(0.2)
+            assert protocol.message_queue.empty()
@@ -0,0 +1,137 @@
+"""Test the fast path topic dispatcher."""
+
+from binascii import unhexlify
+import unittest
+
+from pyinsteon import pub
+from pyinsteon.listener_exception_handler import ListenerExceptionHandler
+from pyinsteon.protocol.messages.inbound import create
+from pyinsteon.protocol.topic_dispatcher import TopicDispatcher
+from pyinsteon.utils import subscribe_topic, unsubscribe_topic
+
+
+def _create_msg(hex_data):
+    """Create an inbound message from hex data."""
+    msg, _ = create(bytearray(unhexlify(hex_data)))
+    return msg
+
+
+class TestTopicDispatcher(unittest.TestCase):
+    """Test the fast path topic dispatcher."""
+
+    def setUp(self):
+        """Set up the tests."""
+        self.dispatcher = TopicDispatcher()
+        self.dispatcher.enable()
+        self.received = []
+
+    def tearDown(self):
+        """Tear down the tests."""
+        self.dispatcher.disable()
+
+    def on_received(self, cmd1, cmd2, target, user_data, hops_left):
+        """Receive the ON topic."""
+        self.received.append(("on", cmd1, cmd2, hops_left))
+
+    def all_received(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Receive all topics for the address."""
+        self.received.append(("all", topic.name, kwargs["hops_left"]))
+
+    def test_dispatch_from_table(self):
+        """Test messages are dispatched from the table after the first one."""
+        topic = "0a0b01.1.on.broadcast"
+        subscribe_topic(self.on_received, topic)
+        subscribe_topic(self.all_received, "0a0b01")
+        try:
+            self.dispatcher.publish(_create_msg("02500a0b010000018b11ff"))
+            assert self.dispatcher.misses == 1
+            assert self.dispatcher.hits == 0
+
+            self.dispatcher.publish(_create_msg("02500a0b010000018711ff"))
+            assert self.dispatcher.misses == 1
+            assert self.dispatcher.hits == 1
+
+            assert self.received == [
+                ("all", topic, 2),
+                ("on", 0x11, 0xFF, 2),
+                ("all", topic, 1),
+                ("on", 0x11, 0xFF, 1),
+            ]
+        finally:
+            unsubscribe_topic(self.on_received, topic)
+            unsubscribe_topic(self.all_received, "0a0b01")
+
+    def test_group_in_key(self):
+        """Test broadcast messages to different groups use different topics."""
+        topic = "0a0b02.2.on.broadcast"
+        subscribe_topic(self.on_received, topic)
+        try:
+            for _ in range(2):
+                self.dispatcher.publish(_create_msg("02500a0b020000018b11ff"))
+            assert not self.received
+            for _ in range(2):
+                self.dispatcher.publish(_create_msg("02500a0b020000028b11ff"))
+            assert len(self.received) == 2
+        finally:
+            unsubscribe_topic(self.on_received, topic)
+
+    def test_subscribe_after_entry(self):
+        """Test listeners that subscribe after a table entry is added."""
+        topic = "0a0b03.1.on.broadcast"
+        msg = _create_msg("02500a0b030000018b11ff")
+        self.dispatcher.publish(msg)
+        assert len(self.dispatcher) == 1
+
+        subscribe_topic(self.on_received, topic)
+        self.dispatcher.publish(msg)
+        self.dispatcher.publish(msg)
+        assert len(self.received) == 2
+        assert self.dispatcher.hits == 2
+
+        unsubscribe_topic(self.on_received, topic)
+        self.dispatcher.publish(msg)
+        assert len(self.received) == 2
+
+    def test_listener_error(self):
+        """Test an error in a listener is handled by publish_topic."""
+        topic = "0a0b06.1.on.broadcast"
+        msg = _create_msg("02500a0b060000018b11ff")
+
+        def bad_listener(cmd1, cmd2, target, user_data, hops_left):
+            raise ValueError("Listener error")
+
+        subscribe_topic(bad_listener, topic)
+        pub.setListenerExcHandler(ListenerExceptionHandler())
+        try:
+            with self.assertLogs("pyinsteon.utils", level="ERROR"):
+                self.dispatcher.publish(msg)
+            with self.assertLogs("pyinsteon.utils", level="ERROR"):
+                self.dispatcher.publish(msg)
+            assert self.dispatcher.hits == 1
+        finally:
+            pub.setListenerExcHandler(None)
+            unsubscribe_topic(bad_listener, topic)
+
+    def test_extended_group(self):
+        """Test the group of extended direct messages is taken from d1."""
+        topic = "0a0b04.2.on.direct"
+        received = []
+
+        def ext_received(cmd1, cmd2, target, user_data, hops_left):
+            received.append(user_data["d1"])
+
+        subscribe_topic(ext_received, topic)
+        try:
+            for group in (1, 2, 2, 1, 2):
+                self.dispatcher.publish(
+                    _create_msg(f"02510a0b041111111011ff{group:02x}" + "00" * 13)
+                )
+            assert received == [2, 2, 2]
+        finally:
+            unsubscribe_topic(ext_received, topic)
+
+    def test_disabled(self):
+        """Test the table is not used when disabled."""
+        self.dispatcher.disable()
+        self.dispatcher.publish(_create_msg("02500a0b050000018b11ff"))
+        assert not self.dispatcher
@@ -0,0 +1,52 @@
+"""Test publishing topics."""
+import gc
+import unittest
+
+from pyinsteon import pub
+from pyinsteon.utils import publish_topic, topic_cache
+
+TOPIC = "test_publish_topic.status"
+
+
+class Listener:
+    """Topic listener."""
+
+    def __init__(self):
+        """Init the Listener class."""
+        self.values = []
+
+    def on_status(self, value):
+        """Save the value received."""
+        self.values.append(value)
+
+
+class TestPublishTopic(unittest.TestCase):
+    """Test publishing topics."""
+
+    def test_deleted_topic(self):
+        """Test a deleted topic is created again."""
+        listener = Listener()
+        pub.subscribe(listener.on_status, TOPIC)
+        publish_topic(TOPIC, value=1)
+        assert listener.values == [1]
+
+        pub.getDefaultTopicMgr().delTopic(TOPIC)
+        assert len(topic_cache) == 0
+        pub.subscribe(listener.on_status, TOPIC)
+        publish_topic(TOPIC, value=2)
+        assert listener.values == [1, 2]
+
+    def test_dead_listener(self):
+        """Test a garbage collected listener is unsubscribed."""
+        listener = Listener()
+        dead_listener = Listener()
+        pub.subscribe(listener.on_status, TOPIC)
+        pub.subscribe(dead_listener.on_status, TOPIC)
+        topic = pub.getDefaultTopicMgr().getTopic(TOPIC)
+        assert topic.getNumListeners() == 2
+
+        del dead_listener
+        gc.collect()
+        assert topic.getNumListeners() == 1
+        publish_topic(TOPIC, value=3)
+        assert listener.values == [3]
@@ -15,6 +15,7 @@ from pyinsteon.device_types.dimmable_lighting_control import (
 )
 from pyinsteon.device_types.plm import PLM
 from pyinsteon.device_types.sensors_actuators import SensorsActuators_IOLink
+from pyinsteon.managers.device_manager import DeviceManager
 from pyinsteon.tools.tools_base import _LOGGING, LOG_FILE_NAME
 
 from tests.utils import random_address
@@ -159,6 +160,12 @@ class ToolsTestBase(TestCase):
 class MockDevices:
     """Mock devices class."""
 
+    # Load the mock device ALDBs with the device manager scheduling
+    # pylint: disable=protected-access
+    async_load_all = DeviceManager.async_load_all
+    _async_load_aldb_workers = DeviceManager._async_load_aldb_workers
+    _async_load_aldb_worker = DeviceManager._async_load_aldb_worker
+
     def __init__(self):
         """Init the MockDevices class."""
 
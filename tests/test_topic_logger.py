@@ -0,0 +1,67 @@
+"""Test the topic logger."""
+import logging
+import unittest
+
+from pyinsteon.topic_logger import topic_logger
+from pyinsteon.utils import publish_topic
+
+LOGGER_NAMES = ["", "pyinsteon", "pyinsteon.topics", "pyinsteon.7f6e5d"]
+
+
+class TestTopicLogger(unittest.TestCase):
+    """Test the topic logger."""
+
+    def setUp(self):
+        """Set the log levels so topic logging is off."""
+        self._levels = {name: logging.getLogger(name).level for name in LOGGER_NAMES}
+        logging.getLogger().setLevel(logging.WARNING)
+        for name in LOGGER_NAMES[1:]:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+
+    def tearDown(self):
+        """Restore the log levels."""
+        for name, level in self._levels.items():
+            logging.getLogger(name).setLevel(level)
+        topic_logger.update()
+
+    def test_topics_logger(self):
+        """Test logging all topics."""
+        topic_logger.update()
+        assert not topic_logger.subscribed
+        with self.assertLogs("pyinsteon.topics", level="DEBUG") as logs:
+            topic_logger.update()
+            assert topic_logger.subscribed
+            publish_topic("test_topic_logger", value=1)
+        topic_logger.update()
+        assert not topic_logger.subscribed
+        assert "test_topic_logger" in logs.output[0]
+
+    def test_device_logger(self):
+        """Test logging the topics of a device."""
+        logging.getLogger("pyinsteon.topics").setLevel(logging.ERROR)
+        with self.assertLogs("pyinsteon.7f6e5d", level="DEBUG") as logs:
+            topic_logger.update()
+            assert topic_logger.subscribed
+            publish_topic("7f6e5d.test_topic_logger", value=1)
+            publish_topic("4d5e6f.test_topic_logger", value=1)
+            publish_topic("test_topic_logger", address="7f6e5d")
+        assert len(logs.output) == 2
+        assert "7f6e5d.test_topic_logger" in logs.output[0]
+
+    def test_level_changed(self):
+        """Test the topic logger follows log level changes without an update."""
+        publish_topic("test_topic_logger", value=1)
+        assert not topic_logger.subscribed
+        with self.assertLogs("pyinsteon.topics", level="DEBUG") as logs:
+            publish_topic("test_topic_logger", value=2)
+            assert topic_logger.subscribed
+        assert "'value': 2" in logs.output[0]
+
+        logging.getLogger("pyinsteon.topics").setLevel(logging.ERROR)
+        with self.assertLogs("pyinsteon.7f6e5d", level="DEBUG") as logs:
+            publish_topic("7f6e5d.test_topic_logger", value=3)
+        assert len(logs.output) == 1
+
+        logging.getLogger("pyinsteon.7f6e5d").setLevel(logging.NOTSET)
+        publish_topic("test_topic_logger", value=4)
+        assert not topic_logger.subscribed
@@ -265,15 +265,21 @@ class MockHttpResponse:
         """Return the HTML text."""
         return cls.buffer
 
+    async def read(self):
+        """Return the response body."""
+        return b""
+
 
 class MockHttpClientSession:
     """Mock the ClientSession class."""
 
-    def __init__(self, *arg, **kwargs):
+    def __init__(self, *arg, connector=None, **kwargs):
         """Init the MockHttpClientSession class."""
         self.exception_to_throw = None
         self.buffer = None
         self.response = MockHttpResponse()
+        self.closed = False
+        self._connector = connector
 
     @asynccontextmanager
     async def get(self, url):
@@ -291,18 +297,28 @@ class MockHttpClientSession:
 
     async def close(self):
         """Close the mock connection."""
+        self.closed = True
+        if self._connector is not None:
+            await self._connector.close()
 
+    async def __aenter__(self):
+        """Enter the session context."""
+        return self
 
-@asynccontextmanager
-async def create_mock_http_client(
+    async def __aexit__(self, *args):
+        """Exit the session context."""
+        await self.close()
+
+
+def create_mock_http_client(
     *args, status=200, exception_error=None, buffer=None, **kwargs
 ):
     """Create a mock HTTP client."""
-    mock_client = MockHttpClientSession()
+    mock_client = MockHttpClientSession(*args, **kwargs)
     mock_client.response.status = status
     mock_client.exception_to_throw = exception_error
     mock_client.response.buffer = buffer
-    yield mock_client
+    return mock_client
 
 
 class MockSerial: